@@ -0,0 +1,431 @@
+"""
+Offline benchmark harness for the bot's hot paths.
+
+Drives the real command and component callbacks from main.py with fake
+discord.Interaction objects against an InMemoryDB filled by population.py -
+no Discord gateway, no Firebase project, no network. Per scenario it reports
+p50/p95 latency, Firestore reads/writes/round trips (counted by the
+MeteredFirestore proxy) and memory allocated per run (tracemalloc, measured
+in a separate pass so tracing doesn't skew the timings).
+
+    cd src && python bench.py                      # all scenarios, 30 runs each
+    python bench.py --only law_search --runs 200
+    python bench.py --json results.json            # save for later comparison
+    python bench.py --baseline results.json        # exit 1 if p95 regressed
+
+Deliberate waits inside callbacks (asyncio.sleep stability delays) are skipped
+by default so the numbers reflect the bot's own work; pass --real-sleep to
+keep them.
+"""
+import os
+
+# Never reach a real backend: force the in-memory store and no metrics listener
+os.environ["FIREBASE_CONFIG_PATH"] = "/nonexistent/serviceAccount.json"
+os.environ.pop("FIREBASE_KEY_JSON", None)
+os.environ.setdefault("METRICS_PORT", "0")
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import discord
+
+import main
+import population
+from memorydb import InMemoryDB
+
+BENCH_GUILD_ID = 1400000000000000000
+BENCH_USER_ID = population.USER_ID_BASE
+
+
+# ---------- FAKE DISCORD OBJECTS ----------
+class FakeRole:
+    def __init__(self, role_id: int, name: str = "role"):
+        self.id = role_id
+        self.name = name
+        self.mention = f"<@&{role_id}>"
+        self.members = []
+
+
+class FakeUser:
+    def __init__(self, user_id: int, name: str, roles=()):
+        self.id = user_id
+        self.name = name
+        self.display_name = name
+        self.global_name = name
+        self.mention = f"<@{user_id}>"
+        self.bot = False
+        self.roles = list(roles)
+        self.display_avatar = type("Asset", (), {"url": ""})()
+        self.avatar = None
+        self.guild_permissions = discord.Permissions.all()
+
+    def get_role(self, role_id):
+        return next((r for r in self.roles if r.id == role_id), None)
+
+    async def send(self, *args, **kwargs):
+        return FakeMessage()
+
+    async def add_roles(self, *roles, **kwargs):
+        self.roles.extend(roles)
+
+    async def remove_roles(self, *roles, **kwargs):
+        self.roles = [r for r in self.roles if r not in roles]
+
+    def __str__(self):
+        return self.name
+
+
+class FakeMessage:
+    _next_id = 1500000000000000000
+
+    def __init__(self, content=None, embed=None, view=None):
+        FakeMessage._next_id += 1
+        self.id = FakeMessage._next_id
+        self.content = content
+        self.embeds = [embed] if embed else []
+        self.view = view
+        self.jump_url = f"https://discord.com/channels/{BENCH_GUILD_ID}/0/{self.id}"
+
+    async def edit(self, content=None, embed=None, view=None, **kwargs):
+        self.content = content if content is not None else self.content
+        if embed is not None:
+            self.embeds = [embed]
+        self.view = view
+        return self
+
+    async def delete(self, **kwargs):
+        pass
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int, name: str = "bench"):
+        self.id = channel_id
+        self.name = name
+        self.mention = f"<#{channel_id}>"
+        self.sent = []
+
+    async def send(self, content=None, embed=None, view=None, **kwargs):
+        message = FakeMessage(content, embed, view)
+        self.sent.append(message)
+        return message
+
+    async def fetch_message(self, message_id):
+        return FakeMessage()
+
+    def permissions_for(self, member):
+        return discord.Permissions.all()
+
+
+class FakeGuild:
+    def __init__(self, members=()):
+        self.id = BENCH_GUILD_ID
+        self.name = "Bench Guild"
+        self.members = list(members)
+        self.roles = []
+        self.text_channels = [FakeChannel(1, "general")]
+        self.me = FakeUser(2, "RoyalBot")
+
+    def get_member(self, user_id):
+        return next((m for m in self.members if m.id == user_id), None)
+
+    def get_role(self, role_id):
+        return next((r for r in self.roles if r.id == role_id), None)
+
+    def get_channel(self, channel_id):
+        return next((c for c in self.text_channels if c.id == channel_id), None)
+
+    def get_thread(self, thread_id):
+        return None
+
+
+class FakeResponse:
+    """interaction.response: records the acknowledgement like discord.InteractionResponse"""
+
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self.done = False
+
+    def is_done(self):
+        return self.done
+
+    async def _ack(self, content=None, embed=None, view=None):
+        if self.done:
+            raise discord.InteractionResponded(self.interaction)
+        self.done = True
+        self.interaction.ack_at = time.perf_counter()
+        self.interaction.sent.append((content, embed, view))
+
+    async def defer(self, *args, **kwargs):
+        await self._ack()
+
+    async def send_message(self, content=None, *, embed=None, view=None, **kwargs):
+        await self._ack(content, embed, view)
+
+    async def edit_message(self, content=None, *, embed=None, view=None, **kwargs):
+        await self._ack(content, embed, view)
+
+    async def send_modal(self, modal):
+        await self._ack(view=modal)
+
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, content=None, *, embed=None, view=None, **kwargs):
+        self.interaction.sent.append((content, embed, view))
+        return FakeMessage(content, embed, view)
+
+
+class FakeInteraction:
+    """Just enough of discord.Interaction for the bot's callbacks"""
+
+    def __init__(self, user, guild, data=None, message=None, interaction_type=discord.InteractionType.application_command):
+        self.id = discord.utils.time_snowflake(datetime.now(timezone.utc))
+        self.type = interaction_type
+        self.user = user
+        self.guild = guild
+        self.guild_id = guild.id if guild else None
+        self.channel = guild.text_channels[0] if guild else FakeChannel(1)
+        self.channel_id = self.channel.id
+        self.message = message
+        self.data = data or {}
+        self.client = main.bot
+        self.command = None
+        self.created_at = datetime.now(timezone.utc)
+        self.locale = discord.Locale.american_english
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.sent = []
+        self.ack_at = None
+
+    async def edit_original_response(self, content=None, *, embed=None, view=None, **kwargs):
+        self.sent.append((content, embed, view))
+        return FakeMessage(content, embed, view)
+
+    async def original_response(self):
+        return FakeMessage()
+
+    async def delete_original_response(self):
+        pass
+
+
+# ---------- SCENARIOS ----------
+def command_callback(command):
+    """The coroutine behind an app_commands.Command (or a plain function)"""
+    return getattr(command, 'callback', command)
+
+def scenario_citizen_lookup(ctx):
+    async def run(interaction):
+        await command_callback(main.citizen_lookup_cmd)(interaction, search=ctx.rng.choice(ctx.igns))
+    return run
+
+def scenario_refresh_warrants(ctx):
+    async def run(interaction):
+        interaction.message = FakeMessage()
+        await main.RefreshWarrantsButton().callback(interaction)
+    return run
+
+def scenario_economy_dashboard(ctx):
+    async def run(interaction):
+        await command_callback(main.economy_dashboard_cmd)(interaction)
+    return run
+
+def scenario_bet_place(ctx):
+    async def run(interaction):
+        interaction.type = discord.InteractionType.component
+        interaction.data = {'custom_id': f"bet_place_{ctx.rng.choice(ctx.open_event_ids)}", 'component_type': 2}
+        await main.on_interaction(interaction)
+    return run
+
+def scenario_law_search(ctx):
+    async def run(interaction):
+        await command_callback(main.law_search)(interaction, keyword=ctx.rng.choice(['harbor', 'tax', 'nothing-matches']))
+    return run
+
+def scenario_my_votes(ctx):
+    async def run(interaction):
+        await command_callback(main.my_votes_cmd)(interaction)
+    return run
+
+def scenario_case_search(ctx):
+    async def run(interaction):
+        await command_callback(main.case_search_cmd)(interaction, ign=ctx.rng.choice(ctx.igns))
+    return run
+
+def scenario_citizen_stats(ctx):
+    async def run(interaction):
+        await command_callback(main.citizen_stats_cmd)(interaction)
+    return run
+
+SCENARIOS = {
+    'citizen_lookup': scenario_citizen_lookup,
+    'refresh_warrants': scenario_refresh_warrants,
+    'economy_dashboard': scenario_economy_dashboard,
+    'bet_place': scenario_bet_place,
+    'law_search': scenario_law_search,
+    'my_votes': scenario_my_votes,
+    'case_search': scenario_case_search,
+    'citizen_stats': scenario_citizen_stats,
+}
+
+
+# ---------- RUNNER ----------
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+def bench_user(pop) -> FakeUser:
+    """The acting member: the first synthetic citizen (a council voter), holding the admin role"""
+    return FakeUser(pop.user_ids[0], pop.igns[0], roles=[FakeRole(main.ADMIN_ROLE_ID, "Admin")])
+
+def skip_sleeps():
+    """Turn the callbacks' deliberate asyncio.sleep delays into bare yields; returns the real sleep"""
+    real_sleep = asyncio.sleep
+    asyncio.sleep = lambda delay, result=None: real_sleep(0, result)
+    return real_sleep
+
+def install_store(store):
+    """Point the bot at store (metered like production) and drop seeding noise and cached bills"""
+    main.db = main.MeteredFirestore(store)
+    main.firestore_profiler.sites.clear()
+    main.bill_cache.clear()
+    main.legislative_stats_reconciled = False
+
+async def run_once(run, user, guild):
+    """One scenario run inside a metrics scope: (seconds, ack seconds, scope)"""
+    interaction = FakeInteraction(user, guild)
+    scope = main.InteractionScope('bench', 'bench', datetime.now(timezone.utc))
+    token = main._current_interaction.set(scope)
+    started = time.perf_counter()
+    try:
+        await run(interaction)
+    finally:
+        main._current_interaction.reset(token)
+    elapsed = time.perf_counter() - started
+    ack = (interaction.ack_at - started) if interaction.ack_at else None
+    return elapsed, ack, scope
+
+async def bench_scenario(name, run, user, guild, runs: int, trace_allocations: bool = True) -> dict:
+    await run_once(run, user, guild)  # Warm-up (imports, caches)
+
+    timings, acks, reads, writes, round_trips = [], [], [], [], []
+    for _ in range(runs):
+        elapsed, ack, scope = await run_once(run, user, guild)
+        timings.append(elapsed)
+        if ack is not None:
+            acks.append(ack)
+        reads.append(scope.reads)
+        writes.append(scope.writes)
+        round_trips.append(scope.round_trips)
+
+    # Allocation pass (traced separately - tracemalloc slows everything down)
+    alloc_runs = max(1, min(runs, 5)) if trace_allocations else 0
+    allocated = []
+    tracemalloc.start()
+    for _ in range(alloc_runs):
+        before = tracemalloc.take_snapshot()
+        await run_once(run, user, guild)
+        after = tracemalloc.take_snapshot()
+        allocated.append(sum(stat.size_diff for stat in after.compare_to(before, 'filename') if stat.size_diff > 0))
+    tracemalloc.stop()
+
+    return {
+        'scenario': name,
+        'runs': runs,
+        'p50_ms': percentile(timings, 0.50) * 1000,
+        'p95_ms': percentile(timings, 0.95) * 1000,
+        'ack_p95_ms': percentile(acks, 0.95) * 1000 if acks else None,
+        'reads': statistics.mean(reads),
+        'writes': statistics.mean(writes),
+        'round_trips': statistics.mean(round_trips),
+        'alloc_kb': statistics.mean(allocated) / 1024 if allocated else None,
+    }
+
+def print_report(results, baseline=None):
+    header = f"{'scenario':<20} {'runs':>5} {'p50 ms':>9} {'p95 ms':>9} {'ack p95':>9} {'reads':>8} {'writes':>7} {'rtrips':>7} {'alloc KB':>9}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        ack = f"{r['ack_p95_ms']:.2f}" if r['ack_p95_ms'] is not None else '-'
+        line = (f"{r['scenario']:<20} {r['runs']:>5} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {ack:>9} "
+                f"{r['reads']:>8.1f} {r['writes']:>7.1f} {r['round_trips']:>7.1f} {r['alloc_kb'] or 0:>9.1f}")
+        previous = (baseline or {}).get(r['scenario'])
+        if previous:
+            line += f"   p95 x{r['p95_ms'] / max(previous['p95_ms'], 1e-6):.2f}, reads x{r['reads'] / max(previous['reads'], 1e-6):.2f}"
+        print(line)
+
+def regressions(results, baseline, max_ratio: float) -> list:
+    """Scenarios whose p95 latency or reads grew beyond max_ratio of the baseline"""
+    failed = []
+    for r in results:
+        previous = baseline.get(r['scenario'])
+        if not previous:
+            continue
+        if r['p95_ms'] > previous['p95_ms'] * max_ratio or r['reads'] > previous['reads'] * max_ratio:
+            failed.append(r['scenario'])
+    return failed
+
+async def run_benchmarks(args) -> list:
+    store = InMemoryDB()
+    pop = population.populate(store, citizens=args.citizens, seed=args.seed)
+    install_store(store)
+
+    user = bench_user(pop)
+    guild = FakeGuild(members=[user])
+
+    if not args.real_sleep:
+        skip_sleeps()
+
+    names = args.only or list(SCENARIOS)
+    results = []
+    for name in names:
+        results.append(await bench_scenario(name, SCENARIOS[name](pop), user, guild, args.runs))
+    return results
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the bot's hot paths (InMemoryDB, fake interactions)")
+    parser.add_argument('--runs', type=int, default=30, help="Timed runs per scenario (default: 30)")
+    parser.add_argument('--citizens', type=int, default=2000, help="Seeded population size (default: 2000)")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed for data and inputs")
+    parser.add_argument('--only', nargs='+', choices=list(SCENARIOS), help="Run only these scenarios")
+    parser.add_argument('--real-sleep', action='store_true', help="Keep the callbacks' asyncio.sleep delays")
+    parser.add_argument('--json', metavar='PATH', help="Write results as JSON")
+    parser.add_argument('--baseline', metavar='PATH', help="Compare with a previous --json run")
+    parser.add_argument('--max-regression', type=float, default=1.25, help="Allowed p95/reads growth vs baseline (default: 1.25)")
+    parser.add_argument('--verbose', action='store_true', help="Show the bot's own log output")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        main._console_log_handler.setLevel(logging.CRITICAL + 1)
+
+    results = asyncio.run(run_benchmarks(args))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = {r['scenario']: r for r in json.load(f)['results']}
+
+    sys.__stdout__.write(f"\nBenchmarks: {args.citizens} citizens, {args.runs} runs, seed {args.seed}{', real sleeps' if args.real_sleep else ''}\n")
+    sys.stdout = sys.__stdout__  # Report goes to the terminal, not the bot's log pipeline
+    print_report(results, baseline)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'citizens': args.citizens, 'runs': args.runs, 'seed': args.seed, 'results': results}, f, indent=2)
+
+    if baseline:
+        failed = regressions(results, baseline, args.max_regression)
+        if failed:
+            print(f"\nREGRESSION (> x{args.max_regression}): {', '.join(failed)}")
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main_cli()
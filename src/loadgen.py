@@ -0,0 +1,240 @@
+"""
+Capacity testing: synthetic populations and mixed command workloads.
+
+    cd src
+    python loadgen.py populate --citizens 5000            # generate in memory, print volumes
+    python loadgen.py populate --citizens 5000 --emulator # write into the Firestore emulator
+    python loadgen.py replay --citizens 5000 --rate 20 --duration 60 \\
+        --mix citizen_lookup=4 law_search=3 bet_place=2 citizen_stats=1
+    python loadgen.py sweep --sizes 500 2000 8000 20000 --budget-ms 500
+
+populate fills a store with population.py. replay fires the bench.py
+scenarios as an open-loop Poisson stream at --rate commands/second, so slow
+handlers queue up exactly as they would behind a live gateway, and reports
+latency from arrival (not from start), reads per command and event-loop lag.
+sweep benchmarks every scenario at growing population sizes and names the
+size at which each one's p95 crosses --budget-ms - where a full-collection
+scan becomes user-visible.
+
+--emulator writes to the Firestore emulator (FIRESTORE_EMULATOR_HOST must be
+set); it refuses to run otherwise so a load test can never hit production.
+"""
+import bench  # Configures the offline environment before main is imported
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+import main
+import population
+from memorydb import InMemoryDB
+
+EMULATOR_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT", "royal-bot-loadtest")  # Project id used against the emulator
+LOOP_LAG_TICK = 0.05  # Seconds between event-loop lag probes during replay
+
+
+def report(*args, **kwargs):
+    """Print to the terminal - bare print() is captured into the bot's log pipeline"""
+    print(*args, file=sys.__stdout__, **kwargs)
+
+
+def open_store(emulator: bool):
+    """InMemoryDB, or a Firestore client bound to the local emulator"""
+    if not emulator:
+        return InMemoryDB()
+    if not os.getenv("FIRESTORE_EMULATOR_HOST"):
+        sys.exit("[ERR] --emulator needs FIRESTORE_EMULATOR_HOST (e.g. localhost:8080); refusing to touch a real project")
+    from google.cloud import firestore as gcloud_firestore
+    return gcloud_firestore.Client(project=EMULATOR_PROJECT)
+
+def build_population(args):
+    store = open_store(getattr(args, 'emulator', False))
+    started = time.perf_counter()
+    pop = population.populate(store, citizens=args.citizens, seed=args.seed, years=args.years)
+    report(f"[OK] Population of {args.citizens} citizens: {sum(pop.counts.values()):,} documents in {time.perf_counter() - started:.1f}s")
+    return store, pop
+
+def parse_mix(entries) -> dict:
+    """['law_search=3', 'bet_place'] -> {'law_search': 3.0, 'bet_place': 1.0}"""
+    mix = {}
+    for entry in entries:
+        name, _, weight = entry.partition('=')
+        if name not in bench.SCENARIOS:
+            sys.exit(f"[ERR] Unknown scenario '{name}' (choose from: {', '.join(bench.SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+# ---------- REPLAY ----------
+class ReplayStats:
+    def __init__(self):
+        self.latencies = []
+        self.reads = []
+        self.errors = 0
+
+    def summary(self) -> dict:
+        if not self.latencies:
+            return {'count': 0, 'errors': self.errors}
+        return {
+            'count': len(self.latencies),
+            'errors': self.errors,
+            'p50_ms': bench.percentile(self.latencies, 0.50) * 1000,
+            'p95_ms': bench.percentile(self.latencies, 0.95) * 1000,
+            'p99_ms': bench.percentile(self.latencies, 0.99) * 1000,
+            'reads': sum(self.reads) / len(self.reads),
+        }
+
+async def replay(pop, mix: dict, rate: float, duration: float, seed: int, real_sleep) -> tuple:
+    """Open-loop replay of the mix; returns ({scenario: summary}, loop lag samples)"""
+    rng = random.Random(seed)
+    runs = {name: bench.SCENARIOS[name](pop) for name in mix}
+    names, weights = list(mix), list(mix.values())
+    stats = {name: ReplayStats() for name in mix}
+    user = bench.bench_user(pop)
+    guild = bench.FakeGuild(members=[user])
+    loop = asyncio.get_running_loop()
+    lag = []
+    done = False
+
+    async def probe():
+        while not done:
+            expected = loop.time() + LOOP_LAG_TICK
+            await real_sleep(LOOP_LAG_TICK)
+            lag.append(max(0.0, loop.time() - expected))
+
+    async def fire(name, arrived):
+        interaction = bench.FakeInteraction(user, guild)
+        scope = main.InteractionScope('replay', name, datetime.now(timezone.utc))
+        main._current_interaction.set(scope)
+        try:
+            await runs[name](interaction)
+        except Exception:
+            stats[name].errors += 1
+            return
+        stats[name].latencies.append(loop.time() - arrived)
+        stats[name].reads.append(scope.reads)
+
+    prober = asyncio.create_task(probe())
+    pending = []
+    start = loop.time()
+    next_at = start
+    while True:
+        next_at += rng.expovariate(rate)
+        if next_at - start > duration:
+            break
+        await real_sleep(max(0.0, next_at - loop.time()))
+        pending.append(asyncio.create_task(fire(rng.choices(names, weights)[0], next_at)))
+    await asyncio.gather(*pending)
+    done = True
+    await prober
+
+    return {name: s.summary() for name, s in stats.items()}, lag
+
+def cmd_replay(args):
+    mix = parse_mix(args.mix or list(bench.SCENARIOS))
+    store, pop = build_population(args)
+    bench.install_store(store)
+    real_sleep = asyncio.sleep if args.real_sleep else bench.skip_sleeps()
+
+    started = time.perf_counter()
+    results, lag = asyncio.run(replay(pop, mix, args.rate, args.duration, args.seed, real_sleep))
+    elapsed = time.perf_counter() - started
+
+    total = sum(r['count'] for r in results.values())
+    report(f"\nReplay: {total} commands in {elapsed:.1f}s ({total / elapsed:.1f}/s achieved, {args.rate}/s offered)")
+    header = f"{'scenario':<20} {'count':>6} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'reads':>9}"
+    report(header)
+    report('-' * len(header))
+    for name, r in results.items():
+        if not r['count']:
+            report(f"{name:<20} {0:>6} {r['errors']:>6}")
+            continue
+        report(f"{name:<20} {r['count']:>6} {r['errors']:>6} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['reads']:>9.0f}")
+    if lag:
+        report(f"\nEvent loop lag: p95 {bench.percentile(lag, 0.95) * 1000:.1f}ms, max {max(lag) * 1000:.1f}ms")
+
+
+# ---------- SWEEP ----------
+async def sweep(sizes, names, runs: int, seed: int) -> dict:
+    """{scenario: [(size, result), ...]} benchmarking each scenario at every population size"""
+    table = {name: [] for name in names}
+    for size in sizes:
+        store = InMemoryDB()
+        pop = population.populate(store, citizens=size, seed=seed)
+        bench.install_store(store)
+        user = bench.bench_user(pop)
+        guild = bench.FakeGuild(members=[user])
+        for name in names:
+            result = await bench.bench_scenario(name, bench.SCENARIOS[name](pop), user, guild, runs, trace_allocations=False)
+            table[name].append((size, result))
+        report(f"[OK] Swept {size} citizens ({sum(pop.counts.values()):,} documents)")
+    return table
+
+def cmd_sweep(args):
+    names = args.only or list(bench.SCENARIOS)
+    sizes = sorted(args.sizes)
+    if not args.real_sleep:
+        bench.skip_sleeps()
+    table = asyncio.run(sweep(sizes, names, args.runs, args.seed))
+
+    report(f"\np95 ms (reads per run) by population; budget {args.budget_ms:.0f}ms")
+    header = f"{'scenario':<20}" + ''.join(f"{size:>18,}" for size in sizes) + f"{'visible at':>14}"
+    report(header)
+    report('-' * len(header))
+    for name, row in table.items():
+        cells = ''.join(f"{r['p95_ms']:>9.1f} ({r['reads']:>6.0f})" for _, r in row)
+        visible = next((size for size, r in row if r['p95_ms'] > args.budget_ms), None)
+        report(f"{name:<20}{cells}{(f'{visible:,}' if visible else '-'):>14}")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Synthetic populations and workload replay for capacity testing")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def population_args(p):
+        p.add_argument('--citizens', type=int, default=2000, help="Population size (default: 2000)")
+        p.add_argument('--years', type=float, default=2.0, help="Years of history to spread activity over")
+        p.add_argument('--seed', type=int, default=1, help="Random seed (same seed + size = same documents)")
+        p.add_argument('--verbose', action='store_true', help="Show the bot's own log output")
+
+    p = sub.add_parser('populate', help="Generate a population and print its volumes")
+    population_args(p)
+    p.add_argument('--emulator', action='store_true', help="Write into the Firestore emulator")
+
+    p = sub.add_parser('replay', help="Fire a weighted command mix at a fixed arrival rate")
+    population_args(p)
+    p.add_argument('--emulator', action='store_true', help="Run against the Firestore emulator")
+    p.add_argument('--mix', nargs='+', metavar='SCENARIO[=WEIGHT]', help="Command mix (default: every scenario, equal weight)")
+    p.add_argument('--rate', type=float, default=10.0, help="Commands per second (default: 10)")
+    p.add_argument('--duration', type=float, default=30.0, help="Seconds of arrivals (default: 30)")
+    p.add_argument('--real-sleep', action='store_true', help="Keep the callbacks' asyncio.sleep delays")
+
+    p = sub.add_parser('sweep', help="Find the population at which each scenario exceeds the latency budget")
+    p.add_argument('--sizes', type=int, nargs='+', default=[500, 2000, 8000], help="Population sizes to test")
+    p.add_argument('--only', nargs='+', choices=list(bench.SCENARIOS), help="Sweep only these scenarios")
+    p.add_argument('--runs', type=int, default=10, help="Timed runs per scenario and size (default: 10)")
+    p.add_argument('--seed', type=int, default=1, help="Random seed")
+    p.add_argument('--budget-ms', type=float, default=500.0, help="p95 latency users notice (default: 500)")
+    p.add_argument('--real-sleep', action='store_true', help="Keep the callbacks' asyncio.sleep delays")
+    p.add_argument('--verbose', action='store_true', help="Show the bot's own log output")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        main._console_log_handler.setLevel(logging.CRITICAL + 1)
+
+    if args.command == 'populate':
+        _, pop = build_population(args)
+        for collection, count in sorted(pop.counts.items()):
+            report(f"  {collection:<36} {count:>9,}")
+    elif args.command == 'replay':
+        cmd_replay(args)
+    else:
+        cmd_sweep(args)
+
+if __name__ == '__main__':
+    main_cli()
@@ -4,34 +4,82 @@
 # Replit-ready single file
 # Deps: discord.py, firebase-admin, requests
 
+# ---------- STARTUP TIMING ----------
+# Set up before the heavy imports so their cost shows up in startup_report()
+import time
+STARTUP_T0 = time.perf_counter()
+STARTUP_TIMINGS = []  # [(phase, seconds)] in load order
+_startup_last_mark = STARTUP_T0
+
+def startup_mark(phase: str):
+    """Record the time spent since the previous mark under `phase`"""
+    global _startup_last_mark
+    now = time.perf_counter()
+    STARTUP_TIMINGS.append((phase, now - _startup_last_mark))
+    _startup_last_mark = now
+
 # ---------- IMPORTS ----------
 import os
 import json
-import time
+import copy
+import hashlib
+import heapq
+import re
+import random
+import functools
+import contextvars
+import io
+import queue
+import atexit
+import threading
 import math
-import requests
-import discord
-from discord import app_commands
-from discord.ext import commands, tasks
-from datetime import datetime, timedelta, timezone
-import firebase_admin
-from firebase_admin import credentials, firestore
-from google.cloud.firestore_v1.base_query import FieldFilter
+import bisect
+import difflib
+import unicodedata
 import logging
 import sys
 import asyncio
 import traceback
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from concurrent.futures import ThreadPoolExecutor
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend for server
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+from datetime import datetime, timedelta, timezone
 from io import BytesIO
 import tempfile
+import socket
+startup_mark("import: stdlib")
+import requests
 import aiohttp
-from memorydb import InMemoryDB, InMemoryCollection, InMemoryDoc, InMemoryQuery
 from dotenv import load_dotenv
+startup_mark("import: requests + aiohttp + dotenv")
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+startup_mark("import: discord.py")
+import firebase_admin
+from firebase_admin import credentials, firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
+from google.api_core import exceptions as google_exceptions
+from google.auth import exceptions as google_auth_exceptions
+startup_mark("import: firebase_admin + firestore")
+from memorydb import InMemoryDB, InMemoryCollection, InMemoryDoc, InMemoryQuery
+import memorydb
+
+# matplotlib is imported on first chart render (see load_matplotlib)
+plt = None
+mdates = None
+
+def load_matplotlib():
+    """Import matplotlib with the non-interactive backend the first time a chart is drawn"""
+    global plt, mdates
+    if plt is None:
+        started = time.perf_counter()
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend for server
+        import matplotlib.pyplot as pyplot
+        import matplotlib.dates as matplotlib_dates
+        plt, mdates = pyplot, matplotlib_dates
+        STARTUP_TIMINGS.append(("lazy: matplotlib (first chart)", time.perf_counter() - started))
+    return plt, mdates
 
 # ---------- TIMEZONE SETUP (NO FILE I/O) ----------
 # Use fixed offset instead of zoneinfo to avoid [Errno 5] I/O errors on restricted filesystems
@@ -39,21 +87,156 @@ from dotenv import load_dotenv
 EST = timezone(timedelta(hours=-5))
 
 # ---------- LOGGING SETUP ----------
-# Configure persistent file logging to catch crashes
-os.makedirs('/tmp/bot_logs', exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        RotatingFileHandler(
-            '/tmp/bot_logs/bot_crash.log',
-            maxBytes=5*1024*1024,  # 5MB
-            backupCount=3
-        ),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Logging calls only enqueue: the console and file handlers run on a QueueListener
+# thread, so error bursts never block the event loop on disk I/O. print() output
+# is captured into the 'stdout' logger and takes the same path. Records carry the
+# interaction / background job they were logged from and are written to the log
+# files as JSON lines. Identical warnings/errors repeated within
+# LOG_DUPLICATE_WINDOW seconds are dropped; the next one logged after the window
+# reports how many were suppressed.
+LOG_DIR = '/tmp/bot_logs'
+LOG_DUPLICATE_WINDOW = float(os.getenv("LOG_DUPLICATE_WINDOW", "60"))  # Seconds
+LOG_CAPTURE_PRINTS = os.getenv("LOG_CAPTURE_PRINTS", "1") != "0"
+os.makedirs(LOG_DIR, exist_ok=True)
+
+# What is running in the current context (set by the task scheduler / interaction metrics)
+_current_job = contextvars.ContextVar('current_job', default=None)
+_current_interaction = contextvars.ContextVar('current_interaction', default=None)
+
+class LogContextFilter(logging.Filter):
+    """Tag records with the interaction or background job they were logged from"""
+    
+    def filter(self, record):
+        scope = _current_interaction.get()
+        if scope:
+            record.interaction = scope.interaction_id
+            record.command = f"{scope.kind}:{scope.name}"
+            record.user = scope.user_id
+            record.guild = scope.guild_id
+        job = _current_job.get()
+        if job:
+            record.job = job.name
+        return True
+
+class DuplicateSuppressFilter(logging.Filter):
+    """Drop warnings/errors identical to one logged less than `window` seconds ago"""
+    
+    def __init__(self, window: float):
+        super().__init__()
+        self.window = window
+        self.seen = {}  # key -> [first logged (monotonic), suppressed since]
+        self.lock = threading.Lock()
+    
+    def filter(self, record):
+        if record.levelno < logging.WARNING or self.window <= 0:
+            return True
+        exc_type = record.exc_info[0].__name__ if record.exc_info and record.exc_info[0] else None
+        key = (record.name, record.levelno, record.getMessage(), exc_type)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.seen.get(key)
+            if entry and now - entry[0] < self.window:
+                entry[1] += 1
+                return False
+            if entry and entry[1]:
+                record.suppressed = entry[1]
+            self.seen[key] = [now, 0]
+            if len(self.seen) > 1000:
+                self.seen = {k: v for k, v in self.seen.items() if now - v[0] < self.window}
+        return True
+
+class LogQueueHandler(QueueHandler):
+    """QueueHandler that keeps the traceback as a separate field instead of folding it into the message"""
+    
+    def prepare(self, record):
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+LOG_CONTEXT_FIELDS = ('interaction', 'command', 'user', 'guild', 'job', 'suppressed', 'context')
+
+class JsonLogFormatter(logging.Formatter):
+    """One JSON object per line"""
+    
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for field in LOG_CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+class ConsoleLogFormatter(logging.Formatter):
+    """Captured print() lines as-is, everything else in the classic format"""
+    
+    def format(self, record):
+        if record.name == 'stdout':
+            return record.getMessage()
+        text = super().format(record)
+        if getattr(record, 'suppressed', None):
+            text += f" (+{record.suppressed} identical suppressed)"
+        return text
+
+class PrintCapture(io.TextIOBase):
+    """sys.stdout replacement: every printed line becomes a record on the 'stdout' logger"""
+    
+    def __init__(self):
+        self.local = threading.local()  # Partial line per thread (print writes text and '\n' separately)
+    
+    def writable(self):
+        return True
+    
+    def write(self, text):
+        *lines, self.local.buffer = (getattr(self.local, 'buffer', '') + text).split('\n')
+        for line in lines:
+            if line.strip():
+                print_logger.log(self.level_for(line), line)
+        return len(text)
+    
+    @staticmethod
+    def level_for(line: str) -> int:
+        if '[ERR]' in line or '❌' in line:
+            return logging.ERROR
+        if '[WARN]' in line or '⚠️' in line:
+            return logging.WARNING
+        return logging.INFO
+
+def _log_file_handler(filename: str) -> RotatingFileHandler:
+    handler = RotatingFileHandler(os.path.join(LOG_DIR, filename), maxBytes=5*1024*1024, backupCount=3)  # 5MB
+    handler.setFormatter(JsonLogFormatter())
+    return handler
+
+_console_log_handler = logging.StreamHandler(sys.__stdout__)
+_console_log_handler.setFormatter(ConsoleLogFormatter('%(asctime)s [%(levelname)s] %(message)s'))
+_crash_log_handler = _log_file_handler('bot_crash.log')
+_panel_log_handler = _log_file_handler('panel_errors.log')
+_panel_log_handler.addFilter(lambda record: record.name == 'panels')
+
+_log_queue = queue.SimpleQueue()
+_log_queue_handler = LogQueueHandler(_log_queue)
+_log_queue_handler.addFilter(LogContextFilter())
+_log_queue_handler.addFilter(DuplicateSuppressFilter(LOG_DUPLICATE_WINDOW))
+log_listener = QueueListener(_log_queue, _console_log_handler, _crash_log_handler, _panel_log_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on exit
+
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler], force=True)
 logger = logging.getLogger(__name__)
+panel_logger = logging.getLogger('panels')
+print_logger = logging.getLogger('stdout')
+if LOG_CAPTURE_PRINTS:
+    sys.stdout = PrintCapture()
 
 # ---------- GLOBAL EXCEPTION HANDLERS ----------
 def global_exception_handler(exc_type, exc_value, exc_traceback):
@@ -61,28 +244,13 @@ def global_exception_handler(exc_type, exc_value, exc_traceback):
     if issubclass(exc_type, KeyboardInterrupt):
         sys.__excepthook__(exc_type, exc_value, exc_traceback)
         return
-    
     logger.critical("UNCAUGHT EXCEPTION - Bot is crashing!", exc_info=(exc_type, exc_value, exc_traceback))
-    with open('/tmp/bot_logs/bot_crash.log', 'a') as f:
-        f.write(f"\n{'='*60}\n")
-        f.write(f"FATAL CRASH at {datetime.now()}\n")
-        f.write(f"{'='*60}\n")
-        traceback.print_exception(exc_type, exc_value, exc_traceback, file=f)
-        f.write(f"\n{'='*60}\n\n")
 
 def asyncio_exception_handler(loop, context):
     """Catch uncaught asyncio exceptions"""
     exception = context.get('exception')
     if exception:
         logger.critical(f"ASYNCIO EXCEPTION: {context['message']}", exc_info=exception)
-        with open('/tmp/bot_logs/bot_crash.log', 'a') as f:
-            f.write(f"\n{'='*60}\n")
-            f.write(f"ASYNCIO CRASH at {datetime.now()}\n")
-            f.write(f"{'='*60}\n")
-            f.write(f"Message: {context['message']}\n")
-            if exception:
-                traceback.print_exception(type(exception), exception, exception.__traceback__, file=f)
-            f.write(f"\n{'='*60}\n\n")
     else:
         logger.error(f"ASYNCIO ERROR: {context}")
 
@@ -90,21 +258,12 @@ def asyncio_exception_handler(loop, context):
 sys.excepthook = global_exception_handler
 
 def log_panel_error(panel_name: str, error: Exception, extra_context: dict = None):
-    """Log panel/dashboard errors with full stack trace for debugging"""
-    try:
-        with open('/tmp/bot_logs/panel_errors.log', 'a') as f:
-            f.write(f"\n{'='*80}\n")
-            f.write(f"{panel_name.upper()} ERROR at {datetime.now()}\n")
-            f.write(f"Error Type: {type(error).__name__}\n")
-            f.write(f"Error Message: {str(error)}\n")
-            if extra_context:
-                f.write(f"Context: {json.dumps(extra_context, indent=2)}\n")
-            f.write(f"{'='*80}\n")
-            traceback.print_exception(type(error), error, error.__traceback__, file=f)
-            f.write(f"\n{'='*80}\n\n")
-        logger.error(f"[{panel_name}] {type(error).__name__}: {error}")
-    except:
-        pass  # Don't let logging failures crash the bot
+    """Log panel/dashboard errors with full stack trace (also written to panel_errors.log)"""
+    panel_logger.error(
+        f"[{panel_name}] {type(error).__name__}: {error}",
+        exc_info=error,
+        extra={'context': {'panel': panel_name, **(extra_context or {})}}
+    )
 
 def safe_interaction(func):
     """Decorator to catch exceptions in Discord interactions and keep bot alive"""
@@ -112,17 +271,17 @@ def safe_interaction(func):
         try:
             return await func(self, interaction, *args, **kwargs)
         except Exception as e:
-            logger.critical(f"INTERACTION ERROR in {func.__name__}", exc_info=e)
-            with open('/tmp/bot_logs/bot_crash.log', 'a') as f:
-                f.write(f"\n{'='*60}\n")
-                f.write(f"INTERACTION CRASH at {datetime.now()}\n")
-                f.write(f"Function: {func.__name__}\n")
-                f.write(f"Button: {getattr(self, 'custom_id', 'unknown')}\n")
-                f.write(f"User: {interaction.user}\n")
-                f.write(f"Guild: {interaction.guild}\n")
-                f.write(f"{'='*60}\n")
-                traceback.print_exception(type(e), e, e.__traceback__, file=f)
-                f.write(f"\n{'='*60}\n\n")
+            interaction_metrics.record_error()
+            logger.critical(
+                f"INTERACTION ERROR in {func.__name__}",
+                exc_info=e,
+                extra={'context': {
+                    'function': func.__name__,
+                    'button': getattr(self, 'custom_id', 'unknown'),
+                    'user': str(interaction.user),
+                    'guild': str(interaction.guild),
+                }}
+            )
             
             # Try to respond to user
             try:
@@ -165,6 +324,11 @@ BILL_COLLECTION_NAME = os.getenv("BILL_COLLECTION_NAME", "royal_council_bills")
 REQUIRED_CO_SPONSORS_DEFAULT = int(os.getenv("REQUIRED_CO_SPONSORS", "0"))
 MIN_VOTES_TO_FINALIZE = int(os.getenv("MIN_VOTES_TO_FINALIZE", "2"))  # Minimum votes required for manual finalization
 TOTAL_CONSEJEROS = int(os.getenv("TOTAL_CONSEJEROS", "8"))  # Total number of councilors for 2/3 majority calculations
+BILL_NUMBER_BLOCK_SIZE = int(os.getenv("BILL_NUMBER_BLOCK_SIZE", "20"))  # R.C. numbers reserved per counter transaction (1 = strictly gapless)
+BILL_CACHE_TTL = 30  # Seconds a looked-up bill is served from memory (writes from this process drop it at once)
+BILL_CACHE_SIZE = 256  # Most bills kept in the lookup cache
+BILL_ID_ATTEMPTS = 5  # Fresh IDs / numbers tried when a new bill or decree key is already taken
+BILL_EMBED_CACHE_SIZE = 128  # Bills whose rendered console embed is kept
 
 # CivMC Nation Management Features
 POS_CHANNEL_ID = int(os.getenv("POS_CHANNEL_ID", "1407144090587627601"))  # Channel for POS alerts
@@ -203,6 +367,8 @@ BILL_COUNTER_COLLECTION = "florabi_bill_counter"
 BETTING_EVENTS_COLLECTION = "florabi_betting_events"
 BETTING_BETS_COLLECTION = "florabi_betting_bets"
 BETTING_LEADERBOARD_COLLECTION = "florabi_betting_leaderboard"
+BETTING_ODDS_HISTORY_COLLECTION = "florabi_betting_odds_history"  # Append-only odds snapshots per event
+BETTING_DAILY_VOLUME_COLLECTION = "florabi_betting_daily_volume"  # Per-day (EST) betting volume rollups
 STOCK_ORDERS_COLLECTION = "florabi_stock_orders"  # Pending stock purchases
 BANK_ACCOUNTS_COLLECTION = "florabi_bank_accounts"  # Bank accounts for citizens
 BANK_TRANSACTIONS_COLLECTION = "florabi_bank_transactions"  # All bank transactions
@@ -242,7 +408,21 @@ CONTRACTS_COLLECTION = "florabi_contracts"  # Government contracts and public wo
 CONTRACT_BIDS_COLLECTION = "florabi_contract_bids"  # Bids on government contracts
 ECONOMIC_REPORTS_COLLECTION = "florabi_economic_reports"  # Historical economic data
 PANEL_JOBS_COLLECTION = "florabi_panel_jobs"  # Job queue for async panel posting
+RECORD_EXPIRY_MAX_SLEEP = 6 * 3600  # Criminal record sweep sleeps until the next expiresAt, at most this long (seconds)
+OFFICIALS_SYNC_DEBOUNCE = 5  # Seconds to coalesce role-change bursts before rebuilding the officials snapshot
+PANEL_JOB_WORKERS = int(os.getenv("PANEL_JOB_WORKERS", "2"))  # Concurrent panel job workers per process
+PANEL_JOB_TIMEOUT = int(os.getenv("PANEL_JOB_TIMEOUT", "300"))  # Seconds before a running job is abandoned
+PANEL_JOB_MAX_ATTEMPTS = 5
+PANEL_JOB_BACKOFF_BASE = 5  # Seconds; doubles per attempt
+PANEL_JOB_BACKOFF_MAX = 300
+PANEL_JOB_WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"  # Lease owner recorded on claimed jobs
 PEARL_PANELS_COLLECTION = "florabi_pearl_panels"  # Pearl panel message tracking for re-registration
+COMMAND_SYNC_COLLECTION = "florabi_command_sync"  # Last-synced command tree hash per guild ('global' for global scope)
+LEGISLATIVE_STATS_COLLECTION = "florabi_legislative_stats"  # Maintained bill counters ('totals' + one document per month)
+COUNCIL_VOTES_COLLECTION = "florabi_council_votes"  # Vote index: one '{member}_{bill}' entry per vote cast
+COUNCIL_MEMBER_STATS_COLLECTION = "florabi_council_member_stats"  # Per-member vote counters, keyed by Discord ID
+MIGRATIONS_COLLECTION = "florabi_migrations"  # One document per completed one-time data backfill
+REHYDRATE_CONCURRENCY = int(os.getenv("REHYDRATE_CONCURRENCY", "8"))  # Max parallel panel verifications at startup
 
 # Replit: put your entire Firebase service account JSON into FIREBASE_KEY_JSON secret
 FIREBASE_KEY_JSON = os.getenv("FIREBASE_KEY_JSON")
@@ -257,16 +437,314 @@ if FIREBASE_KEY_JSON:
 # ---------- IN-MEMORY STORAGE (Firestore-compatible shim) ----------
 
 
+# ---------- FIRESTORE CALL-SITE PROFILER ----------
+# `db` is a MeteredFirestore wrapping the real client (or InMemoryDB). The proxy is
+# transparent - isinstance(db, InMemoryDB) still works - and follows the objects it
+# hands out (collections, queries, document refs, batches, snapshots). Every round
+# trip is counted against the current job / interaction; a sample of them is also
+# attributed to its call site (function + line) with the query shape, documents
+# returned and latency. Queries without limit() returning more than
+# FIRESTORE_UNBOUNDED_STREAM_DOCS documents are flagged. Report: /admin firestore_profile.
+FIRESTORE_PROFILE_SAMPLE_RATE = float(os.getenv("FIRESTORE_PROFILE_SAMPLE_RATE", "1.0"))  # Fraction of calls attributed to a call site
+FIRESTORE_UNBOUNDED_STREAM_DOCS = int(os.getenv("FIRESTORE_UNBOUNDED_STREAM_DOCS", "200"))
+
+_QUERY_BUILDERS = {'where', 'order_by', 'limit', 'limit_to_last', 'offset', 'start_at', 'start_after', 'end_at', 'end_before', 'select'}
+_WRITE_OPS = {'set', 'update', 'delete', 'create'}
+
+class CallSiteStats:
+    """Aggregates for one (call site, operation, query shape)"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.docs = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.max_docs = 0
+        self.unbounded = 0  # Calls that returned more than FIRESTORE_UNBOUNDED_STREAM_DOCS without a limit
+
+class FirestoreProfiler:
+    """Call-site profile of Firestore operations"""
+    
+    def __init__(self):
+        self.sites = {}  # (site, op, shape) -> CallSiteStats
+        self.warned = set()  # Call sites already reported as unbounded
+        self.started = time.monotonic()
+    
+    @staticmethod
+    def call_site(frame) -> str:
+        """function:line of the first frame in this module (calls may arrive via the thread pool)"""
+        first = frame
+        while frame is not None and frame.f_code.co_filename != __file__:
+            frame = frame.f_back
+        if frame is None:
+            return f"{os.path.basename(first.f_code.co_filename)}:{first.f_code.co_name}"
+        qualname = getattr(frame.f_code, 'co_qualname', frame.f_code.co_name)
+        return f"{qualname.replace('.<locals>', '')}:{frame.f_lineno}"
+    
+    def record(self, frame, op: str, shape: tuple, docs: int, seconds: float, bounded: bool = True):
+        unbounded = not bounded and docs > FIRESTORE_UNBOUNDED_STREAM_DOCS
+        if not unbounded and FIRESTORE_PROFILE_SAMPLE_RATE < 1 and random.random() >= FIRESTORE_PROFILE_SAMPLE_RATE:
+            return
+        
+        site = self.call_site(frame)
+        stats = self.sites.setdefault((site, op, '.'.join(shape)), CallSiteStats())
+        stats.calls += 1
+        stats.docs += docs
+        stats.seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+        stats.max_docs = max(stats.max_docs, docs)
+        if unbounded:
+            stats.unbounded += 1
+            if site not in self.warned:
+                self.warned.add(site)
+                print(f"[WARN] Unbounded Firestore {op} of {'.'.join(shape)} returned {docs} docs at {site}")
+    
+    def report(self, sort: str = 'docs', limit: int = 50) -> str:
+        """Plain-text profile, counts scaled up by the sampling rate"""
+        scale = 1 / FIRESTORE_PROFILE_SAMPLE_RATE if FIRESTORE_PROFILE_SAMPLE_RATE < 1 else 1
+        sort_keys = {
+            'docs': lambda s: s.docs,
+            'calls': lambda s: s.calls,
+            'time': lambda s: s.seconds,
+            'unbounded': lambda s: (s.unbounded, s.max_docs),
+        }
+        rows = sorted(self.sites.items(), key=lambda kv: sort_keys[sort](kv[1]), reverse=True)[:limit]
+        lines = [
+            f"Firestore call-site profile - {time.monotonic() - self.started:.0f}s, sample rate {FIRESTORE_PROFILE_SAMPLE_RATE:g}, sorted by {sort}",
+            f"{'calls':>8} {'docs':>9} {'docs/call':>9} {'avg ms':>8} {'max ms':>8} {'max docs':>8}  op / shape / call site",
+        ]
+        for (site, op, shape), s in rows:
+            flag = f"  ⚠️ UNBOUNDED x{s.unbounded}" if s.unbounded else ""
+            lines.append(
+                f"{s.calls * scale:>8.0f} {s.docs * scale:>9.0f} {s.docs / s.calls:>9.1f} {s.seconds / s.calls * 1000:>8.1f} "
+                f"{s.max_seconds * 1000:>8.1f} {s.max_docs:>8}  {op} {shape}  @ {site}{flag}"
+            )
+        return "\n".join(lines)
+
+firestore_profiler = FirestoreProfiler()
+
+class MeteredFirestore:
+    """Transparent metering proxy for a Firestore/InMemoryDB object (see FIRESTORE CALL-SITE PROFILER)"""
+    
+    __slots__ = ('_target', '_kind', '_shape', '_pending')
+    
+    def __init__(self, target, kind: str = 'client', shape: tuple = ()):
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_kind', kind)  # client / collection / query / aggregation / document / batch / snapshot
+        object.__setattr__(self, '_shape', shape)
+        object.__setattr__(self, '_pending', 0)  # Writes staged on a batch
+    
+    @property
+    def __class__(self):
+        return type(self._target)  # isinstance() checks see the wrapped object
+    
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+    
+    def __eq__(self, other):
+        return self._target == (other._target if isinstance(other, MeteredFirestore) else other)
+    
+    def __hash__(self):
+        return hash(self._target)
+    
+    def __repr__(self):
+        return f"Metered({self._target!r})"
+    
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        kind = self._kind
+        
+        if kind == 'snapshot':
+            # Snapshots are plain data apart from their reference
+            return MeteredFirestore(attr, 'document', self._shape) if name == 'reference' else attr
+        if not callable(attr):
+            return attr
+        
+        if name in ('collection', 'collection_group'):
+            return lambda *args, **kwargs: MeteredFirestore(attr(*args, **kwargs), 'collection', self._shape + (str(args[0]) if args else '?',))
+        if name == 'document' and kind in ('client', 'collection'):
+            return lambda *args, **kwargs: MeteredFirestore(attr(*args, **kwargs), 'document', self._shape + ('{id}',))
+        if name in _QUERY_BUILDERS and kind in ('collection', 'query'):
+            def build(*args, **kwargs):
+                # Cursors (start_after(snapshot)) take the real snapshot, not its proxy
+                shape = self._shape + (self.shape_token(name, args, kwargs),)
+                return MeteredFirestore(attr(*(a._target if isinstance(a, MeteredFirestore) else a for a in args), **kwargs), 'query', shape)
+            return build
+        if name == 'count' and kind in ('collection', 'query'):
+            return lambda *args, **kwargs: MeteredFirestore(attr(*args, **kwargs), 'aggregation', self._shape + ('count()',))
+        if name == 'batch' and kind == 'client':
+            return lambda *args, **kwargs: MeteredFirestore(attr(*args, **kwargs), 'batch', ('batch',))
+        
+        if name in ('stream', 'get') and kind in ('collection', 'query', 'aggregation'):
+            return lambda *args, **kwargs: self.metered_read(sys._getframe(1), name, attr, args, kwargs)
+        if name == 'get' and kind == 'document':
+            def get(*args, **kwargs):
+                if args:
+                    return attr(*args, **kwargs)  # InMemoryDoc.get(key) is a field read
+                return self.metered_read(sys._getframe(1), name, attr, args, kwargs)
+            return get
+        if (name in _WRITE_OPS and kind == 'document') or (name == 'add' and kind == 'collection'):
+            return lambda *args, **kwargs: self.metered_write(sys._getframe(1), name, attr, args, kwargs, 1)
+        if name in _WRITE_OPS and kind == 'batch':
+            def stage(*args, **kwargs):
+                # Unwrap refs so the batch doesn't meter its own commit a second time
+                object.__setattr__(self, '_pending', self._pending + 1)
+                return attr(*(a._target if isinstance(a, MeteredFirestore) else a for a in args), **kwargs)
+            return stage
+        if name == 'commit' and kind == 'batch':
+            def commit(*args, **kwargs):
+                writes, _ = self._pending, object.__setattr__(self, '_pending', 0)
+                return self.metered_write(sys._getframe(1), name, attr, args, kwargs, writes)
+            return commit
+        return attr
+    
+    @staticmethod
+    def shape_token(name: str, args: tuple, kwargs: dict) -> str:
+        """Query step without its values, e.g. where(status ==), order_by(expiresAt)"""
+        if name == 'where':
+            condition = kwargs.get('filter')
+            if condition is not None:
+                return f"where({getattr(condition, 'field_path', '?')} {getattr(condition, 'op_string', '?')})"
+            return f"where({args[0]} {args[1]})" if len(args) >= 2 else "where(?)"
+        if name == 'order_by':
+            return f"order_by({args[0] if args else kwargs.get('field_path', '?')})"
+        if name in ('limit', 'limit_to_last'):
+            return f"{name}({args[0] if args else kwargs.get('count', '?')})"
+        return f"{name}()"
+    
+    def metered_read(self, frame, op, fn, args, kwargs):
+        started = time.perf_counter()
+        result = fn(*args, **kwargs)
+        if self._kind == 'document':
+            docs = 1
+            result = MeteredFirestore(result, 'snapshot', self._shape)
+        elif self._kind == 'aggregation':
+            docs = 1
+        else:
+            # Materialize generators (real stream()) so latency covers the whole fetch
+            result = [MeteredFirestore(doc, 'snapshot', self._shape[:1] + ('{id}',)) for doc in result]
+            docs = len(result)
+        seconds = time.perf_counter() - started
+        count_firestore_io(reads=max(docs, 1), round_trips=1)  # An empty result still bills one read
+        bounded = any(token.startswith('limit') for token in self._shape)
+        firestore_profiler.record(frame, op, self._shape, docs, seconds, bounded=bounded)
+        return result
+    
+    def metered_write(self, frame, op, fn, args, kwargs, writes: int):
+        started = time.perf_counter()
+        result = fn(*args, **kwargs)
+        seconds = time.perf_counter() - started
+        count_firestore_io(writes=writes, round_trips=1)
+        firestore_profiler.record(frame, op, self._shape, writes, seconds)
+        return result
+
 # ---------- FIREBASE INIT ----------
 try:
     cred = credentials.Certificate(FIREBASE_CONFIG_PATH)
     firebase_admin.initialize_app(cred)
-    db = firestore.client()
+    db = MeteredFirestore(firestore.client())
     print("[OK] Firebase initialized.")
 except Exception as e:
     print(f"[ERR] Firebase init failed: {e}")
     print("[INFO] Using in-memory storage (bills will not persist)")
-    db = InMemoryDB()
+    db = MeteredFirestore(InMemoryDB())
+
+# ---------- FIRESTORE HEALTH MONITOR ----------
+# Channel state is tracked from the outcome of real calls instead of a round-trip
+# query before every operation. After FIRESTORE_BREAKER_THRESHOLD consecutive
+# connection failures the breaker trips: calls fail fast until the cooldown
+# passes, then the next caller rebuilds the client.
+FIRESTORE_BREAKER_THRESHOLD = int(os.getenv("FIRESTORE_BREAKER_THRESHOLD", "3"))
+FIRESTORE_BREAKER_COOLDOWN = float(os.getenv("FIRESTORE_BREAKER_COOLDOWN", "30"))  # Seconds before a rebuild attempt
+FIRESTORE_IDLE_PROBE_SECONDS = 60  # Background probe only when no real call was seen for this long
+
+# Google client exceptions that mean the channel is broken rather than the request being bad.
+# Plain OSErrors are not counted: Discord/aiohttp and file I/O raise them too.
+FIRESTORE_CONNECTION_ERRORS = (
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.RetryError,
+    google_exceptions.InternalServerError,
+    google_exceptions.Unknown,
+    google_auth_exceptions.TransportError,  # Token refresh could not reach Google
+)
+DOCUMENT_EXISTS_ERRORS = (google_exceptions.AlreadyExists, memorydb.AlreadyExists)  # Raised by create() on a taken ID
+
+class FirestoreHealth:
+    """Cached Firestore channel state: healthy, degraded (recent failures) or down (breaker open)"""
+    
+    def __init__(self):
+        self.state = 'healthy'
+        self.consecutive_failures = 0
+        self.last_success = None  # time.monotonic() of last successful call
+        self.last_failure = None
+        self.last_error = None
+        self.open_until = 0.0  # Breaker stays open (fail fast) until this monotonic time
+        self.rebuilds = 0
+        self.short_circuited = 0
+    
+    @staticmethod
+    def is_connection_error(error: Exception) -> bool:
+        return isinstance(error, FIRESTORE_CONNECTION_ERRORS)
+    
+    def record_success(self):
+        if self.state != 'healthy':
+            print(f"[OK] Firestore healthy again (was {self.state})")
+        self.state = 'healthy'
+        self.consecutive_failures = 0
+        self.last_success = time.monotonic()
+    
+    def record_failure(self, error: Exception):
+        if not self.is_connection_error(error):
+            return  # Bad request / missing doc / not a Firestore error - says nothing about the channel
+        self.count_failure(error)
+    
+    def count_failure(self, error: Exception):
+        """Count a failure of the Firestore channel itself (callers have already classified it)"""
+        now = time.monotonic()
+        self.consecutive_failures += 1
+        self.last_failure = now
+        self.last_error = f"{type(error).__name__}: {error}"[:200]
+        if self.consecutive_failures >= FIRESTORE_BREAKER_THRESHOLD:
+            if self.state != 'down':
+                print(f"[WARN] Firestore breaker tripped after {self.consecutive_failures} failures: {self.last_error}")
+            self.state = 'down'
+            self.open_until = now + FIRESTORE_BREAKER_COOLDOWN
+        else:
+            self.state = 'degraded'
+    
+    def idle(self) -> bool:
+        """True when no call outcome has been observed recently"""
+        last_seen = max(self.last_success or 0.0, self.last_failure or 0.0)
+        return time.monotonic() - last_seen >= FIRESTORE_IDLE_PROBE_SECONDS
+    
+    def summary(self) -> dict:
+        now = time.monotonic()
+        return {
+            'state': self.state,
+            'consecutiveFailures': self.consecutive_failures,
+            'lastSuccessAgo': round(now - self.last_success, 1) if self.last_success else None,
+            'lastFailureAgo': round(now - self.last_failure, 1) if self.last_failure else None,
+            'lastError': self.last_error,
+            'retryIn': round(max(0.0, self.open_until - now), 1) if self.state == 'down' else 0,
+            'rebuilds': self.rebuilds,
+            'shortCircuited': self.short_circuited,
+        }
+
+firestore_health = FirestoreHealth()
+
+async def firestore_call(fn, *args, **kwargs):
+    """Run a blocking Firestore call in the thread pool and report its outcome to the health monitor"""
+    try:
+        result = await asyncio.to_thread(fn, *args, **kwargs)
+    except Exception as e:
+        firestore_health.record_failure(e)
+        raise
+    firestore_health.record_success()
+    return result
+
+def _firestore_probe(client):
+    return list(client.collection('_health_check').limit(1).stream())
 
 # ---------- FIRESTORE CLIENT RECREATION HELPER ----------
 # Global lock to prevent concurrent Firestore client reinitialization
@@ -274,77 +752,516 @@ firestore_reinit_lock = asyncio.Lock()
 
 async def ensure_firestore():
     """
-    Ensure Firestore client is healthy. If the gRPC channel is dead (Errno 5),
-    tear down and rebuild the Firebase app with fresh credentials.
+    Return the Firestore client without a network round trip.
     
-    This fixes the root cause of persistent [Errno 5] errors where all retries
-    reuse the same broken gRPC connection.
-    
-    Returns the current (or freshly recreated) Firestore client.
+    The health monitor's cached state decides: while healthy or degraded the
+    current client is returned as-is. While the breaker is open the call fails
+    fast with OSError; once the cooldown passes the client is torn down and
+    rebuilt with fresh credentials (fixes persistent [Errno 5] errors where
+    retries reuse the same broken gRPC channel).
     """
     global db
     
     # If using in-memory DB, just return it
-    if isinstance(db, InMemoryDB):
+    if isinstance(db, InMemoryDB) or firestore_health.state != 'down':
         return db
     
-    try:
-        # REAL health check - do a lightweight round-trip query
-        # CRITICAL: Run in thread pool to avoid blocking the event loop!
-        await asyncio.to_thread(lambda: list(db.collection('_health_check').limit(1).stream()))
-        return db
-    except (OSError, Exception) as check_err:
-        # Channel is dead, recreate it
-        print(f"[WARN] Firestore health check failed (gRPC channel dead): {check_err}")
-        print(f"[INFO] Attempting Firestore client recreation...")
+    if time.monotonic() < firestore_health.open_until:
+        firestore_health.short_circuited += 1
+        raise OSError("[Errno 5] Database connection lost - please try again in a moment")
+    
+    async with firestore_reinit_lock:
+        # Double-check another coroutine didn't already fix it
+        if firestore_health.state != 'down':
+            return db
         
-        async with firestore_reinit_lock:
-            # Double-check another coroutine didn't already fix it
+        print(f"[INFO] Attempting Firestore client recreation...")
+        try:
+            # Tear down existing Firebase app
             try:
-                await asyncio.to_thread(lambda: list(db.collection('_health_check').limit(1).stream()))
-                print(f"[OK] Firestore client already healthy (another task fixed it)")
-                return db
+                firebase_admin.delete_app(firebase_admin.get_app())
+                print(f"[OK] Deleted old Firebase app")
             except:
-                pass
-            
+                pass  # App might already be deleted
+            
+            # Add small delay to ensure clean teardown
+            await asyncio.sleep(0.5)
+            
+            # Rebuild with fresh credentials and verify once
+            cred = credentials.Certificate(FIREBASE_CONFIG_PATH)
+            firebase_admin.initialize_app(cred)
+            db = MeteredFirestore(firestore.client())
+            firestore_health.rebuilds += 1
+            await firestore_call(_firestore_probe, db)
+            print(f"[OK] ✅ Firestore client recreated and verified healthy!")
+            return db
+            
+        except Exception as reinit_err:
+            # Re-open the breaker for another cooldown so callers keep failing fast
+            firestore_health.count_failure(reinit_err)
+            firestore_health.open_until = time.monotonic() + FIRESTORE_BREAKER_COOLDOWN
+            print(f"[ERR] ❌ CRITICAL: Failed to recreate Firestore client: {reinit_err}")
+            # Don't silently fail - raise the error so commands fail fast with clear message
+            raise OSError("[Errno 5] Database connection lost - please try again in a moment") from reinit_err
+
+# ---------- BACKGROUND JOB SCHEDULER ----------
+# Every periodic job is a tasks.loop registered through task_scheduler.job(): the
+# scheduler skips a run while the previous one is still going (e.g. an admin
+# "run now" during a scheduled run), delays each loop's start by a random jitter
+# so a restart doesn't fire every job in the same second, and records per-job run
+# metrics, including the Firestore reads/writes made while it runs.
+SCHEDULER_START_JITTER = float(os.getenv("SCHEDULER_START_JITTER", "60"))  # Max seconds to delay each job's first run
+
+def count_firestore_io(reads: int = 0, writes: int = 0, round_trips: int = 0):
+    """Attribute Firestore document reads/writes to the background job or interaction running in this context (called by MeteredFirestore)"""
+    stats = _current_job.get()
+    if stats:
+        stats.reads += reads
+        stats.writes += writes
+    scope = _current_interaction.get()
+    if scope:
+        scope.reads += reads
+        scope.writes += writes
+        scope.round_trips += round_trips
+
+class JobStats:
+    """Run metrics for one scheduled job"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.running = False
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0  # Runs dropped because the previous run was still going
+        self.last_start = None  # datetime (UTC)
+        self.last_duration = None  # Seconds
+        self.last_error = None
+        self.reads = 0  # Totals since startup
+        self.writes = 0
+        self.last_reads = 0
+        self.last_writes = 0
+    
+    def summary(self) -> dict:
+        return {
+            'running': self.running,
+            'runs': self.runs,
+            'failures': self.failures,
+            'skipped': self.skipped,
+            'lastStart': self.last_start,
+            'lastDuration': round(self.last_duration, 2) if self.last_duration is not None else None,
+            'lastReads': self.last_reads,
+            'lastWrites': self.last_writes,
+            'reads': self.reads,
+            'writes': self.writes,
+            'lastError': self.last_error,
+        }
+
+class TaskScheduler:
+    """Registry of the bot's periodic jobs (tasks.loop) with overlap guard, start jitter and metrics"""
+    
+    def __init__(self):
+        self.jobs = {}  # name -> JobStats
+        self.loops = {}  # name -> tasks.Loop (unbound, as declared on the bot class)
+    
+    def job(self, **interval):
+        """Declare a bot method as a scheduled job: tasks.loop(**interval) wrapped with the scheduler"""
+        def decorator(fn):
+            name = fn.__name__  # Also the attribute the bound loop is stored under
+            stats = self.jobs[name] = JobStats(name)
+            
+            @functools.wraps(fn)
+            async def run(bot_self):
+                await self.run(stats, fn, bot_self)
+            
+            loop = tasks.loop(**interval)(run)
+            
+            @loop.before_loop
+            async def before_job(bot_self):
+                await bot_self.wait_until_ready()
+                # Spread first runs out; the jitter shifts the whole cadence, not just one run
+                period = (loop.seconds or 0) + (loop.minutes or 0) * 60 + (loop.hours or 0) * 3600
+                await asyncio.sleep(random.uniform(0, min(SCHEDULER_START_JITTER, period)))
+            
+            @loop.error
+            async def job_error(bot_self, error):
+                logger.error(f"Background task '{name}' crashed: {error}", exc_info=error)
+            
+            self.loops[name] = loop
+            return loop
+        return decorator
+    
+    async def run(self, stats: JobStats, fn, *args):
+        """Run one iteration of a job unless the previous one is still in progress"""
+        if stats.running:
+            stats.skipped += 1
+            print(f"[WARN] Job '{stats.name}' still running - skipping this run")
+            return
+        
+        stats.running = True
+        stats.last_start = datetime.now(timezone.utc)
+        reads, writes = stats.reads, stats.writes
+        token = _current_job.set(stats)
+        started = time.monotonic()
+        try:
+            await fn(*args)
+            stats.last_error = None
+        except Exception as e:
+            stats.failures += 1
+            stats.last_error = f"{type(e).__name__}: {e}"[:200]
+            logger.error(f"Background task '{stats.name}' failed: {e}", exc_info=e)
+        finally:
+            _current_job.reset(token)
+            stats.running = False
+            stats.runs += 1
+            stats.last_duration = time.monotonic() - started
+            stats.last_reads, stats.last_writes = stats.reads - reads, stats.writes - writes
+    
+    def job_subsystem(self, name: str):
+        """Name of the gated subsystem that owns a job, or None for core jobs"""
+        for subsystem, spec in SUBSYSTEMS.items():
+            if name in spec['tasks']:
+                return subsystem
+        return None
+    
+    def start(self, bot_instance):
+        """Start every registered job whose subsystem is enabled"""
+        started = []
+        for name in self.loops:
+            subsystem = self.job_subsystem(name)
+            loop = getattr(bot_instance, name)
+            if (subsystem is None or subsystem_enabled(subsystem)) and not loop.is_running():
+                loop.start()
+                started.append(name)
+        print(f"[OK] Task scheduler started {len(started)} job(s): {', '.join(started)} (start jitter ≤{SCHEDULER_START_JITTER:.0f}s)")
+    
+    async def run_now(self, bot_instance, name: str) -> bool:
+        """Run a job immediately (outside its cadence). Returns False if it was already running."""
+        stats = self.jobs[name]
+        if stats.running:
+            stats.skipped += 1
+            return False
+        await getattr(bot_instance, name)()
+        return True
+    
+    def status(self, bot_instance) -> list:
+        """Per-job metrics plus loop state, in registration order"""
+        rows = []
+        for name, stats in self.jobs.items():
+            loop = getattr(bot_instance, name)
+            row = stats.summary()
+            row['name'] = name
+            row['active'] = loop.is_running()
+            row['nextRun'] = loop.next_iteration if loop.is_running() else None
+            rows.append(row)
+        return rows
+
+task_scheduler = TaskScheduler()
+
+# ---------- INTERACTION METRICS ----------
+# Every interaction is timed from its snowflake timestamp: to the first response
+# (ack - Discord fails the interaction if that takes over 3s) and until all of its
+# handlers finish (app command, view / dynamic item / modal callback and the
+# on_interaction listener). Firestore reads/writes/round trips and Discord HTTP
+# calls made meanwhile are attributed to it: the scope is set while the gateway
+# event is parsed, so every handler task inherits it through its context.
+# Exposed as Prometheus text on METRICS_HOST:METRICS_PORT/metrics and via /admin metrics.
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))  # 0 disables the HTTP endpoint
+METRICS_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)  # Seconds
+
+class LatencyHistogram:
+    """Fixed-bucket histogram (Prometheus style: cumulative on export)"""
+    
+    def __init__(self):
+        self.counts = [0] * (len(METRICS_LATENCY_BUCKETS) + 1)  # Last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+    
+    def observe(self, seconds: float):
+        for i, bound in enumerate(METRICS_LATENCY_BUCKETS):
+            if seconds <= bound:
+                break
+        else:
+            i = len(METRICS_LATENCY_BUCKETS)
+        self.counts[i] += 1
+        self.total += seconds
+        self.count += 1
+    
+    def quantile(self, q: float):
+        """Upper bound of the bucket holding the q-quantile (None if empty, inf past the last bucket)"""
+        if not self.count:
+            return None
+        rank, seen = q * self.count, 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return METRICS_LATENCY_BUCKETS[i] if i < len(METRICS_LATENCY_BUCKETS) else float('inf')
+        return float('inf')
+
+class InteractionScope:
+    """Cost of one interaction, filled in by whatever handler task touches it"""
+    
+    def __init__(self, kind: str, name: str, created_at: datetime, interaction_id: int = None, user_id: int = None, guild_id: int = None):
+        self.kind = kind
+        self.name = name
+        self.created_at = created_at
+        self.interaction_id = interaction_id
+        self.user_id = user_id  # Log context
+        self.guild_id = guild_id
+        self.ack = None  # Seconds from creation to the first response
+        self.errors = 0
+        self.reads = 0
+        self.writes = 0
+        self.round_trips = 0
+        self.http_calls = 0
+    
+    def elapsed(self) -> float:
+        return (datetime.now(timezone.utc) - self.created_at).total_seconds()
+
+class InteractionStats:
+    """Aggregated metrics for one command / component / modal"""
+    
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.unacked = 0
+        self.ack = LatencyHistogram()
+        self.total = LatencyHistogram()
+        self.reads = 0
+        self.writes = 0
+        self.round_trips = 0
+        self.http_calls = 0
+
+def _metric_labels(**labels) -> str:
+    escaped = (f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34)).replace(chr(10), " ")}"' for k, v in labels.items())
+    return "{" + ",".join(escaped) + "}"
+
+class InteractionMetrics:
+    """Per-interaction latency / cost registry and its Prometheus exposition"""
+    
+    def __init__(self):
+        self.stats = {}  # (kind, name) -> InteractionStats
+        self.http_routes = {}  # (method, route template) -> [calls, seconds]
+        self.started = time.monotonic()
+        self.server = None
+    
+    # --- collection ---
+    
+    def install(self, bot_instance):
+        """Hook interaction parsing and both Discord HTTP paths (REST client and interaction webhooks)"""
+        state = bot_instance._connection
+        parse_interaction = state.parsers['INTERACTION_CREATE']
+        
+        def parse_interaction_create(data):
+            user = (data.get('member') or {}).get('user') or data.get('user') or {}
+            scope = InteractionScope(
+                *self.interaction_name(state, data), discord.utils.snowflake_time(int(data['id'])),
+                interaction_id=int(data['id']), user_id=int(user['id']) if user.get('id') else None,
+                guild_id=int(data['guild_id']) if data.get('guild_id') else None
+            )
+            token = _current_interaction.set(scope)
+            before = asyncio.all_tasks()
             try:
-                # Tear down existing Firebase app
-                try:
-                    firebase_admin.delete_app(firebase_admin.get_app())
-                    print(f"[OK] Deleted old Firebase app")
-                except:
-                    pass  # App might already be deleted
-                
-                # Add small delay to ensure clean teardown
-                await asyncio.sleep(0.5)
-                
-                # Rebuild with fresh credentials
-                cred = credentials.Certificate(FIREBASE_CONFIG_PATH)
-                firebase_admin.initialize_app(cred)
-                db = firestore.client()
-                print(f"[OK] ✅ Firestore client recreated successfully!")
-                
-                # Verify new client works with multiple retries
-                for retry in range(3):
-                    try:
-                        await asyncio.to_thread(lambda: list(db.collection('_health_check').limit(1).stream()))
-                        print(f"[OK] ✅ New Firestore client verified healthy!")
-                        return db
-                    except Exception as verify_err:
-                        if retry < 2:
-                            print(f"[WARN] Firestore verification attempt {retry+1}/3 failed, retrying...")
-                            await asyncio.sleep(0.5)
-                        else:
-                            print(f"[ERR] ⚠️ New Firestore client still unhealthy after 3 attempts: {verify_err}")
-                            raise OSError("[Errno 5] Firestore connection failed - network may be down") from verify_err
-                
-                return db
-                
-            except Exception as reinit_err:
-                print(f"[ERR] ❌ CRITICAL: Failed to recreate Firestore client: {reinit_err}")
-                traceback.print_exc()
-                # Don't silently fail - raise the error so commands fail fast with clear message
-                raise OSError("[Errno 5] Database connection lost - please try again in a moment") from reinit_err
+                parse_interaction(data)
+            finally:
+                _current_interaction.reset(token)
+            # Handler tasks were created synchronously while parsing and inherited the scope
+            asyncio.create_task(self.finish(scope, asyncio.all_tasks() - before))
+        
+        state.parsers['INTERACTION_CREATE'] = parse_interaction_create
+        
+        rest_request = bot_instance.http.request
+        
+        async def metered_rest_request(route, **kwargs):
+            started = time.monotonic()
+            try:
+                return await rest_request(route, **kwargs)
+            finally:
+                self.record_http(route, time.monotonic() - started)
+        
+        bot_instance.http.request = metered_rest_request
+        
+        # Interaction responses, followups and original-response edits go through the webhook adapter
+        from discord.webhook.async_ import AsyncWebhookAdapter
+        webhook_request = AsyncWebhookAdapter.request
+        
+        async def metered_webhook_request(adapter, route, *args, **kwargs):
+            started = time.monotonic()
+            try:
+                return await webhook_request(adapter, route, *args, **kwargs)
+            finally:
+                self.record_http(route, time.monotonic() - started)
+        
+        AsyncWebhookAdapter.request = metered_webhook_request
+    
+    @staticmethod
+    def interaction_name(state, data) -> tuple:
+        """(kind, name) for a raw interaction: qualified command name, handler class, or custom_id prefix"""
+        inner = data.get('data') or {}
+        if data['type'] in (2, 4):
+            parts = [inner.get('name', 'unknown')]
+            options = inner.get('options') or []
+            while options and options[0].get('type') in (1, 2):  # Subcommand group / subcommand
+                parts.append(options[0]['name'])
+                options = options[0].get('options') or []
+            return ('autocomplete' if data['type'] == 4 else 'command'), ' '.join(parts)
+        
+        custom_id = inner.get('custom_id', '')
+        store = state._view_store
+        if data['type'] == 5:
+            modal = store._modals.get(custom_id)
+            if modal is not None:
+                return 'modal', type(modal).__name__
+        else:
+            message_id = int(data['message']['id']) if data.get('message') else None
+            key = (inner.get('component_type'), custom_id)
+            item = store._views.get(message_id, {}).get(key) or store._views.get(None, {}).get(key)
+            if item is not None:
+                if type(item).__module__.startswith('discord.'):
+                    # Decorated @ui.button / @ui.select: name it after the view method
+                    callback = getattr(item.callback, 'callback', item.callback)
+                    return 'component', f"{type(item.view).__name__}.{getattr(callback, '__name__', type(item).__name__)}"
+                return 'component', type(item).__name__
+            for pattern, factory in store._dynamic_items.items():
+                if pattern.fullmatch(custom_id):
+                    return 'component', factory.__name__
+        
+        # Handled by on_interaction (or stale): IDs are appended to a lowercase prefix
+        match = re.match(r'[a-z]+(?:[:_][a-z]+)*', custom_id)
+        name = match.group(0) if match and len(match.group(0)) >= 3 else 'unknown'
+        return ('modal' if data['type'] == 5 else 'component'), name
+    
+    async def finish(self, scope: InteractionScope, handlers: set):
+        """Wait for every handler of the interaction, then fold its scope into the aggregates"""
+        if handlers:
+            results = await asyncio.gather(*handlers, return_exceptions=True)
+            scope.errors += sum(1 for r in results if isinstance(r, Exception))
+        
+        stats = self.stats.setdefault((scope.kind, scope.name), InteractionStats())
+        stats.count += 1
+        stats.errors += scope.errors
+        stats.total.observe(scope.elapsed())
+        if scope.ack is None:
+            stats.unacked += 1
+        else:
+            stats.ack.observe(scope.ack)
+        stats.reads += scope.reads
+        stats.writes += scope.writes
+        stats.round_trips += scope.round_trips
+        stats.http_calls += scope.http_calls
+    
+    def record_http(self, route, seconds: float):
+        entry = self.http_routes.setdefault((route.method, route.path), [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        scope = _current_interaction.get()
+        if scope:
+            scope.http_calls += 1
+            if scope.ack is None and route.path.endswith('/callback'):
+                scope.ack = scope.elapsed()
+    
+    def record_error(self):
+        """Count a handled error against the interaction running in this context"""
+        scope = _current_interaction.get()
+        if scope:
+            scope.errors += 1
+    
+    # --- reporting ---
+    
+    def top(self, sort: str = 'cost', limit: int = 15) -> list:
+        """(kind, name, stats) rows ordered by Firestore cost, total time, calls or errors"""
+        sort_keys = {
+            'cost': lambda s: (s.reads + s.writes, s.round_trips),
+            'time': lambda s: s.total.total,
+            'calls': lambda s: s.count,
+            'errors': lambda s: (s.errors, s.unacked),
+        }
+        rows = sorted(self.stats.items(), key=lambda kv: sort_keys[sort](kv[1]), reverse=True)
+        return [(kind, name, stats) for (kind, name), stats in rows[:limit]]
+    
+    def render_prometheus(self) -> str:
+        lines = []
+        
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(f"{name}{labels} {value}" for labels, value in samples)
+        
+        def histogram(name, help_text, attr):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for (kind, cmd), stats in self.stats.items():
+                hist = getattr(stats, attr)
+                cumulative = 0
+                for bound, n in zip(list(METRICS_LATENCY_BUCKETS) + ['+Inf'], hist.counts):
+                    cumulative += n
+                    lines.append(f"{name}_bucket{_metric_labels(kind=kind, name=cmd, le=bound)} {cumulative}")
+                lines.append(f"{name}_sum{_metric_labels(kind=kind, name=cmd)} {hist.total:.6f}")
+                lines.append(f"{name}_count{_metric_labels(kind=kind, name=cmd)} {hist.count}")
+        
+        histogram('discord_interaction_ack_seconds', 'Time from interaction creation to the first response', 'ack')
+        histogram('discord_interaction_seconds', 'Time from interaction creation until all handlers finished', 'total')
+        
+        per_interaction = [
+            ('discord_interactions_total', 'Interactions handled', 'count'),
+            ('discord_interaction_errors_total', 'Handler errors', 'errors'),
+            ('discord_interaction_unacked_total', 'Interactions never responded to', 'unacked'),
+            ('discord_interaction_http_requests_total', 'Discord HTTP calls made while handling interactions', 'http_calls'),
+            ('firestore_interaction_reads_total', 'Firestore documents read while handling interactions', 'reads'),
+            ('firestore_interaction_writes_total', 'Firestore documents written while handling interactions', 'writes'),
+            ('firestore_interaction_round_trips_total', 'Firestore round trips made while handling interactions', 'round_trips'),
+        ]
+        for name, help_text, attr in per_interaction:
+            metric(name, 'counter', help_text, [
+                (_metric_labels(kind=kind, name=cmd), getattr(stats, attr)) for (kind, cmd), stats in self.stats.items()
+            ])
+        
+        metric('discord_http_requests_total', 'counter', 'Discord HTTP calls by route', [
+            (_metric_labels(method=method, route=path), calls) for (method, path), (calls, seconds) in self.http_routes.items()
+        ])
+        metric('discord_http_request_seconds_total', 'counter', 'Time spent in Discord HTTP calls by route', [
+            (_metric_labels(method=method, route=path), f"{seconds:.6f}") for (method, path), (calls, seconds) in self.http_routes.items()
+        ])
+        
+        jobs = task_scheduler.jobs.values()
+        metric('scheduler_job_runs_total', 'counter', 'Background job runs', [(_metric_labels(job=j.name), j.runs) for j in jobs])
+        metric('scheduler_job_failures_total', 'counter', 'Background job failures', [(_metric_labels(job=j.name), j.failures) for j in jobs])
+        metric('scheduler_job_skipped_total', 'counter', 'Background job runs skipped (overlap)', [(_metric_labels(job=j.name), j.skipped) for j in jobs])
+        metric('scheduler_job_last_duration_seconds', 'gauge', 'Duration of the last run', [
+            (_metric_labels(job=j.name), f"{j.last_duration:.6f}") for j in jobs if j.last_duration is not None
+        ])
+        metric('firestore_job_reads_total', 'counter', 'Firestore documents read by background jobs', [(_metric_labels(job=j.name), j.reads) for j in jobs])
+        metric('firestore_job_writes_total', 'counter', 'Firestore documents written by background jobs', [(_metric_labels(job=j.name), j.writes) for j in jobs])
+        
+        metric('process_uptime_seconds', 'gauge', 'Seconds since metrics collection started', [('', f"{time.monotonic() - self.started:.0f}")])
+        return "\n".join(lines) + "\n"
+    
+    async def serve(self):
+        """Serve /metrics on METRICS_HOST:METRICS_PORT (local scrape target)"""
+        from aiohttp import web
+        
+        async def handle_metrics(request):
+            return web.Response(
+                body=self.render_prometheus().encode(),
+                headers={'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+            )
+        
+        app = web.Application()
+        app.router.add_get('/metrics', handle_metrics)
+        runner = web.AppRunner(app, access_log=None)  # Scrapes every few seconds - don't log them
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, METRICS_HOST, METRICS_PORT).start()
+        except OSError as e:
+            await runner.cleanup()
+            print(f"[WARN] Metrics endpoint not started on {METRICS_HOST}:{METRICS_PORT}: {e}")
+            return
+        self.server = runner
+        print(f"[OK] Metrics endpoint listening on http://{METRICS_HOST}:{METRICS_PORT}/metrics")
+
+interaction_metrics = InteractionMetrics()
+
+startup_mark("config + firebase init")
 
 # ---------- CONSTANTS ----------
 BILL_STATUSES = {
@@ -682,6 +1599,8 @@ CATEGORY_EMOJIS = {
     "Population and Settlement Councilor": "👥",
 }
 
+startup_mark("translations + constants")
+
 # ---------- DISCORD BOT ----------
 class RoyalCouncilBot(commands.Bot):
     def __init__(self):
@@ -697,15 +1616,71 @@ class RoyalCouncilBot(commands.Bot):
             max_messages=500  # Reduced from default 1000 to lower memory pressure
         )
         
-        # Pearl essence decrement lock (prevent concurrent runs)
-        self.pearl_essence_lock = asyncio.Lock()
+        # Command sync runs once per process, never on gateway reconnects
+        self.commands_synced = False
+        self.command_sync_lock = asyncio.Lock()
+        self.panel_job_queue = asyncio.Queue()
+        self.officials_hash = None  # Hash of the last officials snapshot written (None = not loaded yet)
+        self.officials_sync_handle = None
+        self.panel_jobs_queued = set()  # Job IDs waiting in panel_job_queue (dedupes listener + direct enqueue)
+        self.panel_job_workers = []
+        self.panel_job_watch = None
+        self.panel_job_watch_db = None  # Client the listener is attached to (re-attach after rebuilds)
+
+    async def _get_channel_cached(self, channel_id, channel_cache):
+        """Resolve a channel from the gateway cache, falling back to one shared HTTP fetch per channel"""
+        channel = self.get_channel(channel_id)
+        if channel:
+            return channel
+        if channel_id not in channel_cache:
+            channel_cache[channel_id] = asyncio.ensure_future(self.fetch_channel(channel_id))
+        return await channel_cache[channel_id]
+
+    async def _verify_panel(self, label, doc_ref, panel_data, semaphore, channel_cache, stale_refs):
+        """Confirm a panel message still exists; queue its record for pruning if it was deleted"""
+        channel_id = panel_data.get('channelId')
+        message_id = panel_data.get('messageId')
+        async with semaphore:
+            try:
+                channel = await self._get_channel_cached(channel_id, channel_cache)
+                await channel.fetch_message(message_id)
+                print(f"[OK] Verified {label} panel in guild {panel_data.get('guildId')}")
+            except discord.NotFound:
+                # Message or channel was deleted, remove from DB (batched below)
+                stale_refs.append(doc_ref)
+                print(f"[INFO] Removing stale {label} panel (message/channel deleted)")
+            except discord.Forbidden:
+                # No access to channel
+                print(f"[WARN] No access to {label} channel {channel_id}, keeping record")
+            except Exception as e:
+                print(f"[WARN] Error verifying {label} panel: {e}")
+
+    async def _rehydrate_trial_view(self, case_id, trial_thread_id, semaphore, channel_cache):
+        """Find the trial introduction message in a trial thread and re-register its view"""
+        async with semaphore:
+            try:
+                thread = await self._get_channel_cached(trial_thread_id, channel_cache)
+                # We need to find the message in the thread (it should be the first message from the bot)
+                async for message in thread.history(limit=10, oldest_first=True):
+                    if message.author == self.user and len(message.embeds) > 0:
+                        # This is likely the trial introduction message
+                        self.add_view(TrialActionView(case_id), message_id=message.id)
+                        print(f"[OK] Re-registered trial view for case {case_id}")
+                        break
+            except Exception as e:
+                print(f"[WARN] Could not re-register trial view for case {case_id}: {e}")
 
     async def rehydrate_views(self):
         """
         Background task to re-register persistent views without blocking bot startup.
-        Runs with timeouts and health checks to handle Firestore instability gracefully.
+        
+        All stored records are read concurrently, every view is registered immediately
+        (custom_ids are static, so a view attached to a deleted message is harmless),
+        and only then are panel messages verified - concurrently, bounded by
+        REHYDRATE_CONCURRENCY - with stale records pruned in a single batch.
         """
         print("[INFO] Starting background view re-registration...")
+        started = time.monotonic()
         
         # CRITICAL: Check Firestore health first - abort if unhealthy
         try:
@@ -714,412 +1689,203 @@ class RoyalCouncilBot(commands.Bot):
             print(f"[WARN] Firestore unhealthy during startup, skipping view re-registration: {e}")
             return
         
-        # Re-register persistent portal panels
-        if db:
-            try:
-                panels_list = await asyncio.to_thread(lambda: list(db.collection(PORTAL_PANELS_COLLECTION).stream()))
-                for doc in panels_list:
-                    panel_data = doc.to_dict()
-                    message_id = panel_data.get('messageId')
-                    guild_id = panel_data.get('guildId')
-                    channel_id = panel_data.get('channelId')
-                    
-                    # Verify the message still exists using HTTP fetch
-                    try:
-                        channel = await self.fetch_channel(channel_id)
-                        await channel.fetch_message(message_id)
-                        # Message exists, register the view
-                        self.add_view(BillCreationPanel(), message_id=message_id)
-                        print(f"[OK] Re-registered portal panel in guild {guild_id}")
-                    except discord.NotFound:
-                        # Message or channel was deleted, remove from DB
-                        await asyncio.to_thread(lambda: doc.reference.delete())
-                        print(f"[INFO] Removed stale portal panel (message/channel deleted)")
-                    except discord.Forbidden:
-                        # No access to channel
-                        print(f"[WARN] No access to channel {channel_id}, keeping record")
-                    except Exception as e:
-                        print(f"[WARN] Error re-registering panel: {e}")
-            except Exception as e:
-                print(f"[WARN] Could not reload portal panels: {e}")
+        if not db:
+            return
         
-        # Re-register persistent citizen registration panels
-        if db:
+        # ---- 1. Load every record we need in parallel ----
+        async def load(label, fn):
             try:
-                citizen_panels_list = await asyncio.to_thread(lambda: list(db.collection('florabi_citizen_panels').stream()))
-                for doc in citizen_panels_list:
-                    panel_data = doc.to_dict()
-                    message_id = panel_data.get('messageId')
-                    guild_id = panel_data.get('guildId')
-                    channel_id = panel_data.get('channelId')
-                    
-                    # Verify the message still exists
-                    try:
-                        channel = await self.fetch_channel(channel_id)
-                        await channel.fetch_message(message_id)
-                        # Message exists, register the view
-                        self.add_view(CitizenRegistrationPanel(), message_id=message_id)
-                        print(f"[OK] Re-registered citizen panel in guild {guild_id}")
-                    except discord.NotFound:
-                        # Message or channel was deleted, remove from DB
-                        await asyncio.to_thread(lambda: doc.reference.delete())
-                        print(f"[INFO] Removed stale citizen panel (message/channel deleted)")
-                    except discord.Forbidden:
-                        # No access to channel
-                        print(f"[WARN] No access to channel {channel_id}, keeping record")
-                    except Exception as e:
-                        print(f"[WARN] Error re-registering citizen panel: {e}")
+                return await asyncio.to_thread(fn)
             except Exception as e:
-                print(f"[WARN] Could not reload citizen panels: {e}")
+                print(f"[WARN] Could not reload {label}: {e}")
+                return []
+        
+        # Lawyer claim buttons and bill consoles are DynamicItems (registered in setup_hook),
+        # so open cases and active bills no longer need to be enumerated here
+        (portal_docs, citizen_panel_docs, pearl_panel_docs,
+         pending_cases, trial_cases) = await asyncio.gather(
+            load("portal panels", lambda: list(db.collection(PORTAL_PANELS_COLLECTION).stream())),
+            load("citizen panels", lambda: list(db.collection('florabi_citizen_panels').stream())),
+            load("pearl panel", lambda: [d for d in [db.collection(PEARL_PANELS_COLLECTION).document('pearl_panel').get()] if d.exists]),
+            load("court case views", lambda: list(db.collection(COURT_CASES_COLLECTION).where(filter=FieldFilter('status', '==', 'pending')).stream())),
+            load("trial views", lambda: list(db.collection(COURT_CASES_COLLECTION).where(filter=FieldFilter('trialThreadId', '!=', None)).stream())),
+        )
         
-        # Re-register persistent court panels
-        if db:
-            try:
-                print("[DEBUG] Checking for court panel in database...")
-                court_panel_doc = await asyncio.to_thread(lambda: db.collection(PORTAL_PANELS_COLLECTION).document('court_panel').get())
-                if court_panel_doc.exists:
-                    print("[DEBUG] Court panel document found")
-                    panel_data = court_panel_doc.to_dict()
-                    message_id = panel_data.get('messageId')
-                    guild_id = panel_data.get('guildId')
-                    channel_id = panel_data.get('channelId')
-                    print(f"[DEBUG] Court panel: guild={guild_id}, channel={channel_id}, msg={message_id}")
-                    
-                    # Verify the message still exists
-                    try:
-                        channel = await self.fetch_channel(channel_id)
-                        print(f"[DEBUG] Found channel, fetching message...")
-                        await channel.fetch_message(message_id)
-                        print("[DEBUG] Message found, registering view...")
-                        # Message exists, register the view
-                        self.add_view(CourtPanel(), message_id=message_id)
-                        print(f"[OK] Re-registered court panel in guild {guild_id}")
-                    except discord.NotFound as e:
-                        # Message or channel was deleted, remove from DB
-                        await asyncio.to_thread(lambda: court_panel_doc.reference.delete())
-                        print(f"[INFO] Removed stale court panel: {e}")
-                    except discord.Forbidden:
-                        # No access to channel
-                        print(f"[WARN] No access to court channel {channel_id}, keeping record")
-                    except Exception as e:
-                        print(f"[WARN] Error re-registering court panel: {e}")
-                        import traceback
-                        traceback.print_exc()
-                else:
-                    print("[DEBUG] No court panel document in database")
-            except Exception as e:
-                print(f"[WARN] Could not reload court panel: {e}")
-                import traceback
-                traceback.print_exc()
+        # ---- 2. Register panel views optimistically ----
+        # Named portal panel documents map to their own view; any other portal document is a bill creation panel
+        named_panels = {
+            'court_panel': ('court', CourtPanel),
+            'betting_panel': ('betting', BettingPanel),
+            'warrant_panel': ('warrant', WarrantPanel),
+            'bank_panel': ('bank', None),  # ARCHIVED: record verified, BankPanel not registered
+            'economy_panel': ('economy', EconomyPanel),
+            'market_panel': ('market', MarketPanel),
+            'citizen_panel': ('citizen', CitizenRegistrationPanel),
+        }
+        panels_to_verify = []  # (label, doc_ref, panel_data)
         
-        # Re-register lawyer claim views for pending cases
-        if db:
-            try:
-                print("[DEBUG] Re-registering lawyer claim views for open cases...")
-                open_cases = await asyncio.to_thread(lambda: list(
-                    db.collection(COURT_CASES_COLLECTION)
-                    .where(filter=FieldFilter('status', 'in', ['filed', 'in_progress', 'pending']))
-                    .stream()
-                ))
-                for case_doc in open_cases:
-                    case_data = case_doc.to_dict()
-                    case_id = case_data.get('caseId', case_doc.id)
-                    case_type = case_data.get('caseType', 'Criminal')
-                    # Register the view without needing message_id (buttons use custom_id)
-                    self.add_view(LawyerCaseClaimView(case_id, case_type))
-                print(f"[OK] Re-registered {len(open_cases)} lawyer claim views")
-            except Exception as e:
-                print(f"[WARN] Could not reload lawyer claim views: {e}")
+        def register_panel(doc, label, view_cls):
+            panel_data = doc.to_dict()
+            message_id = panel_data.get('messageId')
+            if not message_id or not panel_data.get('channelId'):
+                return
+            if view_cls:
+                self.add_view(view_cls(), message_id=message_id)
+            panels_to_verify.append((label, doc.reference, panel_data))
+        
+        for doc in portal_docs:
+            owner = panel_subsystem(doc.id)
+            if owner and not subsystem_enabled(owner):
+                continue  # Keep the record, the subsystem may be re-enabled later
+            label, view_cls = named_panels.get(doc.id, ('portal', BillCreationPanel))
+            register_panel(doc, label, view_cls)
+        for doc in citizen_panel_docs:
+            register_panel(doc, 'citizen', CitizenRegistrationPanel)
+        if subsystem_enabled('pearls'):
+            for doc in pearl_panel_docs:
+                register_panel(doc, 'pearl', PearlPublicPanel)
+        if not subsystem_enabled('court'):
+            pending_cases, trial_cases = [], []
+        print(f"[OK] Registered {len(panels_to_verify)} panel view(s) pending verification")
+        
+        # Re-register courtroom action panels (in the private threads) for pending cases
+        case_count = 0
+        for doc in pending_cases:
+            case_data = doc.to_dict()
+            case_id = case_data.get('caseId')
+            action_panel_message_id = case_data.get('actionPanelMessageId')
+            case_type = case_data.get('caseType')
+            if action_panel_message_id and case_id and case_type:
+                self.add_view(CourtroomActionPanel(case_id, case_type), message_id=action_panel_message_id)
+                case_count += 1
+            else:
+                print(f"[DEBUG] Case {case_id} missing actionPanelMessageId, skipping re-registration")
+        print(f"[OK] Re-registered {case_count} court case(s)")
         
-        # Re-register persistent betting panel
-        if db:
-            try:
-                betting_panel_doc = await asyncio.to_thread(lambda: db.collection(PORTAL_PANELS_COLLECTION).document('betting_panel').get())
-                if betting_panel_doc.exists:
-                    panel_data = betting_panel_doc.to_dict()
-                    message_id = panel_data.get('messageId')
-                    guild_id = panel_data.get('guildId')
-                    channel_id = panel_data.get('channelId')
-                    
-                    # Verify the message still exists
-                    try:
-                        channel = await self.fetch_channel(channel_id)
-                        await channel.fetch_message(message_id)
-                        # Message exists, register the view
-                        self.add_view(BettingPanel(), message_id=message_id)
-                        print(f"[OK] Re-registered betting panel in guild {guild_id}")
-                    except discord.NotFound:
-                        # Message or channel was deleted, remove from DB
-                        await asyncio.to_thread(lambda: betting_panel_doc.reference.delete())
-                        print(f"[INFO] Removed stale betting panel (message/channel deleted)")
-                    except discord.Forbidden:
-                        # No access to channel
-                        print(f"[WARN] No access to betting channel {channel_id}, keeping record")
-                    except Exception as e:
-                        print(f"[WARN] Error re-registering betting panel: {e}")
-            except Exception as e:
-                print(f"[WARN] Could not reload betting panel: {e}")
+        print(f"[OK] All static views live after {time.monotonic() - started:.2f}s")
         
-        # Re-register persistent warrant panel
-        if db:
-            try:
-                warrant_panel_doc = await asyncio.to_thread(lambda: db.collection(PORTAL_PANELS_COLLECTION).document('warrant_panel').get())
-                if warrant_panel_doc.exists:
-                    panel_data = warrant_panel_doc.to_dict()
-                    message_id = panel_data.get('messageId')
-                    guild_id = panel_data.get('guildId')
-                    channel_id = panel_data.get('channelId')
-                    
-                    # Verify the message still exists
-                    try:
-                        channel = await self.fetch_channel(channel_id)
-                        await channel.fetch_message(message_id)
-                        # Message exists, register the view
-                        self.add_view(WarrantPanel(), message_id=message_id)
-                        print(f"[OK] Re-registered warrant panel in guild {guild_id}")
-                    except discord.NotFound:
-                        # Message or channel was deleted, remove from DB
-                        await asyncio.to_thread(lambda: warrant_panel_doc.reference.delete())
-                        print(f"[INFO] Removed stale warrant panel (message/channel deleted)")
-                    except discord.Forbidden:
-                        # No access to channel
-                        print(f"[WARN] No access to warrant channel {channel_id}, keeping record")
-                    except Exception as e:
-                        print(f"[WARN] Error re-registering warrant panel: {e}")
-            except Exception as e:
-                print(f"[WARN] Could not reload warrant panel: {e}")
+        # ---- 3. Verify panel messages and locate trial messages concurrently ----
+        semaphore = asyncio.Semaphore(REHYDRATE_CONCURRENCY)
+        channel_cache = {}
+        stale_refs = []
         
-        # Re-register persistent bank panel
-        if db:
-            try:
-                bank_panel_doc = await asyncio.to_thread(lambda: db.collection(PORTAL_PANELS_COLLECTION).document('bank_panel').get())
-                if bank_panel_doc.exists:
-                    panel_data = bank_panel_doc.to_dict()
-                    message_id = panel_data.get('messageId')
-                    guild_id = panel_data.get('guildId')
-                    channel_id = panel_data.get('channelId')
-                    
-                    # Verify the message still exists
-                    try:
-                        channel = await self.fetch_channel(channel_id)
-                        await channel.fetch_message(message_id)
-                        # Message exists, register the view
-                        # ARCHIVED: self.add_view(BankPanel(), message_id=message_id)
-                        pass  # Bank panel archived
-                        print(f"[OK] Re-registered bank panel in guild {guild_id}")
-                    except discord.NotFound:
-                        # Message or channel was deleted, remove from DB
-                        await asyncio.to_thread(lambda: bank_panel_doc.reference.delete())
-                        print(f"[INFO] Removed stale bank panel (message/channel deleted)")
-                    except discord.Forbidden:
-                        # No access to channel
-                        print(f"[WARN] No access to bank channel {channel_id}, keeping record")
-                    except Exception as e:
-                        print(f"[WARN] Error re-registering bank panel: {e}")
-            except Exception as e:
-                print(f"[WARN] Could not reload bank panel: {e}")
+        verifications = [
+            self._verify_panel(label, doc_ref, panel_data, semaphore, channel_cache, stale_refs)
+            for label, doc_ref, panel_data in panels_to_verify
+        ]
+        for doc in trial_cases:
+            case_data = doc.to_dict()
+            case_id = case_data.get('caseId') or case_data.get('id')  # Support both new and legacy schemas
+            trial_thread_id = case_data.get('trialThreadId')
+            if trial_thread_id and case_id:
+                verifications.append(self._rehydrate_trial_view(case_id, trial_thread_id, semaphore, channel_cache))
         
-        # Re-register persistent economy panel
-        if db:
-            try:
-                economy_panel_doc = await asyncio.to_thread(lambda: db.collection(PORTAL_PANELS_COLLECTION).document('economy_panel').get())
-                if economy_panel_doc.exists:
-                    panel_data = economy_panel_doc.to_dict()
-                    message_id = panel_data.get('messageId')
-                    guild_id = panel_data.get('guildId')
-                    channel_id = panel_data.get('channelId')
-                    
-                    # Verify the message still exists
-                    try:
-                        channel = await self.fetch_channel(channel_id)
-                        await channel.fetch_message(message_id)
-                        # Message exists, register the view
-                        self.add_view(EconomyPanel(), message_id=message_id)
-                        print(f"[OK] Re-registered economy panel in guild {guild_id}")
-                    except discord.NotFound:
-                        # Message or channel was deleted, remove from DB
-                        await asyncio.to_thread(lambda: economy_panel_doc.reference.delete())
-                        print(f"[INFO] Removed stale economy panel (message/channel deleted)")
-                    except discord.Forbidden:
-                        # No access to channel
-                        print(f"[WARN] No access to economy channel {channel_id}, keeping record")
-                    except Exception as e:
-                        print(f"[WARN] Error re-registering economy panel: {e}")
-            except Exception as e:
-                print(f"[WARN] Could not reload economy panel: {e}")
+        await asyncio.gather(*verifications)
         
-        # Re-register persistent market panel
-        if db:
+        # ---- 4. Prune stale panel records in one batch ----
+        if stale_refs:
             try:
-                market_panel_doc = await asyncio.to_thread(lambda: db.collection(PORTAL_PANELS_COLLECTION).document('market_panel').get())
-                if market_panel_doc.exists:
-                    panel_data = market_panel_doc.to_dict()
-                    message_id = panel_data.get('messageId')
-                    guild_id = panel_data.get('guildId')
-                    channel_id = panel_data.get('channelId')
-                    
-                    # Verify the message still exists
-                    try:
-                        channel = await self.fetch_channel(channel_id)
-                        await channel.fetch_message(message_id)
-                        # Message exists, register the view
-                        self.add_view(MarketPanel(), message_id=message_id)
-                        print(f"[OK] Re-registered market panel in guild {guild_id}")
-                    except discord.NotFound:
-                        # Message or channel was deleted, remove from DB
-                        await asyncio.to_thread(lambda: market_panel_doc.reference.delete())
-                        print(f"[INFO] Removed stale market panel (message/channel deleted)")
-                    except discord.Forbidden:
-                        # No access to channel
-                        print(f"[WARN] No access to market channel {channel_id}, keeping record")
-                    except Exception as e:
-                        print(f"[WARN] Error re-registering market panel: {e}")
+                def prune():
+                    batch = db.batch()
+                    for ref in stale_refs:
+                        batch.delete(ref)
+                    batch.commit()
+                await asyncio.to_thread(prune)
+                print(f"[INFO] Pruned {len(stale_refs)} stale panel record(s)")
             except Exception as e:
-                print(f"[WARN] Could not reload market panel: {e}")
+                print(f"[WARN] Could not prune stale panel records: {e}")
         
-        # Re-register persistent pearl panel
-        if db:
-            try:
-                pearl_panel_doc = await asyncio.to_thread(lambda: db.collection(PEARL_PANELS_COLLECTION).document('pearl_panel').get())
-                if pearl_panel_doc.exists:
-                    panel_data = pearl_panel_doc.to_dict()
-                    message_id = panel_data.get('messageId')
-                    guild_id = panel_data.get('guildId')
-                    channel_id = panel_data.get('channelId')
-                    
-                    # Verify the message still exists
-                    try:
-                        channel = await self.fetch_channel(channel_id)
-                        await channel.fetch_message(message_id)
-                        # Message exists, register the view
-                        self.add_view(PearlPublicPanel(), message_id=message_id)
-                        print(f"[OK] Re-registered pearl panel in guild {guild_id}")
-                    except discord.NotFound:
-                        # Message or channel was deleted, remove from DB
-                        await asyncio.to_thread(lambda: pearl_panel_doc.reference.delete())
-                        print(f"[INFO] Removed stale pearl panel (message/channel deleted)")
-                    except discord.Forbidden:
-                        # No access to channel
-                        print(f"[WARN] No access to pearl channel {channel_id}, keeping record")
-                    except Exception as e:
-                        print(f"[WARN] Error re-registering pearl panel: {e}")
-            except Exception as e:
-                print(f"[WARN] Could not reload pearl panel: {e}")
+        print(f"[OK] Background view re-registration completed in {time.monotonic() - started:.2f}s!")
+    
+    async def on_ready(self):
+        """Minimal on_ready - immediately ready for slash commands"""
+        # Install asyncio exception handler
+        loop = asyncio.get_event_loop()
+        loop.set_exception_handler(asyncio_exception_handler)
+        print(f"[OK] Installed asyncio exception handler")
         
-        # Lawyer registration now integrated into court panel
+        print(f"[OK] Logged in as {self.user}")
         
-        # Re-register persistent views for active court cases
-        if db:
-            try:
-                print("[DEBUG] Checking for active court cases to re-register...")
-                # Get cases with status 'pending' (active cases waiting for action)
-                cases_list = await asyncio.to_thread(lambda: list(db.collection(COURT_CASES_COLLECTION).where(filter=FieldFilter('status', '==', 'pending')).stream()))
-                case_count = 0
-                for doc in cases_list:
-                    case_count += 1
-                    case_data = doc.to_dict()
-                    case_id = case_data.get('caseId')
-                    action_panel_message_id = case_data.get('actionPanelMessageId')
-                    courtroom_thread_id = case_data.get('courtroomThreadId')
-                    case_type = case_data.get('caseType')
-                    
-                    if action_panel_message_id and case_id and case_type:
-                        # Re-register the courtroom action panel view (in the private thread)
-                        self.add_view(CourtroomActionPanel(case_id, case_type), message_id=action_panel_message_id)
-                        print(f"[OK] Re-registered courtroom action panel for case {case_id}")
-                    else:
-                        print(f"[DEBUG] Case {case_id} missing actionPanelMessageId, skipping re-registration")
-                
-                if case_count == 0:
-                    print("[DEBUG] No pending court cases found for re-registration")
-                else:
-                    print(f"[OK] Re-registered {case_count} court case(s)")
-            except Exception as e:
-                print(f"[WARN] Could not reload court case views: {e}")
-                import traceback
-                traceback.print_exc()
+        # First ready only: report how long module load + connect took
+        if not self.commands_synced:
+            STARTUP_TIMINGS.append(("ready: login + gateway connect", time.perf_counter() - _startup_last_mark))
+            print(f"[OK] Ready {time.perf_counter() - STARTUP_T0:.2f}s after process start\n{startup_report()}")
         
-        # Re-register persistent views for active trial threads
-        if db:
-            try:
-                trials_list = await asyncio.to_thread(lambda: list(db.collection(COURT_CASES_COLLECTION).where(filter=FieldFilter('trialThreadId', '!=', None)).stream()))
-                for doc in trials_list:
-                    case_data = doc.to_dict()
-                    case_id = case_data.get('caseId') or case_data.get('id')  # Support both new and legacy schemas
-                    trial_thread_id = case_data.get('trialThreadId')
-                    
-                    if trial_thread_id and case_id:
-                        # Re-register the trial action view for the trial thread
-                        # We need to find the message in the thread (it should be the first message from the bot)
-                        try:
-                            thread = await self.fetch_channel(trial_thread_id)
-                            async for message in thread.history(limit=10, oldest_first=True):
-                                if message.author == self.user and len(message.embeds) > 0:
-                                    # This is likely the trial introduction message
-                                    self.add_view(TrialActionView(case_id), message_id=message.id)
-                                    print(f"[OK] Re-registered trial view for case {case_id}")
-                                    break
-                        except Exception as e:
-                            print(f"[WARN] Could not re-register trial view for case {case_id}: {e}")
-            except Exception as e:
-                print(f"[WARN] Could not reload trial views: {e}")
+        # Command sync is hash-gated and runs in the background on the first ready only;
+        # reconnects skip it entirely (use /admin sync_commands to force a sync)
+        if not self.commands_synced:
+            self.commands_synced = True
+            self.loop.create_task(self.sync_commands())
         
-        # Re-register BillConsole views for active bills (voting, passed, and law)
-        if db:
-            try:
-                voting_bills_list = await asyncio.to_thread(lambda: list(db.collection(BILL_COLLECTION_NAME).where(
-                    filter=FieldFilter('status', 'in', ['Voting', 'Vetoed', 'Passed', 'Bill is Now Law'])
-                ).stream()))
-                
-                for doc in voting_bills_list:
-                    bill_data = doc.to_dict()
-                    bill_id = bill_data.get('id')
-                    message_id = bill_data.get('messageId')
-                    
-                    if bill_id and message_id:
-                        # Re-register the voting console
-                        self.add_view(BillConsole(bill_id), message_id=int(message_id))
-                        print(f"[OK] Re-registered voting panel for bill {bill_id}")
-            except Exception as e:
-                print(f"[WARN] Could not reload voting bills: {e}")
+        # Role changes made while disconnected produce no events - rebuild the officials snapshot
+        self.schedule_officials_sync()
         
-        print("[OK] Background view re-registration completed!")
-    
-    async def on_ready(self):
-        """Minimal on_ready - immediately ready for slash commands"""
-        # Install asyncio exception handler
-        loop = asyncio.get_event_loop()
-        loop.set_exception_handler(asyncio_exception_handler)
-        print(f"[OK] Installed asyncio exception handler")
+        # Schedule view re-registration as background task - DON'T BLOCK ON IT
+        self.loop.create_task(self.rehydrate_views())
+        print("[INFO] Scheduled background view re-registration task")
         
-        print(f"[OK] Logged in as {self.user}")
+        # Bot is now ready - slash commands will respond immediately
+    
+    def command_tree_hash(self, guild=None) -> str:
+        """Stable SHA-256 of the serialized command tree (global scope when guild is None)"""
+        payload = [command.to_dict(self.tree) for command in self.tree.get_commands(guild=guild)]
+        payload.sort(key=lambda c: (c.get('type', 1), c.get('name', '')))
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    
+    async def sync_commands(self, force: bool = False) -> dict:
+        """
+        Sync application commands to each guild (and globally) only when the command
+        tree hash differs from the one stored at the last successful sync.
         
-        # Guild-specific sync for instant command updates (no 1-hour cache delay)
-        try:
-            # Copy global commands to each guild and sync for instant updates
-            for guild in self.guilds:
+        Returns {scope: 'synced' | 'unchanged' | 'failed: <error>'}.
+        """
+        async with self.command_sync_lock:
+            results = {}
+            stored = {}
+            if db and not force:
+                try:
+                    docs = await asyncio.to_thread(lambda: list(db.collection(COMMAND_SYNC_COLLECTION).stream()))
+                    stored = {doc.id: doc.to_dict().get('hash') for doc in docs}
+                except Exception as e:
+                    print(f"[WARN] Could not load stored command hashes, syncing everything: {e}")
+            
+            async def sync_scope(scope_key, scope_name, guild=None):
+                tree_hash = self.command_tree_hash(guild)
+                if not force and stored.get(scope_key) == tree_hash:
+                    results[scope_name] = 'unchanged'
+                    return
                 try:
-                    self.tree.copy_global_to(guild=guild)
                     synced = await self.tree.sync(guild=guild)
-                    print(f"[OK] Synced {len(synced)} commands to guild: {guild.name}")
+                    results[scope_name] = 'synced'
+                    print(f"[OK] Synced {len(synced)} commands to {scope_name}")
                 except Exception as e:
-                    print(f"[WARN] Failed to sync to guild {guild.name}: {e}")
+                    results[scope_name] = f"failed: {e}"
+                    print(f"[WARN] Failed to sync commands to {scope_name}: {e}")
+                    return
+                if db:
+                    try:
+                        await asyncio.to_thread(lambda: db.collection(COMMAND_SYNC_COLLECTION).document(scope_key).set({
+                            'hash': tree_hash,
+                            'scope': scope_name,
+                            'syncedAt': datetime.now(timezone.utc)
+                        }))
+                    except Exception as e:
+                        print(f"[WARN] Could not store command hash for {scope_name}: {e}")
             
-            # Also do global sync as backup for any new guilds
-            try:
-                global_synced = await self.tree.sync()
-                print(f"[OK] Global sync: {len(global_synced)} commands")
-            except Exception as e:
-                print(f"[WARN] Global sync failed: {e}")
-                
-        except Exception as e:
-            print(f"[ERR] Command sync failed: {e}")
-        
-        # Schedule view re-registration as background task - DON'T BLOCK ON IT
-        self.loop.create_task(self.rehydrate_views())
-        print("[INFO] Scheduled background view re-registration task")
-        
-        # Bot is now ready - slash commands will respond immediately
+            # Guild-specific sync for instant command updates (no 1-hour cache delay).
+            # copy_global_to only merges, so clear first: commands removed from the global
+            # tree (disabled subsystems) must disappear from the guild copy too.
+            for guild in self.guilds:
+                self.tree.clear_commands(guild=guild)
+                self.tree.copy_global_to(guild=guild)
+                await sync_scope(str(guild.id), f"guild {guild.name}", guild)
+            
+            # Also keep the global scope current as a backup for any new guilds
+            await sync_scope('global', 'global')
+            
+            unchanged = sum(1 for r in results.values() if r == 'unchanged')
+            print(f"[OK] Command sync finished: {len(results) - unchanged} scope(s) synced, {unchanged} unchanged")
+            return results
     
     async def on_error(self, event, *args, **kwargs):
         """Global error handler to prevent bot crashes"""
@@ -1134,13 +1900,31 @@ class RoyalCouncilBot(commands.Bot):
         # Don't crash - just log
     
     async def setup_hook(self):
-        """Setup hook - ONLY for error handling. All view registration happens in background task."""
+        """Setup hook - subsystem gating, error handling and background tasks. All view registration happens in background task."""
+        apply_subsystem_gates()
+        
+        # One pattern-matched handler per control type serves every bill / case message
+        self.add_dynamic_items(*BILL_CONSOLE_ITEMS, LawyerCaseClaimButton)
+        
+        # Components of disabled subsystems are refused before dispatch (metrics still count them)
+        install_subsystem_gate(self)
+        
+        # Latency / Firestore cost per command, component and modal
+        interaction_metrics.install(self)
+        if METRICS_PORT:
+            asyncio.create_task(interaction_metrics.serve())
+        
         @self.tree.error
         async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
             """Handle slash command errors without crashing"""
             import traceback
             command_name = interaction.command.name if interaction.command else 'unknown'
             
+            # Feed unhandled database failures to the health monitor (only Google client
+            # connection errors count - Firestore is the bot's only Google client)
+            firestore_health.record_failure(getattr(error, 'original', error))
+            interaction_metrics.record_error()
+            
             # Log detailed error information
             print(f"[ERR] ========== SLASH COMMAND ERROR ==========")
             print(f"[ERR] Command: /{command_name}")
@@ -1164,595 +1948,489 @@ class RoyalCouncilBot(commands.Bot):
                 pass  # If we can't respond, at least we logged the error
         
         # Start background tasks
-        if not self.auto_finalize_bills.is_running():
-            self.auto_finalize_bills.start()
-            print("[OK] Auto-finalization task started (checks every 5 minutes)")
-        
-        # Start vote reminder task
-        if not self.vote_reminder_task.is_running():
-            self.vote_reminder_task.start()
-            print("[OK] Vote reminder task started (runs every 2 hours)")
-        
-        # Start panel job processor
-        if not self.panel_job_processor.is_running():
-            self.panel_job_processor.start()
-            print("[OK] Panel job processor started (polls every 30 seconds)")
-        
-        # Start pearl essence decrement task
-        if not self.decrement_pearl_essence.is_running():
-            self.decrement_pearl_essence.start()
-            print("[OK] Pearl essence decrement task started (runs hourly)")
-        
-        if not self.expire_criminal_records.is_running():
-            self.expire_criminal_records.start()
-            print("[OK] Criminal record expiry task started (runs every 6 hours)")
-        
-        if not self.sync_government_officials.is_running():
-            self.sync_government_officials.start()
-            print("[OK] Government officials sync task started (runs every 10 minutes)")
-        
-        # Referendum system removed
-
-    @tasks.loop(minutes=5)
-    async def auto_finalize_bills(self):
-        """Check for bills that have been open for 24+ hours and auto-finalize them"""
-        if not db:
+        # Vote reminders (18h) and auto-finalization (24h) fire on exact deadlines
+        bill_deadlines.start()
+        print("[OK] Bill deadline scheduler started (reminders at 18h, auto-finalize at 24h)")
+        
+        # Law library index (built once ready; status changes keep it current)
+        law_index.start()
+        
+        # Search fields for court cases filed before case search existed (one-time)
+        asyncio.create_task(backfill_case_search_index())
+        
+        # Start panel job workers (event-driven)
+        asyncio.create_task(self.start_panel_job_workers())
+        
+        # Periodic jobs: panel job sweep (2 min), pearl essence (hourly, pearls subsystem),
+        # criminal record expiry (next expiresAt, ≤6h), Firestore idle probe
+        task_scheduler.start(self)
+
+    # ---------- PANEL JOB QUEUE ----------
+    # Jobs live in PANEL_JOBS_COLLECTION (durable) and are pushed onto an in-process
+    # asyncio queue by enqueue_panel_job() and by a snapshot listener (jobs written
+    # by other processes). Workers claim a job with a lease before running it, so a
+    # job seen by several processes only runs once; expired leases are reclaimed by
+    # the sweep task.
+    
+    def queue_panel_job(self, job_id: str, delay: float = 0):
+        """Hand a job ID to the local workers (optionally after a backoff delay)"""
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, self.queue_panel_job, job_id)
+        elif job_id not in self.panel_jobs_queued:
+            self.panel_jobs_queued.add(job_id)
+            self.panel_job_queue.put_nowait(job_id)
+    
+    async def start_panel_job_workers(self):
+        """Start the worker pool and snapshot listener once the gateway is ready"""
+        await self.wait_until_ready()
+        if self.panel_job_workers:
             return
         
-        try:
-            # Query for bills in Voting or Vetoed status (use UTC timezone-aware datetime)
-            now = datetime.now(timezone.utc)
-            cutoff = now - timedelta(hours=24)
-            
-            # Get all active voting bills
-            q_list = await asyncio.to_thread(lambda: list(db.collection(BILL_COLLECTION_NAME).where(filter=FieldFilter('status', 'in', ['Voting', 'Vetoed'])).stream()))
-            
-            for doc in q_list:
-                bill = doc.to_dict()
-                voting_start = bill.get('votingStartAt')
-                
-                # Skip if no timestamp (old bills before this feature)
-                if not voting_start:
-                    continue
-                
-                # Check if 24 hours have passed
-                if voting_start < cutoff:
-                    bill_id = bill.get('id', 'UNKNOWN')
-                    print(f"[AUTO-FINALIZE] Processing bill {bill_id} (started {voting_start})")
-                    
-                    # Get the guild and channel from stored IDs
-                    guild_id = bill.get('guildId', 0)
-                    channel_id = bill.get('channelId', 0)
-                    
-                    guild = self.get_guild(guild_id) if guild_id else None
-                    channel = self.get_channel(channel_id) if channel_id else None
-                    
-                    # Fallback if stored IDs don't work
-                    if not guild and self.guilds:
-                        guild = self.guilds[0]
-                    if not channel and guild:
-                        channel = next((ch for ch in guild.text_channels if ch.permissions_for(guild.me).send_messages), None)
-                    
-                    if channel:
-                        success, message = await finalize_bill(doc.reference, bill, guild, channel, is_auto=True)
-                        if success:
-                            print(f"[AUTO-FINALIZE] ✅ Finalized bill {bill_id}")
-                        else:
-                            print(f"[AUTO-FINALIZE] ⚠️ Could not finalize bill {bill_id}: {message}")
-                    else:
-                        print(f"[AUTO-FINALIZE] ⚠️ No channel available for bill {bill_id}")
+        for i in range(PANEL_JOB_WORKERS):
+            self.panel_job_workers.append(asyncio.create_task(self.panel_job_worker(i + 1)))
+        print(f"[OK] Panel job queue started ({PANEL_JOB_WORKERS} worker(s), {PANEL_JOB_TIMEOUT}s timeout)")
         
-        except Exception as e:
-            print(f"[AUTO-FINALIZE] Error: {e}")
+        self.watch_panel_jobs()
+        await self.sweep_panel_jobs()
     
-    @auto_finalize_bills.before_loop
-    async def before_auto_finalize(self):
-        await self.wait_until_ready()
-    
-    @auto_finalize_bills.error
-    async def auto_finalize_error(self, error):
-        """Handle errors in auto_finalize_bills task"""
-        logger.error(f"Background task 'auto_finalize_bills' crashed: {error}", exc_info=error)
-
-    @tasks.loop(hours=2)
-    async def vote_reminder_task(self):
-        """Remind councilors about bills approaching deadline (18+ hours old)"""
-        if not db:
-            return
+    def watch_panel_jobs(self):
+        """Subscribe to pending jobs so jobs enqueued by other processes start immediately"""
+        if self.panel_job_watch_db is db:
+            return  # Already watching this client
+        if not hasattr(db.collection(PANEL_JOBS_COLLECTION), 'on_snapshot'):
+            return  # In-memory storage: every job is enqueued locally
         
-        try:
-            now = datetime.now(timezone.utc)
-            reminder_threshold = now - timedelta(hours=18)
-            
-            q_list = await asyncio.to_thread(
-                lambda: list(db.collection(BILL_COLLECTION_NAME).where(
-                    filter=FieldFilter('status', '==', 'Voting')
-                ).stream())
-            )
-            
-            for doc in q_list:
-                bill = doc.to_dict()
-                voting_start = bill.get('votingStartAt')
-                
-                if not voting_start:
-                    continue
-                
-                if hasattr(voting_start, 'replace') and voting_start.tzinfo is None:
-                    voting_start = voting_start.replace(tzinfo=timezone.utc)
-                
-                if voting_start < reminder_threshold:
-                    if bill.get('reminderSent'):
-                        continue
-                    
-                    bill_id = bill.get('id', 'UNKNOWN')
-                    guild_id = bill.get('guildId', 0)
-                    channel_id = bill.get('channelId', 0)
-                    
-                    guild = self.get_guild(guild_id) if guild_id else None
-                    channel = self.get_channel(channel_id) if channel_id else None
-                    
-                    if channel and guild:
-                        votes = bill.get('votes', {'yes': [], 'no': [], 'abstain': []})
-                        voted_ids = set(votes.get('yes', []) + votes.get('no', []) + votes.get('abstain', []))
-                        
-                        councilor_role = guild.get_role(ROYAL_COUNCILOR_ROLE_ID)
-                        if councilor_role:
-                            not_voted = [m for m in councilor_role.members if m.id not in voted_ids]
-                            not_voted_count = len(not_voted)
-                            
-                            if not_voted_count > 0:
-                                bill_title = bill.get('title', 'Untitled')
-                                await channel.send(
-                                    f"**Vote Reminder!** <@&{ROYAL_COUNCILOR_ROLE_ID}>\n\n"
-                                    f"**{bill_title}** has {not_voted_count} councilor(s) who haven't voted yet.\n"
-                                    f"Voting closes automatically in ~6 hours.\n"
-                                    f"Bill ID: \`{bill_id}\`"
-                                )
-                                
-                                await asyncio.to_thread(lambda: doc.reference.update({'reminderSent': True}))
-                                print(f"[REMINDER] Sent vote reminder for bill {bill_id}")
+        loop = asyncio.get_running_loop()
+        
+        def on_snapshot(docs, changes, read_time):
+            # Runs on a Firestore watch thread - hop back onto the event loop
+            for change in changes:
+                if change.type.name in ('ADDED', 'MODIFIED'):
+                    loop.call_soon_threadsafe(self.queue_panel_job, change.document.id)
         
+        try:
+            if self.panel_job_watch:
+                self.panel_job_watch.unsubscribe()
+            self.panel_job_watch = db.collection(PANEL_JOBS_COLLECTION).where(
+                filter=FieldFilter('status', '==', 'pending')
+            ).on_snapshot(on_snapshot)
+            self.panel_job_watch_db = db
+            print("[OK] Panel job snapshot listener attached")
         except Exception as e:
-            print(f"[REMINDER] Error: {e}")
+            print(f"[WARN] Panel job listener unavailable, relying on sweep: {e}")
     
-    @vote_reminder_task.before_loop
-    async def before_vote_reminder(self):
-        await self.wait_until_ready()
-    
-    @vote_reminder_task.error
-    async def vote_reminder_error(self, error):
-        logger.error(f"Background task 'vote_reminder_task' crashed: {error}", exc_info=error)
-
+    async def sweep_panel_jobs(self):
+        """Queue pending jobs and jobs whose lease expired (worker crashed or process died)"""
+        current_db = await ensure_firestore()
+        now = datetime.now(timezone.utc)
+        
+        pending = await firestore_call(lambda: list(current_db.collection(PANEL_JOBS_COLLECTION).where(
+            filter=FieldFilter('status', '==', 'pending')
+        ).stream()))
+        # Needs a composite index on (status, leaseExpiresAt)
+        stale = await firestore_call(lambda: list(current_db.collection(PANEL_JOBS_COLLECTION).where(
+            filter=FieldFilter('status', '==', 'processing')
+        ).where(filter=FieldFilter('leaseExpiresAt', '<', now)).stream()))
+        
+        for job_doc in pending + stale:
+            available_at = job_doc.to_dict().get('availableAt')
+            delay = (available_at - now).total_seconds() if available_at else 0
+            self.queue_panel_job(job_doc.id, max(delay, 0))
+        
+        if stale:
+            print(f"[PANEL-JOB] Reclaiming {len(stale)} job(s) with expired leases")
     
-    @tasks.loop(minutes=5)
-    async def auto_close_referendums(self):
-        """Check for expired referendums and announce results"""
-        if not db:
+    @task_scheduler.job(minutes=2)
+    async def panel_job_processor(self):
+        """Safety-net sweep: reattach the listener after client rebuilds and requeue missed/stale jobs"""
+        if not db or not self.panel_job_workers:
             return
         
-        try:
+        self.watch_panel_jobs()
+        await self.sweep_panel_jobs()
+    
+    def claim_panel_job(self, current_db, job_id: str):
+        """
+        Take the lease on a job (blocking - run in a thread). Returns the job data,
+        or None if it is gone, finished, backing off or leased by another worker.
+        """
+        job_ref = current_db.collection(PANEL_JOBS_COLLECTION).document(job_id)
+        
+        def try_claim(snapshot, write):
+            if not snapshot.exists:
+                return None
+            job_data = snapshot.to_dict()
             now = datetime.now(timezone.utc)
-            
-            # Get all active referendums - wrap blocking .stream() call
-            q_list = await asyncio.to_thread(lambda: list(db.collection(REFERENDUMS_COLLECTION).where(filter=FieldFilter('status', '==', 'active')).stream()))
-            
-            for doc in q_list:
-                ref_data = doc.to_dict()
-                end_time = ref_data.get('endTime')
-                
-                # Check if voting period has ended
-                if end_time and now > end_time:
-                    ref_id = ref_data.get('id', 'UNKNOWN')
-                    print(f"[AUTO-CLOSE] Processing referendum {ref_id}")
-                    
-                    # Calculate results
-                    votes = ref_data.get('votes', {'yes': [], 'no': [], 'abstain': []})
-                    yes_count = len(votes['yes'])
-                    no_count = len(votes['no'])
-                    abstain_count = len(votes['abstain'])
-                    total_votes = yes_count + no_count + abstain_count
-                    
-                    # Determine outcome (simple majority)
-                    passed = yes_count > no_count
-                    
-                    # Update status
-                    await asyncio.to_thread(lambda: doc.reference.update({'status': 'closed', 'result': 'passed' if passed else 'failed'}))
-                    
-                    # Post results in referendum channel
-                    channel = self.get_channel(REFERENDUM_CHANNEL_ID)
-                    if channel:
-                        try:
-                            # Convert end time to EST
-                            est_tz = timezone(timedelta(hours=-5))
-                            end_time_est = end_time.astimezone(est_tz)
-                            
-                            result_embed = discord.Embed(
-                                title=f"📜 REFERENDUM RESULTS #{ref_id}",
-                                description=f"**{ref_data.get('title')}**\n\n{ref_data.get('description')}",
-                                color=0x00FF00 if passed else 0xFF0000
-                            )
-                            result_embed.add_field(name="Result", value="✅ **PASSED**" if passed else "❌ **FAILED**", inline=False)
-                            result_embed.add_field(name="✅ Yes", value=str(yes_count), inline=True)
-                            result_embed.add_field(name="❌ No", value=str(no_count), inline=True)
-                            result_embed.add_field(name="⏸️ Abstain", value=str(abstain_count), inline=True)
-                            result_embed.add_field(name="Total Votes", value=str(total_votes), inline=True)
-                            result_embed.add_field(name="Voting Closed", value=end_time_est.strftime("%b %d, %Y at %I:%M %p EST"), inline=True)
-                            result_embed.set_footer(text=f"Referendum ID: {ref_id}")
-                            
-                            await channel.send(f"<@&{REFERENDUM_VOTER_ROLE_ID}> **Referendum Closed!**", embed=result_embed)
-                            print(f"[AUTO-CLOSE] ✅ Closed referendum {ref_id} - {'PASSED' if passed else 'FAILED'}")
-                        except Exception as e:
-                            print(f"[AUTO-CLOSE] ⚠️ Error posting results for {ref_id}: {e}")
-                    else:
-                        print(f"[AUTO-CLOSE] ⚠️ Referendum channel not found")
+            status = job_data.get('status')
+            if status == 'processing':
+                lease = job_data.get('leaseExpiresAt')
+                if lease and lease > now:
+                    return None
+            elif status != 'pending':
+                return None
+            available_at = job_data.get('availableAt')
+            if available_at and available_at > now:
+                return None
+            claim = {
+                'status': 'processing',
+                'processedAt': now,
+                'leaseOwner': PANEL_JOB_WORKER_ID,
+                'leaseExpiresAt': now + timedelta(seconds=PANEL_JOB_TIMEOUT + 60),
+                'attempts': job_data.get('attempts', 0) + 1,
+            }
+            write(claim)
+            job_data.update(claim)
+            return job_data
         
-        except Exception as e:
-            print(f"[AUTO-CLOSE] Error: {e}")
-    
-    @auto_close_referendums.before_loop
-    async def before_auto_close(self):
-        await self.wait_until_ready()
+        if isinstance(current_db, InMemoryDB):
+            return try_claim(job_ref.get(), job_ref.update)
+        
+        @firestore.transactional
+        def claim_in_transaction(transaction):
+            snapshot = job_ref.get(transaction=transaction)
+            return try_claim(snapshot, lambda data: transaction.update(job_ref, data))
+        
+        return claim_in_transaction(current_db.transaction())
     
-    @auto_close_referendums.error
-    async def auto_close_error(self, error):
-        """Handle errors in auto_close_referendums task"""
-        logger.error(f"Background task 'auto_close_referendums' crashed: {error}", exc_info=error)
+    async def panel_job_worker(self, worker_no: int):
+        """Pull job IDs off the local queue and run them one at a time"""
+        while True:
+            job_id = await self.panel_job_queue.get()
+            self.panel_jobs_queued.discard(job_id)
+            try:
+                await self.run_panel_job(job_id)
+            except Exception as e:
+                print(f"[PANEL-JOB] Worker {worker_no} error on job {job_id}: {e}")
+            finally:
+                self.panel_job_queue.task_done()
     
-    @tasks.loop(seconds=30)
-    async def panel_job_processor(self):
-        """Process pending panel posting jobs from queue"""
-        if not db:
+    async def run_panel_job(self, job_id: str):
+        """Claim, execute (with timeout) and settle a single panel job"""
+        current_db = await ensure_firestore()
+        # In-memory claims run inline so two workers can't interleave the read and write
+        if isinstance(current_db, InMemoryDB):
+            job_data = self.claim_panel_job(current_db, job_id)
+        else:
+            job_data = await firestore_call(self.claim_panel_job, current_db, job_id)
+        if not job_data:
             return
         
+        job_ref = current_db.collection(PANEL_JOBS_COLLECTION).document(job_id)
+        panel_type, guild_id, channel_id = panel_job_target(job_data)
+        attempts = job_data['attempts']
+        
         try:
-            # Ensure Firestore client is healthy before querying
-            current_db = await ensure_firestore()
+            # Get guild and channel
+            guild = self.get_guild(guild_id)
+            if not guild:
+                raise PanelJobFailed(f"Guild {guild_id} not found")
+            
+            channel = guild.get_channel(channel_id)
+            if not channel:
+                raise PanelJobFailed(f"Channel {channel_id} not found")
+            
+            # Process based on panel type
+            if panel_type == 'pearl':
+                handler = self.process_pearl_panel_job
+            elif panel_type == 'warrant':
+                handler = self.process_warrant_panel_job
+            elif panel_type == 'economy':
+                handler = self.process_economy_panel_job
+            else:
+                raise PanelJobFailed(f"Unknown panel type: {panel_type}")
             
-            # Get pending jobs - wrap blocking .stream() call
-            pending_jobs = await asyncio.to_thread(lambda: list(current_db.collection(PANEL_JOBS_COLLECTION).where(
-                filter=FieldFilter('status', '==', 'pending')
-            ).limit(5).stream()))
-            
-            for job_doc in pending_jobs:
-                job_data = job_doc.to_dict()
-                job_id = job_doc.id
-                panel_type = job_data.get('panel_type')  # 'pearl' or 'warrant'
-                guild_id = job_data.get('guild_id')
-                channel_id = job_data.get('channel_id')
-                user_id = job_data.get('user_id')
-                
-                # Mark as processing
-                await asyncio.to_thread(lambda: job_doc.reference.update({'status': 'processing', 'processedAt': datetime.now(timezone.utc)}))
-                
-                try:
-                    # Get guild and channel
-                    guild = self.get_guild(guild_id)
-                    if not guild:
-                        raise Exception(f"Guild {guild_id} not found")
-                    
-                    channel = guild.get_channel(channel_id)
-                    if not channel:
-                        raise Exception(f"Channel {channel_id} not found")
-                    
-                    # Process based on panel type
-                    if panel_type == 'pearl':
-                        await self.process_pearl_panel_job(job_data, guild, channel)
-                    elif panel_type == 'warrant':
-                        await self.process_warrant_panel_job(job_data, guild, channel)
-                    elif panel_type == 'economy':
-                        await self.process_economy_panel_job(job_data, guild, channel)
-                    else:
-                        raise Exception(f"Unknown panel type: {panel_type}")
-                    
-                    # Mark as completed
-                    await asyncio.to_thread(lambda: job_doc.reference.update({'status': 'completed', 'completedAt': datetime.now(timezone.utc)}))
-                    print(f"[PANEL-JOB] ✅ Completed {panel_type} panel job {job_id}")
-                    
-                except Exception as job_err:
-                    # Mark as failed
-                    await asyncio.to_thread(lambda: job_doc.reference.update({
-                        'status': 'failed',
-                        'error': str(job_err),
-                        'failedAt': datetime.now(timezone.utc)
-                    }))
-                    print(f"[PANEL-JOB] ❌ Failed {panel_type} panel job {job_id}: {job_err}")
-                    
-        except Exception as e:
-            print(f"[PANEL-JOB] Error processing jobs: {e}")
-    
-    @panel_job_processor.before_loop
-    async def before_panel_jobs(self):
-        await self.wait_until_ready()
-    
-    @panel_job_processor.error
-    async def panel_job_error(self, error):
-        """Handle errors in panel_job_processor task"""
-        logger.error(f"Background task 'panel_job_processor' crashed: {error}", exc_info=error)
+            await asyncio.wait_for(handler(job_data, guild, channel), timeout=PANEL_JOB_TIMEOUT)
+            
+            # Mark as completed
+            await firestore_call(lambda: job_ref.update({
+                'status': 'completed',
+                'completedAt': datetime.now(timezone.utc),
+                'leaseExpiresAt': None
+            }))
+            print(f"[PANEL-JOB] ✅ Completed {panel_type} panel job {job_id} (attempt {attempts})")
+            
+        except Exception as job_err:
+            error = 'timed out' if isinstance(job_err, asyncio.TimeoutError) else str(job_err)
+            now = datetime.now(timezone.utc)
+            
+            # Missing guild/channel, bad type, deleted message or lost permissions won't fix themselves
+            retryable = attempts < PANEL_JOB_MAX_ATTEMPTS and not isinstance(job_err, PANEL_JOB_PERMANENT_ERRORS)
+            if retryable:
+                backoff = min(PANEL_JOB_BACKOFF_BASE * 2 ** (attempts - 1), PANEL_JOB_BACKOFF_MAX)
+                await firestore_call(lambda: job_ref.update({
+                    'status': 'pending',
+                    'error': error,
+                    'availableAt': now + timedelta(seconds=backoff),
+                    'leaseExpiresAt': None
+                }))
+                self.queue_panel_job(job_id, backoff)
+                print(f"[PANEL-JOB] ⚠️ {panel_type} panel job {job_id} failed (attempt {attempts}/{PANEL_JOB_MAX_ATTEMPTS}), retrying in {backoff}s: {error}")
+            else:
+                # Mark as failed
+                await firestore_call(lambda: job_ref.update({
+                    'status': 'failed',
+                    'error': error,
+                    'failedAt': now,
+                    'leaseExpiresAt': None
+                }))
+                print(f"[PANEL-JOB] ❌ Failed {panel_type} panel job {job_id}: {error}")
     
-    @tasks.loop(hours=1)
+    @task_scheduler.job(hours=1)
     async def decrement_pearl_essence(self):
-        """Hourly task to decrement essence for all active pearls (self-healing)"""
+        """Hourly task to auto-release pearls whose lazily evaluated essence has run out"""
         if not db:
             return
         
-        async with self.pearl_essence_lock:  # Prevent concurrent runs
-            try:
-                # Ensure Firestore client is healthy
-                current_db = await ensure_firestore()
-                
-                # Get all active pearls - wrap blocking .stream() call
-                active_pearls = await asyncio.to_thread(lambda: list(current_db.collection(PEARLS_COLLECTION).where(
-                    filter=FieldFilter('status', '==', 'active')
-                ).stream()))
-                
-                if not active_pearls:
-                    return
-                
-                now = datetime.now(timezone.utc)
-                batch_updates = []  # Collect updates for batched write
-                auto_releases = []  # Track auto-releases for alert
-                anomalies = []  # Track multi-day catch-ups
-                
-                for pearl_doc in active_pearls:
-                    pearl = pearl_doc.to_dict()
-                    ign = pearl.get('ign', 'UNKNOWN')
-                    last_update = pearl.get('lastEssenceUpdate')
-                    
-                    # Skip unmigrated pearls
-                    if not last_update:
-                        print(f"[ESSENCE-CRON] ⏭️ Skipping {ign}: Not migrated (no lastEssenceUpdate)")
-                        continue
-                    
-                    # Calculate elapsed days (self-healing: handles missed runs)
-                    elapsed_seconds = (now - last_update).total_seconds()
-                    elapsed_days = int(elapsed_seconds // 86400)
-                    
-                    if elapsed_days < 1:
-                        continue  # Not 24h yet
-                    
-                    # Get pearl data
-                    pearl_start = pearl.get('pearlStartDate')
-                    essence_remaining = pearl.get('essenceRemaining', 0.0)
-                    essence_capacity = pearl.get('essenceCapacity', 0.0)
-                    
-                    if not pearl_start:
-                        print(f"[ESSENCE-CRON] ⚠️ Skipping {ign}: No pearlStartDate")
-                        continue
-                    
-                    # Calculate total decrement for all elapsed days (self-healing)
-                    total_decrement = 0.0
-                    base_days_held = (last_update - pearl_start).days
-                    
-                    for day_offset in range(elapsed_days):
-                        days_held_at_that_point = base_days_held + day_offset + 1
-                        daily_cost = calculate_pearl_essence_cost(days_held_at_that_point)
-                        total_decrement += daily_cost
-                    
-                    new_essence = essence_remaining - total_decrement
-                    
-                    # Log anomalies (multi-day catch-up)
-                    if elapsed_days > 1:
-                        anomalies.append(f"{ign}: Caught up {elapsed_days} days ({total_decrement:.0f} es)")
-                    
-                    # Check if essence depleted (auto-release)
-                    if new_essence <= 0:
-                        batch_updates.append({
-                            'doc_ref': pearl_doc.reference,
-                            'data': {
-                                'status': 'released',
-                                'releasedAt': now,
-                                'releasedBy': 'SYSTEM',
-                                'releasedReason': 'Essence Depleted',
-                                'essenceRemaining': 0.0,
-                                'lastEssenceUpdate': now
-                            }
-                        })
-                        auto_releases.append(f"🔓 {ign} (essence depleted)")
-                        print(f"[ESSENCE-CRON] 🔓 Auto-released {ign}: essence depleted")
-                    else:
-                        # Normal decrement
-                        batch_updates.append({
-                            'doc_ref': pearl_doc.reference,
-                            'data': {
-                                'essenceRemaining': new_essence,
-                                'lastEssenceUpdate': now
-                            }
-                        })
-                        print(f"[ESSENCE-CRON] {ign}: {essence_remaining:.0f}/{essence_capacity:.0f} → {new_essence:.0f}/{essence_capacity:.0f} (-{total_decrement:.0f} es over {elapsed_days}d)")
-                
-                # Apply updates in batched writes (≤400 docs per batch)
-                BATCH_SIZE = 400
-                for i in range(0, len(batch_updates), BATCH_SIZE):
-                    chunk = batch_updates[i:i + BATCH_SIZE]
-                    batch = current_db.batch()
-                    
-                    for update in chunk:
-                        batch.update(update['doc_ref'], update['data'])
-                    
-                    try:
-                        await asyncio.to_thread(lambda: batch.commit())
-                        print(f"[ESSENCE-CRON] ✅ Committed batch {i//BATCH_SIZE + 1} ({len(chunk)} updates)")
-                    except Exception as batch_err:
-                        print(f"[ESSENCE-CRON] ❌ Batch commit failed, falling back to individual updates: {batch_err}")
-                        # Fallback to individual updates
-                        for update in chunk:
-                            try:
-                                await asyncio.to_thread(lambda u=update: u['doc_ref'].update(u['data']))
-                            except Exception as individual_err:
-                                print(f"[ESSENCE-CRON] ❌ Individual update failed: {individual_err}")
-                
-                # Send Discord alert for auto-releases (if any)
-                if auto_releases:
-                    # Try to find a staff/admin channel to post alert
-                    for guild in self.guilds:
-                        # Look for channels like "admin-alerts", "mod-chat", etc.
-                        alert_channel = discord.utils.get(guild.text_channels, name="admin-alerts") or \
-                                      discord.utils.get(guild.text_channels, name="mod-chat") or \
-                                      discord.utils.get(guild.text_channels, name="admin-chat")
-                        
-                        if alert_channel:
-                            alert_embed = discord.Embed(
-                                title="⚙️ PEARL AUTO-RELEASE ALERT",
-                                description="\n".join(auto_releases),
-                                color=discord.Color.orange()
-                            )
-                            alert_embed.set_footer(text=f"Released: {now.strftime('%b %d, %Y at %I:%M %p UTC')} | Automated System")
-                            try:
-                                await alert_channel.send(embed=alert_embed)
-                                break  # Only send to first guild with alert channel
-                            except Exception as alert_err:
-                                print(f"[ESSENCE-CRON] ⚠️ Failed to send alert: {alert_err}")
-                
-                # Log summary
-                if batch_updates:
-                    print(f"[ESSENCE-CRON] 📊 Summary: {len(batch_updates)} updates, {len(auto_releases)} auto-releases, {len(anomalies)} anomalies")
-                    if anomalies:
-                        for anomaly in anomalies:
-                            print(f"[ESSENCE-CRON] ⚠️ ANOMALY: {anomaly}")
-                
-            except Exception as e:
-                logger.error(f"[ESSENCE-CRON] Task error: {e}", exc_info=e)
-                print(f"[ESSENCE-CRON] ❌ Error: {e}")
-    
-    @decrement_pearl_essence.before_loop
-    async def before_essence_decrement(self):
-        await self.wait_until_ready()
-    
-    @decrement_pearl_essence.error
-    async def essence_decrement_error(self, error):
-        """Handle errors in decrement_pearl_essence task"""
-        logger.error(f"Background task 'decrement_pearl_essence' crashed: {error}", exc_info=error)
-
-    @tasks.loop(hours=6)
-    async def expire_criminal_records(self):
-        """Background task to auto-expire criminal records past their expiry date."""
-        await self.wait_until_ready()
-        try:
-            current_db = await ensure_firestore()
-            if not current_db:
-                return
+        # Ensure Firestore client is healthy
+        current_db = await ensure_firestore()
+        
+        # Get all active pearls - wrap blocking .stream() call
+        active_pearls = await firestore_call(lambda: list(current_db.collection(PEARLS_COLLECTION).where(
+            filter=FieldFilter('status', '==', 'active')
+        ).stream()))
+        
+        if not active_pearls:
+            return
+        
+        now = datetime.now(timezone.utc)
+        batch_updates = []  # Collect updates for batched write
+        auto_releases = []  # Track auto-releases for alert
+        
+        # essenceRemaining is a checkpoint evaluated lazily at read time, so only
+        # pearls whose fuel has run out are written (status change + final checkpoint)
+        for pearl_doc in active_pearls:
+            pearl = pearl_doc.to_dict()
+            ign = pearl.get('ign', 'UNKNOWN')
             
-            now = datetime.now(timezone.utc)
+            essence_remaining, checkpoint = pearl_essence_checkpoint(pearl, now)
+            if essence_remaining is None:
+                print(f"[ESSENCE-CRON] ⏭️ Skipping {ign}: Not migrated (no lastEssenceUpdate)")
+                continue
             
-            # Find all ACTIVE records that have expired
-            all_active = await asyncio.to_thread(lambda: list(
-                current_db.collection(CRIMINAL_RECORDS_COLLECTION).where(
-                    filter=FieldFilter('status', '==', 'ACTIVE')
-                ).stream()
-            ))
+            # Check if essence depleted (auto-release)
+            if essence_remaining <= 0:
+                batch_updates.append({
+                    'doc_ref': pearl_doc.reference,
+                    'data': {
+                        'status': 'released',
+                        'releasedAt': now,
+                        'releasedBy': 'SYSTEM',
+                        'releasedReason': 'Essence Depleted',
+                        'essenceRemaining': 0.0,
+                        'lastEssenceUpdate': checkpoint
+                    }
+                })
+                auto_releases.append(f"🔓 {ign} (essence depleted)")
+                print(f"[ESSENCE-CRON] 🔓 Auto-released {ign}: essence depleted")
+        
+        # Apply updates in batched writes (≤400 docs per batch)
+        BATCH_SIZE = 400
+        for i in range(0, len(batch_updates), BATCH_SIZE):
+            chunk = batch_updates[i:i + BATCH_SIZE]
+            batch = current_db.batch()
             
-            expired_count = 0
-            for rec_doc in all_active:
-                r = rec_doc.to_dict()
-                expires_at = r.get('expiresAt')
-                if expires_at:
-                    # Normalize Firestore timestamp to datetime
-                    if hasattr(expires_at, 'replace'):
-                        if expires_at.tzinfo is None:
-                            expires_at = expires_at.replace(tzinfo=timezone.utc)
-                    elif hasattr(expires_at, 'timestamp'):
-                        expires_at = datetime.fromtimestamp(expires_at.timestamp(), tz=timezone.utc)
-                    
-                    if expires_at <= now:
-                        await asyncio.to_thread(lambda doc=rec_doc: doc.reference.update({
-                        'status': 'EXPIRED',
-                        'autoExpiredAt': now
-                    }))
-                    expired_count += 1
-                    print(f"[OK] Auto-expired criminal record {rec_doc.id} for {r.get('ign')}")
+            for update in chunk:
+                batch.update(update['doc_ref'], update['data'])
             
-            if expired_count > 0:
-                print(f"[INFO] Criminal record sweep: {expired_count} records auto-expired")
+            try:
+                await firestore_call(lambda: batch.commit())
+                print(f"[ESSENCE-CRON] ✅ Committed batch {i//BATCH_SIZE + 1} ({len(chunk)} updates)")
+            except Exception as batch_err:
+                print(f"[ESSENCE-CRON] ❌ Batch commit failed, falling back to individual updates: {batch_err}")
+                # Fallback to individual updates
+                for update in chunk:
+                    try:
+                        await firestore_call(lambda u=update: u['doc_ref'].update(u['data']))
+                    except Exception as individual_err:
+                        print(f"[ESSENCE-CRON] ❌ Individual update failed: {individual_err}")
+        
+        # Send Discord alert for auto-releases (if any)
+        if auto_releases:
+            # Try to find a staff/admin channel to post alert
+            for guild in self.guilds:
+                # Look for channels like "admin-alerts", "mod-chat", etc.
+                alert_channel = discord.utils.get(guild.text_channels, name="admin-alerts") or \
+                              discord.utils.get(guild.text_channels, name="mod-chat") or \
+                              discord.utils.get(guild.text_channels, name="admin-chat")
                 
-        except Exception as e:
-            print(f"[ERR] Criminal record expiry task failed: {e}")
+                if alert_channel:
+                    alert_embed = discord.Embed(
+                        title="⚙️ PEARL AUTO-RELEASE ALERT",
+                        description="\n".join(auto_releases),
+                        color=discord.Color.orange()
+                    )
+                    alert_embed.set_footer(text=f"Released: {now.strftime('%b %d, %Y at %I:%M %p UTC')} | Automated System")
+                    try:
+                        await alert_channel.send(embed=alert_embed)
+                        break  # Only send to first guild with alert channel
+                    except Exception as alert_err:
+                        print(f"[ESSENCE-CRON] ⚠️ Failed to send alert: {alert_err}")
+        
+        # Log summary
+        if batch_updates:
+            print(f"[ESSENCE-CRON] 📊 Summary: {len(active_pearls)} pearls checked, {len(auto_releases)} auto-releases")
     
-    @expire_criminal_records.error
-    async def expire_criminal_records_error(self, error):
-        logger.error(f"Background task 'expire_criminal_records' crashed: {error}", exc_info=error)
-
-    @tasks.loop(minutes=10)
-    async def sync_government_officials(self):
-        """Background task to sync government officials from Discord roles to Firestore for website."""
-        await self.wait_until_ready()
+    @task_scheduler.job(seconds=RECORD_EXPIRY_MAX_SLEEP)
+    async def expire_criminal_records(self):
+        """
+        Expire ACTIVE criminal records whose expiresAt has passed, then sleep until
+        the next expiresAt (capped at RECORD_EXPIRY_MAX_SLEEP).
+        
+        Both queries need a composite index on florabi_criminal_records:
+        status ASC, expiresAt ASC.
+        """
+        current_db = await ensure_firestore()
+        if not current_db:
+            return
+        
+        now = datetime.now(timezone.utc)
+        records = current_db.collection(CRIMINAL_RECORDS_COLLECTION)
+        
+        # Only records that are actually due
+        expired = await asyncio.to_thread(lambda: list(
+            records.where(filter=FieldFilter('status', '==', 'ACTIVE'))
+            .where(filter=FieldFilter('expiresAt', '<=', now))
+            .stream()
+        ))
+        
+        # Commit expirations in WriteBatch chunks (≤400 writes per batch)
+        BATCH_SIZE = 400
+        for i in range(0, len(expired), BATCH_SIZE):
+            chunk = expired[i:i + BATCH_SIZE]
+            batch = current_db.batch()
+            for rec_doc in chunk:
+                batch.update(rec_doc.reference, {'status': 'EXPIRED', 'autoExpiredAt': now})
+            await asyncio.to_thread(batch.commit)
+            for rec_doc in chunk:
+                print(f"[OK] Auto-expired criminal record {rec_doc.id} for {rec_doc.to_dict().get('ign')}")
+        
+        if expired:
+            print(f"[INFO] Criminal record sweep: {len(expired)} records auto-expired")
+        
+        # Wake up again exactly when the next record is due
+        upcoming = await asyncio.to_thread(lambda: list(
+            records.where(filter=FieldFilter('status', '==', 'ACTIVE'))
+            .where(filter=FieldFilter('expiresAt', '>', now))
+            .order_by('expiresAt')
+            .limit(1)
+            .stream()
+        ))
+        next_expiry = upcoming[0].to_dict().get('expiresAt') if upcoming else None
+        delay = (next_expiry - now).total_seconds() if next_expiry else RECORD_EXPIRY_MAX_SLEEP
+        self.expire_criminal_records.change_interval(seconds=min(max(delay, 1), RECORD_EXPIRY_MAX_SLEEP))
+        if next_expiry:
+            print(f"[INFO] Next criminal record expiry check at {next_expiry.strftime('%Y-%m-%d %H:%M UTC')}")
+    
+    def schedule_record_expiry(self, expires_at: datetime):
+        """Pull the expiry sweep forward if a record now expires before the next scheduled check"""
+        loop = self.expire_criminal_records
+        if not loop.is_running() or not loop.next_iteration or not expires_at:
+            return
+        if expires_at < loop.next_iteration:
+            # Intervals are relative to the start of the last sweep
+            last_sweep = loop.next_iteration - timedelta(seconds=loop.seconds)
+            loop.change_interval(seconds=max((expires_at - last_sweep).total_seconds(), 1))
+
+    # ---------- GOVERNMENT OFFICIALS SNAPSHOT ----------
+    # The website's officials list is rebuilt from the official roles' member lists
+    # only when a role change touches an official role (on_member_update /
+    # on_member_remove) or the gateway session is (re)established, and written only
+    # when its hash differs from the last snapshot written.
+    
+    def official_role_ids(self) -> set:
+        return {SOBERANTE_ROLE_ID, ALCALDE_MAYOR_ROLE_ID, CAPITAN_ROLE_ID, ROYAL_COUNCILOR_ROLE_ID, MAGISTRATE_ROLE_ID}
+    
+    def schedule_officials_sync(self):
+        """Debounce bursts of role changes into a single snapshot rebuild"""
+        if self.officials_sync_handle:
+            self.officials_sync_handle.cancel()
+        loop = asyncio.get_running_loop()
+        self.officials_sync_handle = loop.call_later(
+            OFFICIALS_SYNC_DEBOUNCE, lambda: loop.create_task(self.sync_government_officials())
+        )
+    
+    def build_officials_snapshot(self, guild: discord.Guild) -> dict:
+        """Officials per role, from each role's member list"""
+        def members_of(role_id):
+            role = guild.get_role(role_id)
+            return role.members if role else []
+        
+        def first_name(role_id):
+            members = members_of(role_id)
+            return (members[-1].display_name or members[-1].name) if members else None
+        
+        magistrates = []
+        for member in members_of(MAGISTRATE_ROLE_ID):
+            # Determine magistrate type based on other roles
+            if member.get_role(SOBERANTE_ROLE_ID):
+                mag_type, mag_order = "supreme", 0  # Supreme Magistrate (Soberante)
+            elif member.get_role(ROYAL_COUNCILOR_ROLE_ID):
+                mag_type, mag_order = "council", 1  # Council Magistrate
+            else:
+                mag_type, mag_order = "citizen", 2  # Citizen Magistrate
+            magistrates.append({"name": member.display_name or member.name, "type": mag_type, "order": mag_order})
+        
+        return {
+            'soberante': first_name(SOBERANTE_ROLE_ID),
+            'alcalde_mayor': first_name(ALCALDE_MAYOR_ROLE_ID),
+            'capitan': first_name(CAPITAN_ROLE_ID),
+            # Sort councilors and magistrates alphabetically
+            'councilors': sorted(m.display_name or m.name for m in members_of(ROYAL_COUNCILOR_ROLE_ID)),
+            'magistrates': sorted(magistrates, key=lambda m: (m['order'], m['name'])),
+        }
+    
+    async def sync_government_officials(self) -> bool:
+        """Rebuild the officials snapshot and write it to Firestore if it changed. Returns True if written."""
         try:
             current_db = await ensure_firestore()
             if not current_db:
-                return
+                return False
             
             # Find the guild
-            guild = None
-            for g in self.guilds:
-                if g.get_role(SOBERANTE_ROLE_ID):
-                    guild = g
-                    break
-            
+            guild = next((g for g in self.guilds if g.get_role(SOBERANTE_ROLE_ID)), None)
             if not guild:
-                return
+                return False
             
-            officials_data = {
-                'soberante': None,
-                'alcalde_mayor': None,
-                'capitan': None,
-                'councilors': [],
-                'magistrates': [],
-                'last_sync': datetime.now(timezone.utc).isoformat()
-            }
+            officials_data = self.build_officials_snapshot(guild)
+            snapshot_hash = hashlib.sha256(json.dumps(officials_data, sort_keys=True).encode()).hexdigest()
+            doc_ref = current_db.collection('florabi_config').document('government_officials')
             
-            # Get members with each role
-            for member in guild.members:
-                role_ids = [r.id for r in member.roles]
-                display_name = member.display_name or member.name
-                
-                if SOBERANTE_ROLE_ID in role_ids:
-                    officials_data['soberante'] = display_name
-                
-                if ALCALDE_MAYOR_ROLE_ID in role_ids:
-                    officials_data['alcalde_mayor'] = display_name
-                
-                if CAPITAN_ROLE_ID in role_ids:
-                    officials_data['capitan'] = display_name
-                
-                if ROYAL_COUNCILOR_ROLE_ID in role_ids:
-                    officials_data['councilors'].append(display_name)
-                
-                if MAGISTRATE_ROLE_ID in role_ids:
-                    # Determine magistrate type based on other roles
-                    if SOBERANTE_ROLE_ID in role_ids:
-                        mag_type = "supreme"  # Supreme Magistrate (Soberante)
-                        mag_order = 0
-                    elif ROYAL_COUNCILOR_ROLE_ID in role_ids:
-                        mag_type = "council"  # Council Magistrate
-                        mag_order = 1
-                    else:
-                        mag_type = "citizen"  # Citizen Magistrate
-                        mag_order = 2
-                    officials_data["magistrates"].append({
-                        "name": display_name,
-                        "type": mag_type,
-                        "order": mag_order
-                    })
+            # After a restart, compare against the hash stored with the last write
+            if self.officials_hash is None:
+                stored = await asyncio.to_thread(doc_ref.get)
+                self.officials_hash = (stored.to_dict() or {}).get('snapshotHash', '') if stored.exists else ''
             
-            # Sort councilors and magistrates alphabetically
-            officials_data['councilors'].sort()
-            officials_data['magistrates'].sort(key=lambda m: m['order'])
+            if snapshot_hash == self.officials_hash:
+                return False
             
-            # Save to Firestore
-            await asyncio.to_thread(
-                lambda: current_db.collection('florabi_config').document('government_officials').set(officials_data)
-            )
+            # merge=True keeps fields maintained elsewhere (e.g. senators from /set_senators)
+            await asyncio.to_thread(lambda: doc_ref.set({
+                **officials_data,
+                'snapshotHash': snapshot_hash,
+                'last_sync': datetime.now(timezone.utc).isoformat()
+            }, merge=True))
+            self.officials_hash = snapshot_hash
             print(f"[OK] Synced government officials: Soberante={officials_data['soberante']}, {len(officials_data['councilors'])} councilors, {len(officials_data['magistrates'])} magistrates")
+            return True
             
         except Exception as e:
             print(f"[ERR] Government officials sync failed: {e}")
+            return False
     
-    @sync_government_officials.before_loop
-    async def before_sync_government_officials(self):
-        await self.wait_until_ready()
-    
-    @sync_government_officials.error
-    async def sync_government_officials_error(self, error):
-        logger.error(f"Background task 'sync_government_officials' crashed: {error}", exc_info=error)
+    @task_scheduler.job(seconds=FIRESTORE_IDLE_PROBE_SECONDS)
+    async def firestore_health_monitor(self):
+        """Probe Firestore only when idle, and rebuild the client once the breaker cooldown has passed"""
+        if isinstance(db, InMemoryDB):
+            return
+        
+        try:
+            if firestore_health.state == 'down':
+                if time.monotonic() >= firestore_health.open_until:
+                    await ensure_firestore()  # Rebuilds and verifies the client
+            elif firestore_health.idle():
+                await firestore_call(_firestore_probe, db)
+        except Exception as e:
+            print(f"[WARN] Firestore health probe failed ({firestore_health.state}): {e}")
     
     async def process_pearl_panel_job(self, job_data, guild, channel):
         """Process a pearl panel posting job with full retry logic"""
@@ -1762,7 +2440,7 @@ class RoyalCouncilBot(commands.Bot):
         current_db = await ensure_firestore()
         
         # Get active pearls - wrap blocking .stream() call
-        active_pearls = await asyncio.to_thread(lambda: list(current_db.collection(PEARLS_COLLECTION).where(
+        active_pearls = await firestore_call(lambda: list(current_db.collection(PEARLS_COLLECTION).where(
             filter=FieldFilter('status', '==', 'active')
         ).stream()))
         
@@ -1786,7 +2464,7 @@ class RoyalCouncilBot(commands.Bot):
                 if pearl_start and release_date:
                     days_held_so_far = (datetime.now(timezone.utc) - pearl_start).days
                     remaining_days = max((release_date - datetime.now(timezone.utc)).days, 0)
-                    essence_needed = sum(calculate_pearl_essence_cost(days_held_so_far + day + 1) for day in range(remaining_days))
+                    essence_needed = pearl_essence_between(days_held_so_far, days_held_so_far + remaining_days)
                     total_essence_remaining += essence_needed
                     daily_cost = calculate_pearl_essence_cost(days_held_so_far + 1)
                     daily_consumption += daily_cost
@@ -1807,7 +2485,7 @@ class RoyalCouncilBot(commands.Bot):
                     
                     # NEW ESSENCE SYSTEM: Read from database if available, otherwise calculate fallback
                     essence_capacity = pearl.get('essenceCapacity')
-                    essence_remaining = pearl.get('essenceRemaining')
+                    essence_remaining = pearl_essence_remaining(pearl)
                     
                     # Fallback for old pearls without new fields
                     # STANDARD CAPACITY: All pearls show /336 essence (112-day equivalent fuel tank)
@@ -1816,9 +2494,7 @@ class RoyalCouncilBot(commands.Bot):
                         if pearl_start:
                             days_held_so_far = (datetime.now(timezone.utc) - pearl_start).days
                             # Calculate essence consumed so far
-                            essence_consumed = 0.0
-                            for day in range(1, days_held_so_far + 1):
-                                essence_consumed += calculate_pearl_essence_cost(day)
+                            essence_consumed = pearl_essence_between(0, days_held_so_far)
                             # Remaining = capacity - consumed
                             essence_remaining = max(0.0, essence_capacity - essence_consumed)
                         else:
@@ -1869,6 +2545,8 @@ class RoyalCouncilBot(commands.Bot):
                 message = await channel.send(embed=embed, view=PearlPublicPanel())
                 print(f"[PANEL-JOB] ✅ Posted pearl panel after {attempt + 1} attempt(s)")
                 break
+            except PANEL_JOB_PERMANENT_ERRORS:
+                raise
             except (OSError, aiohttp.ClientOSError, aiohttp.ClientPayloadError) as io_err:
                 print(f"[PANEL-JOB] I/O error (attempt {attempt + 1}/20): {io_err}")
                 try:
@@ -1880,7 +2558,7 @@ class RoyalCouncilBot(commands.Bot):
         
         if message:
             # Save panel location for re-registration on restart
-            await asyncio.to_thread(lambda: db.collection(PEARL_PANELS_COLLECTION).document('pearl_panel').set({
+            await firestore_call(lambda: db.collection(PEARL_PANELS_COLLECTION).document('pearl_panel').set({
                 'guildId': guild.id,
                 'channelId': channel.id,
                 'messageId': message.id
@@ -1897,7 +2575,7 @@ class RoyalCouncilBot(commands.Bot):
         
         # Get all active pearls ONCE (for marking pearled players)
         pearled_igns = set()
-        pearl_docs = await asyncio.to_thread(
+        pearl_docs = await firestore_call(
             lambda: list(current_db.collection(PEARLS_COLLECTION).where(filter=FieldFilter('status', '==', 'active')).stream())
         )
         for pearl_doc in pearl_docs:
@@ -1905,7 +2583,7 @@ class RoyalCouncilBot(commands.Bot):
         
         # Get all active warrants
         warrants = []
-        warrant_docs = await asyncio.to_thread(
+        warrant_docs = await firestore_call(
             lambda: list(current_db.collection(WARRANTS_COLLECTION).where(filter=FieldFilter('status', '==', 'active')).stream())
         )
         for doc in warrant_docs:
@@ -1938,7 +2616,7 @@ class RoyalCouncilBot(commands.Bot):
         embed.set_footer(text="Pearl on Sight (POS) List • Click Refresh to update")
         
         # Try to edit existing panel first, fall back to new message
-        old_panel_doc = await asyncio.to_thread(
+        old_panel_doc = await firestore_call(
             lambda: current_db.collection(PORTAL_PANELS_COLLECTION).document('warrant_panel').get()
         )
         
@@ -1962,6 +2640,8 @@ class RoyalCouncilBot(commands.Bot):
                     await asyncio.sleep(0.3 * attempt)  # Progressive backoff
                     message = await channel.send(embed=embed, view=WarrantPanel())
                     break
+                except PANEL_JOB_PERMANENT_ERRORS:
+                    raise
                 except (OSError, aiohttp.ClientOSError, aiohttp.ClientPayloadError) as send_err:
                     last_error = send_err
                     print(f"[PANEL-JOB] Warrant panel send I/O error (attempt {attempt + 1}/12): {send_err}")
@@ -1982,7 +2662,7 @@ class RoyalCouncilBot(commands.Bot):
             raise Exception(f"Failed to post warrant panel after 12 attempts{error_details}")
         
         # Store panel location
-        await asyncio.to_thread(lambda: current_db.collection(PORTAL_PANELS_COLLECTION).document('warrant_panel').set({
+        await firestore_call(lambda: current_db.collection(PORTAL_PANELS_COLLECTION).document('warrant_panel').set({
             'guildId': guild.id,
             'channelId': channel.id,
             'messageId': message.id
@@ -2093,7 +2773,7 @@ class RoyalCouncilBot(commands.Bot):
         
         # Run ALL heavy queries in thread pool
         print(f"[PANEL-JOB] Starting economy panel data collection...")
-        data = await asyncio.to_thread(get_all_market_data)
+        data = await firestore_call(get_all_market_data)
         print(f"[PANEL-JOB] Economy data collected, building embed...")
         
         # Build embed (fast, no I/O)
@@ -2173,7 +2853,7 @@ class RoyalCouncilBot(commands.Bot):
         embed.set_footer(text=f"Updated: {now_est.strftime('%b %d, %Y at %I:%M %p EST')} | Click 🔄 to refresh")
         
         # Delete old panel if exists
-        old_panel_doc = await asyncio.to_thread(lambda: current_db.collection(PORTAL_PANELS_COLLECTION).document('economy_panel').get())
+        old_panel_doc = await firestore_call(lambda: current_db.collection(PORTAL_PANELS_COLLECTION).document('economy_panel').get())
         if old_panel_doc.exists:
             old_data = old_panel_doc.to_dict()
             old_channel = guild.get_channel(old_data.get('channelId'))
@@ -2193,6 +2873,8 @@ class RoyalCouncilBot(commands.Bot):
                 message = await channel.send(embed=embed, view=EconomyPanel())
                 print(f"[PANEL-JOB] ✅ Posted economy panel")
                 break
+            except PANEL_JOB_PERMANENT_ERRORS:
+                raise
             except (OSError, aiohttp.ClientOSError, aiohttp.ClientPayloadError) as io_err:
                 print(f"[PANEL-JOB] Economy panel I/O error (attempt {attempt + 1}/12): {io_err}")
             except Exception as e:
@@ -2202,7 +2884,7 @@ class RoyalCouncilBot(commands.Bot):
             raise Exception("Failed to post economy panel after 12 attempts")
         
         # Store panel location
-        await asyncio.to_thread(lambda: current_db.collection(PORTAL_PANELS_COLLECTION).document('economy_panel').set({
+        await firestore_call(lambda: current_db.collection(PORTAL_PANELS_COLLECTION).document('economy_panel').set({
             'guildId': guild.id,
             'channelId': channel.id,
             'messageId': message.id
@@ -2211,8 +2893,20 @@ class RoyalCouncilBot(commands.Bot):
 bot = RoyalCouncilBot()
 
 # ---------- PANEL JOB HELPER ----------
+class PanelJobFailed(Exception):
+    """A panel job failure that retrying cannot fix (missing guild/channel, unknown panel type)"""
+
+PANEL_JOB_PERMANENT_ERRORS = (PanelJobFailed, discord.NotFound, discord.Forbidden)
+
+def panel_job_target(job_data: dict):
+    """(panel_type, guild_id, channel_id) for a job - also reads the setup wizard's older job format"""
+    panel_type = job_data.get('panel_type') or job_data.get('type', '').removesuffix('_panel')
+    guild_id = job_data.get('guild_id') or job_data.get('guildId')
+    channel_id = job_data.get('channel_id') or job_data.get('channelId')
+    return panel_type, guild_id, channel_id
+
 async def enqueue_panel_job(panel_type: str, guild_id: int, channel_id: int, user_id: int) -> str:
-    """Enqueue a panel posting job to the background worker. Returns job ID."""
+    """Enqueue a panel posting job to the background workers. Returns job ID."""
     if not db:
         raise Exception("Database not available")
     
@@ -2221,19 +2915,21 @@ async def enqueue_panel_job(panel_type: str, guild_id: int, channel_id: int, use
     
     # Create job document
     job_data = {
-        'panel_type': panel_type,  # 'pearl' or 'warrant'
+        'panel_type': panel_type,  # 'pearl', 'warrant' or 'economy'
         'guild_id': guild_id,
         'channel_id': channel_id,
         'user_id': user_id,
         'status': 'pending',
+        'attempts': 0,
         'createdAt': datetime.now(timezone.utc)
     }
     
-    # Add to queue
-    job_ref = await asyncio.to_thread(
+    # Persist first (durable across restarts), then wake a local worker directly
+    job_ref = await firestore_call(
         lambda: current_db.collection(PANEL_JOBS_COLLECTION).add(job_data)
     )
     job_id = job_ref[1].id
+    bot.queue_panel_job(job_id)
     
     print(f"[PANEL-JOB] ✅ Enqueued {panel_type} panel job {job_id}")
     return job_id
@@ -2249,67 +2945,359 @@ bank_group = app_commands.Group(name="bank", description="🏦 Florabís State B
 economy_group = app_commands.Group(name="economy", description="💰 State Economy, Treasury & Investments")
 property_group = app_commands.Group(name="property", description="🏘️ Land Registry & Property Management")
 contract_group = app_commands.Group(name="contract", description="📋 Government Contracts & Public Works")
+admin_group = app_commands.Group(name="admin", description="🛠️ Bot administration & diagnostics")
+startup_mark("core")
+
 # ========================================
 # LAW LIBRARY SYSTEM
 # ========================================
 
 law_group = app_commands.Group(name="law", description="📜 Law Library - Search and view passed legislation")
 
-@law_group.command(name="search", description="Search laws by keyword")
-@app_commands.describe(keyword="Search term to find in law titles or content")
-async def law_search(interaction: discord.Interaction, keyword: str):
-    await interaction.response.defer(ephemeral=True)
+# ---------- LAW LIBRARY INDEX ----------
+# Passed laws are held in memory with a tokenized inverted index, so /law search,
+# view, list and recent never scan the bills collection. Built once after startup
+# and kept current by every status change (finalize_bill, enact, veto, decrees).
+LAW_STATUSES = ('Passed', 'Bill is Now Law')
+LAW_SEARCH_PAGE_SIZE = 10
+LAW_SEARCH_MAX_RESULTS = 100  # Ranked hits kept for paging
+LAW_SEARCH_CACHE_SIZE = 256  # Recent result lists kept until the next index change
+LAW_FIELD_WEIGHTS = {'title': 3.0, 'category': 2.0, 'text': 1.0}
+LAW_PREFIX_WEIGHT = 0.5  # Score factor for terms reached by prefix expansion instead of exact stem
+LAW_TOKEN_RE = re.compile(r"[a-z0-9]+")
+LAW_STOP_WORDS = frozenset((
+    'a', 'an', 'and', 'be', 'by', 'for', 'in', 'is', 'it', 'of', 'on', 'or', 'that', 'the', 'to',
+    'al', 'con', 'de', 'del', 'el', 'en', 'la', 'las', 'lo', 'los', 'para', 'por', 'que', 'se', 'un', 'una', 'y',
+))
+# Light EN/ES suffix stripping - longest suffix first, keeping a stem of at least 3 letters
+LAW_STEM_SUFFIXES = sorted((
+    'amientos', 'imientos', 'amiento', 'imiento', 'aciones', 'uciones', 'acion', 'ucion', 'mente',
+    'idades', 'idad', 'ancias', 'ancia', 'adores', 'ador', 'istas', 'ista', 'ismo', 'ibles', 'ible', 'ables', 'able',
+    'ational', 'ations', 'ation', 'ments', 'ment', 'ness', 'ings', 'ing', 'edly', 'ies', 'ied', 'ers', 'er', 'ed', 'ly',
+    'es', 'os', 'as', 's',
+), key=len, reverse=True)
+
+def fold_text(text: str) -> str:
+    """Lowercase and strip accents ('Constitución' -> 'constitucion')"""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+def law_stem(token: str) -> str:
+    if len(token) <= 3 or token.isdigit():
+        return token
+    for suffix in LAW_STEM_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            break
+    if len(token) > 4 and token[-1] in 'aeo':  # impuesto/impuestos, horse/horses
+        token = token[:-1]
+    return token
+
+def law_terms(text: str) -> list:
+    return [law_stem(t) for t in LAW_TOKEN_RE.findall(fold_text(text)) if t not in LAW_STOP_WORDS]
+
+def law_passed_at(law: dict):
+    """When a law passed (aware datetime), for sorting and display"""
+    passed = law.get('votingEndedAt') or law.get('createdAt')
+    if not isinstance(passed, datetime):
+        return None
+    return passed if passed.tzinfo else passed.replace(tzinfo=timezone.utc)
+
+class LawIndex:
+    """Passed laws by public bill ID plus term -> {law_id: weight} postings"""
+    
+    def __init__(self):
+        self.laws = {}  # law_id -> bill dict
+        self.postings = {}  # term -> {law_id: weighted term frequency}
+        self.law_terms = {}  # law_id -> terms it contributed (for removal)
+        self.recency = {}  # law_id -> passed timestamp (ranking tie-break)
+        self.sorted_terms = []  # For prefix expansion; rebuilt lazily after changes
+        self.terms_dirty = False
+        self.results = {}  # Query terms -> ranked law IDs, cleared on any change
+        self.loaded = False
+        self.load_lock = asyncio.Lock()
+    
+    async def ensure_loaded(self):
+        if self.loaded:
+            return
+        async with self.load_lock:
+            if self.loaded or not db:
+                return
+            docs = await asyncio.to_thread(lambda: list(
+                db.collection(BILL_COLLECTION_NAME).where(filter=FieldFilter('status', 'in', list(LAW_STATUSES))).stream()
+            ))
+            for doc in docs:
+                self.update(doc.to_dict())
+            self.loaded = True
+            print(f"[OK] Law index built: {len(self.laws)} laws, {len(self.postings)} terms")
+    
+    def start(self):
+        async def warm():
+            await bot.wait_until_ready()
+            try:
+                await self.ensure_loaded()
+            except Exception as e:
+                print(f"[WARN] Law index not built at startup (will retry on first search): {e}")
+        asyncio.create_task(warm())
+    
+    def update(self, bill: dict):
+        """Index, reindex or drop a bill according to its current status"""
+        law_id = (bill or {}).get('id')
+        if not law_id:
+            return
+        self.remove(law_id)
+        if bill.get('status') not in LAW_STATUSES:
+            return
+        
+        weights = {}
+        for field, weight in LAW_FIELD_WEIGHTS.items():
+            value = bill.get(field) or (bill.get('description') if field == 'text' else None)
+            for term in law_terms(value or ''):
+                weights[term] = weights.get(term, 0.0) + weight
+        for term, weight in weights.items():
+            self.postings.setdefault(term, {})[law_id] = weight
+        self.laws[law_id] = bill
+        self.law_terms[law_id] = list(weights)
+        passed_at = law_passed_at(bill)
+        self.recency[law_id] = passed_at.timestamp() if passed_at else 0.0
+        self.terms_dirty = True
+        self.results.clear()
+    
+    def remove(self, law_id: str):
+        if self.laws.pop(law_id, None) is None:
+            return
+        self.recency.pop(law_id, None)
+        for term in self.law_terms.pop(law_id, ()):
+            posting = self.postings.get(term)
+            if posting:
+                posting.pop(law_id, None)
+                if not posting:
+                    del self.postings[term]
+        self.terms_dirty = True
+        self.results.clear()
+    
+    def get(self, law_id: str):
+        return self.laws.get(law_id)
+    
+    def expand(self, term: str) -> list:
+        """[(indexed term, score factor)] - the exact stem plus every term it prefixes"""
+        if self.terms_dirty:
+            self.sorted_terms = sorted(self.postings)
+            self.terms_dirty = False
+        matches = [(term, 1.0)] if term in self.postings else []
+        if len(term) >= 2:
+            i = bisect.bisect_left(self.sorted_terms, term)
+            while i < len(self.sorted_terms) and self.sorted_terms[i].startswith(term):
+                if self.sorted_terms[i] != term:
+                    matches.append((self.sorted_terms[i], LAW_PREFIX_WEIGHT))
+                i += 1
+        return matches
+    
+    def search(self, query: str) -> list:
+        """IDs of the best laws matching every query term (exact stem or prefix), best first"""
+        terms = tuple(dict.fromkeys(law_terms(query)))
+        if not terms:
+            return []
+        cached = self.results.get(terms)
+        if cached is None:
+            cached = self.rank(terms)
+            if len(self.results) >= LAW_SEARCH_CACHE_SIZE:
+                self.results.pop(next(iter(self.results)))
+            self.results[terms] = cached
+        return cached
+    
+    def rank(self, terms: tuple) -> list:
+        total = max(len(self.laws), 1)
+        scores = None
+        for term in terms:
+            term_scores = {}
+            for indexed, factor in self.expand(term):
+                posting = self.postings[indexed]
+                scale = math.log(1 + total / len(posting)) * factor  # idf
+                if not term_scores:
+                    term_scores = {law_id: weight * scale for law_id, weight in posting.items()}
+                    continue
+                for law_id, weight in posting.items():
+                    term_scores[law_id] = term_scores.get(law_id, 0.0) + weight * scale
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {law_id: score + term_scores[law_id] for law_id, score in scores.items() if law_id in term_scores}
+            if not scores:
+                return []
+        recency = self.recency
+        return heapq.nlargest(LAW_SEARCH_MAX_RESULTS, scores, key=lambda law_id: (scores[law_id], recency[law_id]))
+    
+    def all_laws(self) -> list:
+        """Every law, newest first"""
+        return [self.laws[law_id] for law_id in sorted(self.laws, key=self.recency.get, reverse=True)]
+
+law_index = LawIndex()
+
+# ---------- LEGISLATIVE STATISTICS ----------
+# Bill counts are maintained instead of recomputed from every bill: the 'totals'
+# document holds per-status counts and laws per category, and a 'month-YYYY-MM'
+# document per month holds bills filed that month. Test bills are only counted as
+# such. Every create, status change and delete applies its delta (bill_changed);
+# /law rebuild_stats recomputes everything from the bills collection. Until that
+# first rebuild has run (it stamps 'reconciledAt' on totals) deltas are skipped:
+# counters started from a delta would leave out every earlier bill.
+legislative_stats_reconciled = False  # Cached once totals carries reconciledAt
+
+def is_test_bill(bill: dict) -> bool:
+    """Test bills ('test' in the title, or flagged isTest) are excluded from statistics"""
+    return 'test' in (bill.get('title') or '').lower() or bool(bill.get('isTest', False))
+
+def bill_filed_month(bill: dict):
+    """'YYYY-MM' a bill was filed in (naive createdAt is treated as UTC)"""
+    created = bill.get('createdAt')
+    if not isinstance(created, datetime):
+        return None
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return created.astimezone(timezone.utc).strftime('%Y-%m')
+
+def add_bill_stats(deltas: dict, bill: dict, sign: int):
+    """Add one bill's counter contributions (sign=+1 or -1) into {doc_id: nested counts}"""
+    totals = deltas.setdefault('totals', {})
+    if is_test_bill(bill):
+        totals['testBills'] = totals.get('testBills', 0) + sign
+        return
+    status = bill.get('status') or 'Unknown'
+    totals['filed'] = totals.get('filed', 0) + sign
+    by_status = totals.setdefault('status', {})
+    by_status[status] = by_status.get(status, 0) + sign
+    if status in LAW_STATUSES:
+        by_category = totals.setdefault('lawCategory', {})
+        category = bill.get('category') or 'General'
+        by_category[category] = by_category.get(category, 0) + sign
+    month = bill_filed_month(bill)
+    if month:
+        month_counts = deltas.setdefault(f"month-{month}", {'month': month})
+        month_counts['filed'] = month_counts.get('filed', 0) + sign
+
+def prune_zero_counts(counts: dict) -> dict:
+    pruned = {}
+    for key, value in counts.items():
+        if isinstance(value, dict):
+            value = prune_zero_counts(value)
+            if value:
+                pruned[key] = value
+        elif value != 0:
+            pruned[key] = value
+    return pruned
+
+def as_increments(counts: dict) -> dict:
+    return {key: as_increments(value) if isinstance(value, dict) else
+            (firestore.Increment(value) if isinstance(value, int) else value) for key, value in counts.items()}
+
+def stats_reconciled() -> bool:
+    """Whether rebuild_legislative_stats has built the counters (one read until it has)"""
+    global legislative_stats_reconciled
+    if not legislative_stats_reconciled:
+        totals_doc = db.collection(LEGISLATIVE_STATS_COLLECTION).document('totals').get()
+        legislative_stats_reconciled = totals_doc.exists and bool((totals_doc.to_dict() or {}).get('reconciledAt'))
+    return legislative_stats_reconciled
+
+def record_bill_stats(old_bill, new_bill):
+    """Apply the statistics delta between two versions of a bill (None = didn't / no longer exists)"""
+    if not db or not stats_reconciled():
+        return  # The first rebuild counts this bill from the collection
+    deltas = {}
+    if old_bill:
+        add_bill_stats(deltas, old_bill, -1)
+    if new_bill:
+        add_bill_stats(deltas, new_bill, +1)
+    writes = {}
+    for doc_id, counts in deltas.items():
+        counts = prune_zero_counts(counts)
+        if any(key != 'month' for key in counts):
+            writes[doc_id] = counts
+    if not writes or not db:
+        return
+    now = datetime.now(timezone.utc)
+    batch = db.batch()
+    for doc_id, counts in writes.items():
+        batch.set(db.collection(LEGISLATIVE_STATS_COLLECTION).document(doc_id), {**as_increments(counts), 'updatedAt': now}, merge=True)
+    batch.commit()
+
+async def bill_changed(old_bill, new_bill):
+    """Keep the lookup cache, law index and statistics in step with a bill write (new_bill=None when deleted)"""
+    bill_cache.forget((new_bill or old_bill or {}).get('id'))
+    if new_bill:
+        law_index.update(new_bill)
+    elif old_bill:
+        law_index.remove(old_bill.get('id'))
+    try:
+        await asyncio.to_thread(record_bill_stats, old_bill, new_bill)
+    except Exception as e:
+        print(f"[WARN] Legislative stats not updated for bill {(new_bill or old_bill or {}).get('id')}: {e} (run /law rebuild_stats)")
+    if old_bill and not new_bill:
+        try:
+            await asyncio.to_thread(forget_bill_votes, old_bill)
+        except Exception as e:
+            print(f"[WARN] Vote index not updated for deleted bill {old_bill.get('id')}: {e}")
+
+def rebuild_legislative_stats() -> int:
+    """Recompute every statistics document from the bills collection. Returns bills counted."""
+    global legislative_stats_reconciled
+    deltas = {'totals': {'filed': 0, 'testBills': 0, 'status': {}, 'lawCategory': {}}}
+    bill_count = 0
+    for doc in db.collection(BILL_COLLECTION_NAME).stream():
+        add_bill_stats(deltas, doc.to_dict(), +1)
+        bill_count += 1
     
-    if not db:
-        return await interaction.followup.send("❌ Database unavailable.")
+    now = datetime.now(timezone.utc)
+    stats_ref = db.collection(LEGISLATIVE_STATS_COLLECTION)
+    stale = [doc.id for doc in stats_ref.stream() if doc.id not in deltas]
+    batch = db.batch()
+    for doc_id, counts in deltas.items():
+        batch.set(stats_ref.document(doc_id), {**counts, 'updatedAt': now, 'reconciledAt': now})
+    for doc_id in stale:
+        batch.delete(stats_ref.document(doc_id))
+    batch.commit()
+    legislative_stats_reconciled = True
+    return bill_count
+
+def read_legislative_stats(month: str = None) -> tuple:
+    """(totals, month counts) - one or two document reads. totals is None until the first rebuild."""
+    stats_ref = db.collection(LEGISLATIVE_STATS_COLLECTION)
+    totals_doc = stats_ref.document('totals').get()
+    totals = totals_doc.to_dict() if totals_doc.exists else None
+    if not (totals or {}).get('reconciledAt'):
+        totals = None
+    month_counts = {}
+    if month:
+        month_doc = stats_ref.document(f"month-{month}").get()
+        month_counts = month_doc.to_dict() if month_doc.exists else {}
+    return totals, month_counts
+
+class LawSearchView(discord.ui.View):
+    def __init__(self, keyword: str, law_ids: list, page: int = 0):
+        super().__init__(timeout=300)
+        self.keyword = keyword
+        self.law_ids = law_ids
+        self.page = page
+        self.total_pages = max(1, (len(law_ids) + LAW_SEARCH_PAGE_SIZE - 1) // LAW_SEARCH_PAGE_SIZE)
+        self.previous_button.disabled = self.page == 0
+        self.next_button.disabled = self.page >= self.total_pages - 1
     
-    try:
-        # Get all passed laws
-        laws = await asyncio.to_thread(lambda: list(
-            db.collection(BILL_COLLECTION_NAME)
-            .where(filter=FieldFilter('status', 'in', ['Passed', 'Bill is Now Law']))
-            .stream()
-        ))
-        
-        # Filter by keyword (case-insensitive search in title and content)
-        keyword_lower = keyword.lower()
-        matches = []
-        for doc in laws:
-            data = doc.to_dict()
-            title = data.get('title', '').lower()
-            content_text = data.get('description', '').lower()
-            category = data.get('category', '').lower()
-            
-            if keyword_lower in title or keyword_lower in content_text or keyword_lower in category:
-                matches.append(data)
-        
-        if not matches:
-            return await interaction.followup.send(f"📜 No laws found matching **{keyword}**")
-        
-        # Sort by date (newest first)
-        matches.sort(key=lambda x: x.get('createdAt', datetime.min), reverse=True)
-        
-        # Limit to 10 results
-        matches = matches[:10]
-        
+    def build_embed(self):
         embed = discord.Embed(
             title=f"📜 Law Library - Search Results",
-            description=f"**{len(matches)}** laws found matching: **{keyword}**",
+            description=f"**{len(self.law_ids)}{'+' if len(self.law_ids) >= LAW_SEARCH_MAX_RESULTS else ''}** laws found matching: **{self.keyword}**",
             color=0x2E4053
         )
         
-        for law in matches:
-            law_id = law.get('id', 'Unknown')
+        start = self.page * LAW_SEARCH_PAGE_SIZE
+        for law_id in self.law_ids[start:start + LAW_SEARCH_PAGE_SIZE]:
+            law = law_index.get(law_id)
+            if not law:
+                continue  # Dropped from the index (vetoed) since the search ran
             title = law.get('title', 'Untitled')[:50]
             category = law.get('category', 'General')
-            passed_date = law.get('votingEndedAt') or law.get('createdAt')
-            if passed_date:
-                if hasattr(passed_date, 'astimezone'):
-                    passed_str = passed_date.astimezone(EST).strftime('%b %d, %Y')
-                else:
-                    passed_str = "Unknown"
-            else:
-                passed_str = "Unknown"
+            passed_at = law_passed_at(law)
+            passed_str = passed_at.astimezone(EST).strftime('%b %d, %Y') if passed_at else "Unknown"
             
             embed.add_field(
                 name=f"📋 {law_id}: {title}",
@@ -2317,9 +3305,41 @@ async def law_search(interaction: discord.Interaction, keyword: str):
                 inline=False
             )
         
-        embed.set_footer(text="Use /law view <id> to read full law text")
-        await interaction.followup.send(embed=embed)
+        embed.set_footer(text=f"Page {self.page + 1}/{self.total_pages} • Use /law view <id> to read full law text")
+        return embed
+    
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = max(0, self.page - 1)
+        self.previous_button.disabled = self.page == 0
+        self.next_button.disabled = False
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+    
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = min(self.total_pages - 1, self.page + 1)
+        self.next_button.disabled = self.page >= self.total_pages - 1
+        self.previous_button.disabled = False
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+@law_group.command(name="search", description="Search laws by keyword")
+@app_commands.describe(keyword="Search term to find in law titles or content")
+async def law_search(interaction: discord.Interaction, keyword: str):
+    await interaction.response.defer(ephemeral=True)
+    
+    if not db:
+        return await interaction.followup.send("❌ Database unavailable.")
+    
+    try:
+        await law_index.ensure_loaded()
+        law_ids = law_index.search(keyword)
+        
+        if not law_ids:
+            return await interaction.followup.send(f"📜 No laws found matching **{keyword}**")
         
+        view = LawSearchView(keyword, law_ids)
+        await interaction.followup.send(embed=view.build_embed(), view=view if view.total_pages > 1 else discord.utils.MISSING)
+    
     except Exception as e:
         print(f"[ERR] Law search failed: {e}")
         await interaction.followup.send(f"❌ Search failed: {str(e)}")
@@ -2335,24 +3355,18 @@ async def law_view(interaction: discord.Interaction, law_id: str):
     
     try:
         # Find the law
-        laws = await asyncio.to_thread(lambda: list(
-            db.collection(BILL_COLLECTION_NAME)
-            .where(filter=FieldFilter('id', '==', law_id.upper()))
-            .limit(1)
-            .stream()
-        ))
-        
-        if not laws:
-            return await interaction.followup.send(f"❌ Law **{law_id}** not found.")
+        await law_index.ensure_loaded()
+        law = law_index.get(law_id.upper())
         
-        law = laws[0].to_dict()
-        
-        # Check if it's actually passed
-        if law.get('status') not in ['Passed', 'Bill is Now Law']:
-            return await interaction.followup.send(f"❌ **{law_id}** is not a passed law (Status: {law.get('status')})")
+        if not law:
+            # Not a law - one lookup to say why
+            _, bill = await asyncio.to_thread(find_bill_by_id_sync, law_id.upper())
+            if not bill:
+                return await interaction.followup.send(f"❌ Law **{law_id}** not found.")
+            return await interaction.followup.send(f"❌ **{law_id}** is not a passed law (Status: {bill.get('status')})")
         
         title = law.get('title', 'Untitled')
-        description = law.get('description', 'No content')
+        description = law.get('description') or law.get('text', 'No content')
         category = law.get('category', 'General')
         author_name = law.get('author', 'Unknown')
         
@@ -2415,14 +3429,9 @@ async def law_list(interaction: discord.Interaction, category: str = "all"):
         return await interaction.followup.send("❌ Database unavailable.")
     
     try:
-        # Get all passed laws
-        laws = await asyncio.to_thread(lambda: list(
-            db.collection(BILL_COLLECTION_NAME)
-            .where(filter=FieldFilter('status', 'in', ['Passed', 'Bill is Now Law']))
-            .stream()
-        ))
-        
-        laws_data = [doc.to_dict() for doc in laws]
+        # All passed laws, newest first
+        await law_index.ensure_loaded()
+        laws_data = law_index.all_laws()
         
         # Filter by category if specified
         if category != "all":
@@ -2432,9 +3441,6 @@ async def law_list(interaction: discord.Interaction, category: str = "all"):
             cat_text = f" in category **{category}**" if category != "all" else ""
             return await interaction.followup.send(f"📜 No passed laws found{cat_text}.")
         
-        # Sort by date (newest first)
-        laws_data.sort(key=lambda x: x.get('votingEndedAt') or x.get('createdAt') or datetime.min, reverse=True)
-        
         # Group by category if showing all
         if category == "all":
             by_category = {}
@@ -2499,20 +3505,13 @@ async def law_recent(interaction: discord.Interaction, count: int = 5):
     count = min(max(1, count), 10)  # Clamp between 1 and 10
     
     try:
-        # Get all passed laws
-        laws = await asyncio.to_thread(lambda: list(
-            db.collection(BILL_COLLECTION_NAME)
-            .where(filter=FieldFilter('status', 'in', ['Passed', 'Bill is Now Law']))
-            .stream()
-        ))
-        
-        laws_data = [doc.to_dict() for doc in laws]
+        # Passed laws, newest first
+        await law_index.ensure_loaded()
+        laws_data = law_index.all_laws()
         
         if not laws_data:
             return await interaction.followup.send("📜 No passed laws found.")
         
-        # Sort by passed date (newest first)
-        laws_data.sort(key=lambda x: x.get('votingEndedAt') or x.get('createdAt') or datetime.min, reverse=True)
         laws_data = laws_data[:count]
         
         embed = discord.Embed(
@@ -2557,32 +3556,20 @@ async def law_stats(interaction: discord.Interaction):
         return await interaction.followup.send("❌ Database unavailable.")
     
     try:
-        # Get all bills
-        all_bills = await asyncio.to_thread(lambda: list(
-            db.collection(BILL_COLLECTION_NAME).stream()
-        ))
-        
-        bills_data = [doc.to_dict() for doc in all_bills]
-        
-        # Filter out test bills (case-insensitive check for "test" in title)
-        def is_test_bill(b):
-            title = b.get('title', '').lower()
-            return 'test' in title or b.get('isTest', False)
-        
-        real_bills = [b for b in bills_data if not is_test_bill(b)]
-        test_bills = [b for b in bills_data if is_test_bill(b)]
-        
-        # Count by status (only real bills)
-        passed = [b for b in real_bills if b.get('status') in ['Passed', 'Bill is Now Law']]
-        failed = [b for b in real_bills if b.get('status') == 'Failed']
-        vetoed = [b for b in real_bills if b.get('status') == 'Vetoed']
-        voting = [b for b in real_bills if b.get('status') == 'Voting']
-        
-        # Count by category
-        category_counts = {}
-        for law in passed:
-            cat = law.get('category', 'General')
-            category_counts[cat] = category_counts.get(cat, 0) + 1
+        totals, _ = await asyncio.to_thread(read_legislative_stats)
+        if totals is None:
+            # First use: build the counters once from the bills collection
+            await asyncio.to_thread(rebuild_legislative_stats)
+            totals, _ = await asyncio.to_thread(read_legislative_stats)
+        totals = totals or {}
+        by_status = totals.get('status', {})
+        
+        passed_count = by_status.get('Passed', 0) + by_status.get('Bill is Now Law', 0)
+        failed_count = by_status.get('Failed', 0)
+        vetoed_count = by_status.get('Vetoed', 0)
+        voting_count = by_status.get('Voting', 0)
+        test_count = totals.get('testBills', 0)
+        category_counts = {cat: count for cat, count in totals.get('lawCategory', {}).items() if count > 0}
         
         embed = discord.Embed(
             title="📊 Law Library Statistics",
@@ -2590,28 +3577,30 @@ async def law_stats(interaction: discord.Interaction):
             color=0x2E4053
         )
         
-        embed.add_field(name="📜 Laws Enacted", value=str(len(passed)), inline=True)
-        embed.add_field(name="❌ Bills Failed", value=str(len(failed)), inline=True)
-        embed.add_field(name="🚫 Bills Vetoed", value=str(len(vetoed)), inline=True)
-        embed.add_field(name="🗳️ Currently Voting", value=str(len(voting)), inline=True)
-        embed.add_field(name="📋 Bills Filed", value=str(len(real_bills)), inline=True)
+        embed.add_field(name="📜 Laws Enacted", value=str(passed_count), inline=True)
+        embed.add_field(name="❌ Bills Failed", value=str(failed_count), inline=True)
+        embed.add_field(name="🚫 Bills Vetoed", value=str(vetoed_count), inline=True)
+        embed.add_field(name="🗳️ Currently Voting", value=str(voting_count), inline=True)
+        embed.add_field(name="📋 Bills Filed", value=str(totals.get('filed', 0)), inline=True)
         
         # Pass rate
-        total_decided = len(passed) + len(failed)
+        total_decided = passed_count + failed_count
         if total_decided > 0:
-            pass_rate = (len(passed) / total_decided) * 100
+            pass_rate = (passed_count / total_decided) * 100
             embed.add_field(name="✅ Pass Rate", value=f"{pass_rate:.1f}%", inline=True)
         
         # Show test bills excluded
-        if test_bills:
-            embed.add_field(name="🧪 Test Bills Excluded", value=str(len(test_bills)), inline=True)
+        if test_count:
+            embed.add_field(name="🧪 Test Bills Excluded", value=str(test_count), inline=True)
         
         # Category breakdown
         if category_counts:
             cat_text = "\n".join([f"• **{cat}:** {count}" for cat, count in sorted(category_counts.items(), key=lambda x: -x[1])])
             embed.add_field(name="📁 Laws by Category", value=cat_text, inline=False)
         
-        # List passed laws
+        # List passed laws (from the law index, newest first)
+        await law_index.ensure_loaded()
+        passed = [law for law in law_index.all_laws() if not is_test_bill(law)]
         if passed:
             laws_list = []
             for law in passed[:10]:
@@ -2631,6 +3620,25 @@ async def law_stats(interaction: discord.Interaction):
         traceback.print_exc()
         await interaction.followup.send(f"❌ Failed to get stats: {str(e)}")
 
+
+@law_group.command(name="rebuild_stats", description="🔧 Rebuild legislative statistics from all bills (Admin only)")
+async def law_rebuild_stats(interaction: discord.Interaction):
+    await interaction.response.send_message("⏳ Processing...", ephemeral=True)
+    
+    if not has_admin_role(interaction):
+        return await interaction.edit_original_response(content="❌ Only administrators can rebuild legislative statistics.")
+    
+    if not db:
+        return await interaction.edit_original_response(content="❌ Database not available.")
+    
+    try:
+        bill_count = await asyncio.to_thread(rebuild_legislative_stats)
+        await interaction.edit_original_response(content=f"✅ Rebuilt legislative statistics from **{bill_count}** bill(s).")
+        print(f"[LAW] {interaction.user} rebuilt legislative statistics ({bill_count} bills)")
+    except Exception as e:
+        print(f"[ERR] Rebuild legislative stats failed: {e}")
+        await interaction.edit_original_response(content=f"❌ Failed to rebuild statistics: {str(e)}")
+
 bot.tree.add_command(law_group)
 
 
@@ -2645,39 +3653,302 @@ bot.tree.add_command(court_group)
 bot.tree.add_command(economy_group)
 bot.tree.add_command(property_group)
 bot.tree.add_command(contract_group)
+bot.tree.add_command(admin_group)
+
+# ---------- SUBSYSTEM GATING ----------
+# Each optional subsystem owns a set of top-level commands (groups or single commands),
+# persistent panels, background tasks and components: the views, modals and dynamic
+# items it defines (by class name) plus custom_id prefixes of components without a
+# class of their own. Disabled subsystems are pulled out of the command tree in
+# setup_hook, their components are answered with a notice before any handler runs,
+# and they can be switched at runtime with /admin subsystem.
+# Set DISABLED_SUBSYSTEMS to a comma-separated list (e.g. "contracts,pearls").
+SUBSYSTEMS = {
+    'law': {'commands': ['law'], 'panels': [], 'tasks': [], 'components': {'LawSearchView'}, 'custom_ids': ()},
+    'court': {
+        'commands': ['court', 'court_panel', 'court_create_thread', 'my_lawyer_profile', 'switch_lawyer_role', 'thread_add'],
+        'panels': ['court_panel'],
+        'tasks': [],
+        'components': {
+            'CourtPanel', 'CourtroomActionPanel', 'CourtCaseActionView', 'TrialActionView', 'JudgeVotingView',
+            'VerdictAppealView', 'AppealDecisionView', 'AppealReviewPanel', 'PleaResponseView', 'SeveritySelectionView',
+            'MyCasesView', 'ActiveCasesView', 'CaseSearchView', 'LawyerCaseClaimView', 'LawyerCaseClaimButton',
+            'LawyerTypeSelect', 'LawyerRoleSwitchSelect', 'LawyerRegistrationModal', 'CourtFileCaseModal',
+            'FileAppealModal', 'AppealCaseModal', 'OpenThreadModal', 'SingleJudgeVerdictModal', 'IssueVerdictModal',
+            'SubmitArgumentModal', 'PleaBargainModal', 'OverturnVerdictModal',
+        },
+        'custom_ids': ('select_defense_', 'select_plaintiff_lawyer_', 'select_defendant_lawyer_'),
+    },
+    'betting': {
+        'commands': ['betting', 'betting_panel'],
+        'panels': ['betting_panel'],
+        'tasks': [],
+        'components': {'BettingPanel', 'BettingEventsView', 'EventSelectionView', 'EventTypeSelectionView', 'CreateEventModal'},
+        'custom_ids': ('bet_',),  # Bet buttons on event posts (handled in on_interaction)
+    },
+    'market': {
+        'commands': ['market', 'market_panel'],
+        'panels': ['market_panel'],
+        'tasks': [],
+        'components': {'MarketPanel', 'PortfolioView', 'StockSelectionView', 'BusinessSectorSelectionView', 'RegisterBusinessModal', 'LaunchIPOModal'},
+        'custom_ids': (),
+    },
+    'property': {
+        'commands': ['property', 'set_market_cycle'], 'panels': [], 'tasks': [],
+        'components': {'PropertyListView', 'MarketplaceView'}, 'custom_ids': (),
+    },
+    'contracts': {'commands': ['contract'], 'panels': [], 'tasks': [], 'components': set(), 'custom_ids': ()},
+    'pearls': {
+        'commands': ['pearl'], 'panels': ['pearl_panel'], 'tasks': ['decrement_pearl_essence'],
+        'components': {'PearlPublicPanel'}, 'custom_ids': (),
+    },
+}
+DISABLED_SUBSYSTEMS = {
+    name.strip().lower() for name in os.getenv("DISABLED_SUBSYSTEMS", "").split(',') if name.strip()
+}
+_gated_commands = {}  # command name -> command object (captured before any are removed)
+
+def subsystem_enabled(name: str) -> bool:
+    """Whether a gated subsystem is currently enabled (unknown names count as core/enabled)"""
+    return name not in DISABLED_SUBSYSTEMS
+
+def panel_subsystem(panel_name: str):
+    """Name of the subsystem that owns a stored panel document, or None for core panels"""
+    for name, spec in SUBSYSTEMS.items():
+        if panel_name in spec['panels']:
+            return name
+    return None
+
+def set_subsystem_enabled(name: str, enabled: bool) -> list:
+    """Add or remove a subsystem's commands from the tree. Returns the command names changed."""
+    spec = SUBSYSTEMS[name]
+    changed = []
+    for command_name in spec['commands']:
+        command = _gated_commands.get(command_name) or bot.tree.get_command(command_name)
+        if command is None:
+            continue
+        _gated_commands[command_name] = command
+        present = bot.tree.get_command(command_name) is not None
+        if enabled and not present:
+            bot.tree.add_command(command)
+            changed.append(command_name)
+        elif not enabled and present:
+            bot.tree.remove_command(command_name)
+            changed.append(command_name)
+    if enabled:
+        DISABLED_SUBSYSTEMS.discard(name)
+    else:
+        DISABLED_SUBSYSTEMS.add(name)
+    return changed
+
+def interaction_subsystem(state, data: dict):
+    """Name of the subsystem that owns a raw component / modal interaction, or None for core"""
+    inner = data.get('data') or {}
+    custom_id = inner.get('custom_id', '')
+    store = state._view_store
+    handlers = set()
+    if data['type'] == 5:
+        modal = store._modals.get(custom_id)
+        if modal is not None:
+            handlers.add(type(modal).__name__)
+    else:
+        message_id = int(data['message']['id']) if data.get('message') else None
+        key = (inner.get('component_type'), custom_id)
+        item = store._views.get(message_id, {}).get(key) or store._views.get(None, {}).get(key)
+        if item is not None:
+            handlers.update((type(item).__name__, type(item.view).__name__))
+        for pattern, factory in store._dynamic_items.items():
+            if pattern.fullmatch(custom_id):
+                handlers.add(factory.__name__)
+    for name, spec in SUBSYSTEMS.items():
+        if handlers & spec['components'] or (spec['custom_ids'] and custom_id.startswith(spec['custom_ids'])):
+            return name
+    return None
+
+async def reject_disabled_interaction(interaction: discord.Interaction, name: str):
+    try:
+        await interaction.response.send_message(f"❌ The {name} subsystem is currently disabled.", ephemeral=True)
+    except discord.HTTPException as e:
+        print(f"[WARN] Could not answer interaction for disabled subsystem {name}: {e}")
+
+def install_subsystem_gate(bot_instance):
+    """Answer components and modals of disabled subsystems before their views / listeners see them"""
+    state = bot_instance._connection
+    parse_interaction = state.parsers['INTERACTION_CREATE']
+    
+    def parse_interaction_create(data):
+        if data.get('type') in (3, 5) and DISABLED_SUBSYSTEMS:
+            owner = interaction_subsystem(state, data)
+            if owner and not subsystem_enabled(owner):
+                asyncio.create_task(reject_disabled_interaction(discord.Interaction(data=data, state=state), owner))
+                return
+        parse_interaction(data)
+    
+    state.parsers['INTERACTION_CREATE'] = parse_interaction_create
+
+def apply_subsystem_gates():
+    """Capture every gated command, then remove those belonging to disabled subsystems"""
+    for spec in SUBSYSTEMS.values():
+        for command_name in spec['commands']:
+            command = bot.tree.get_command(command_name)
+            if command is not None:
+                _gated_commands[command_name] = command
+    for name in SUBSYSTEMS:
+        if not subsystem_enabled(name):
+            removed = set_subsystem_enabled(name, False)
+            print(f"[INFO] Subsystem '{name}' disabled ({len(removed)} command(s) not loaded)")
+
+def startup_report() -> str:
+    """Plain-text startup timing report: import cost per dependency and load cost per subsystem"""
+    totals = {}
+    for phase, seconds in STARTUP_TIMINGS:
+        totals[phase] = totals.get(phase, 0.0) + seconds
+    lines = [f"{phase:<36} {seconds * 1000:8.1f} ms" for phase, seconds in sorted(totals.items(), key=lambda x: -x[1])]
+    module_total = sum(seconds for phase, seconds in STARTUP_TIMINGS if not phase.startswith('lazy:') and not phase.startswith('ready'))
+    lines.append(f"{'module load total':<36} {module_total * 1000:8.1f} ms")
+    disabled = ', '.join(sorted(DISABLED_SUBSYSTEMS)) or 'none'
+    lines.append(f"disabled subsystems: {disabled}")
+    return "\n".join(lines)
+
+startup_mark("law")
 
 # ---------- HELPERS ----------
-def find_bill_by_id_sync(bill_id: str):
-    if not db:
-        return None, None
-    q = db.collection(BILL_COLLECTION_NAME).where(filter=FieldFilter('id', '==', bill_id)).limit(1)
-    for doc in q.stream():
-        return doc.reference, doc.to_dict()
-    return None, None
-
-def get_next_bill_number():
-    """Get the next sequential bill number using atomic increment"""
-    if not db:
-        return None
+# Bills are stored under their public ID (document ID == bill['id']), so a lookup is
+# one direct get. Console clicks hit the same few bills repeatedly; BillCache serves
+# them from memory for BILL_CACHE_TTL. Every bill write in this process calls
+# bill_cache.forget(), and a read that overlapped a write is not cached.
+class BillCache:
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.entries = {}  # bill_id -> (expires_at, ref, bill)
+        self.generations = {}  # bill_id -> writes seen (a read started before a write must not be stored)
+        self.lock = threading.Lock()
+    
+    def get(self, bill_id: str):
+        with self.lock:
+            entry = self.entries.get(bill_id)
+        if not entry or entry[0] < time.monotonic():
+            return None
+        return entry[1], copy.deepcopy(entry[2])  # Callers edit the dict they get back
     
-    counter_ref = db.collection(BILL_COUNTER_COLLECTION).document('counter')
+    def generation(self, bill_id: str) -> int:
+        with self.lock:
+            return self.generations.get(bill_id, 0)
     
-    @firestore.transactional
-    def increment_counter(transaction):
-        snapshot = counter_ref.get(transaction=transaction)
-        if snapshot.exists:
-            current = snapshot.get('lastNumber')
-            next_number = current + 1
-        else:
-            next_number = 1
+    def put(self, bill_id: str, ref, bill: dict, generation: int):
+        with self.lock:
+            if self.generations.get(bill_id, 0) != generation:
+                return
+            self.entries.pop(bill_id, None)
+            self.entries[bill_id] = (time.monotonic() + self.ttl, ref, copy.deepcopy(bill))
+            while len(self.entries) > self.max_size:
+                self.entries.pop(next(iter(self.entries)))
+    
+    def forget(self, bill_id: str):
+        with self.lock:
+            self.generations[bill_id] = self.generations.get(bill_id, 0) + 1
+            self.entries.pop(bill_id, None)
+    
+    def clear(self):
+        with self.lock:
+            for bill_id in self.entries:
+                self.generations[bill_id] = self.generations.get(bill_id, 0) + 1
+            self.entries.clear()
+
+bill_cache = BillCache(BILL_CACHE_TTL, BILL_CACHE_SIZE)
+
+def find_bill_by_id_sync(bill_id: str, fresh: bool = False):
+    """(ref, bill) by public ID - cached unless fresh=True (use fresh for reads that decide an outcome)"""
+    if not db or not bill_id or '/' in bill_id:
+        return None, None
+    if not fresh:
+        cached = bill_cache.get(bill_id)
+        if cached:
+            return cached
+    
+    generation = bill_cache.generation(bill_id)
+    ref = db.collection(BILL_COLLECTION_NAME).document(bill_id)
+    snapshot = ref.get()
+    if snapshot.exists:
+        bill = snapshot.to_dict()
+    else:
+        # Bills filed before /migrate_bill_ids live under auto-generated document IDs
+        ref, bill = None, None
+        for doc in db.collection(BILL_COLLECTION_NAME).where(filter=FieldFilter('id', '==', bill_id)).limit(1).stream():
+            ref, bill = doc.reference, doc.to_dict()
+        if not bill:
+            return None, None
+    bill_cache.put(bill_id, ref, bill, generation)
+    return ref, bill
+
+# ---------- SEQUENCE ALLOCATOR ----------
+# Human-facing numbers (R.C. bill numbers, royal decree numbers) come from a counter
+# document. A BlockSequence reserves block_size numbers in one transaction and hands
+# them out locally, so most allocations cost no round trip and never contend on the
+# counter. Numbers still held when the process stops are never issued: the sequence
+# only increases but may have gaps. block_size=1 is strictly gapless - one
+# transaction per number, as before. Call next() off the event loop.
+class BlockSequence:
+    def __init__(self, collection: str, doc_id: str, field: str, block_size: int = 20):
+        self.collection = collection
+        self.doc_id = doc_id
+        self.field = field  # Counter field: the last number handed to any process
+        self.block_size = max(1, block_size)
+        self.next_number = 0  # Next number to issue from the local block (0 = no block held)
+        self.block_end = 0  # Last number of the local block
+        self.lock = threading.Lock()
+    
+    def _advance_counter(self, advance) -> int:
+        """Move the counter from its current value to advance(current) atomically; returns the old value"""
+        counter_ref = db.collection(self.collection).document(self.doc_id)
+        
+        def claim(snapshot, write):
+            current = (snapshot.to_dict() or {}).get(self.field, 0) if snapshot.exists else 0
+            new_value = advance(current)
+            if new_value != current:
+                write({self.field: new_value})
+            return current
+        
+        if isinstance(db, InMemoryDB):
+            return claim(counter_ref.get(), lambda data: counter_ref.set(data, merge=True))
+        
+        @firestore.transactional
+        def claim_in_transaction(transaction):
+            snapshot = counter_ref.get(transaction=transaction)
+            return claim(snapshot, lambda data: transaction.set(counter_ref, data, merge=True))
         
-        transaction.set(counter_ref, {'lastNumber': next_number})
-        return next_number
+        return claim_in_transaction(db.transaction())
     
-    # Transaction operations are synchronous, so no need to wrap increment_counter itself
-    # The transaction context handles atomicity
-    transaction = db.transaction()
-    return increment_counter(transaction)
+    def next(self):
+        """The next number, reserving a new block when the local one is used up"""
+        if not db:
+            return None
+        with self.lock:
+            if not self.next_number or self.next_number > self.block_end:
+                first = self._advance_counter(lambda current: current + self.block_size) + 1
+                self.next_number, self.block_end = first, first + self.block_size - 1
+            number = self.next_number
+            self.next_number += 1
+            return number
+    
+    def advance_to(self, number: int):
+        """Never issue number or anything below it (a manually chosen number was used)"""
+        if not db:
+            return
+        with self.lock:
+            if self.next_number and number < self.block_end:
+                self.next_number = max(self.next_number, number + 1)
+                return
+            self._advance_counter(lambda current: max(current, number))
+            self.next_number = self.block_end = 0
+
+bill_numbers = BlockSequence(BILL_COUNTER_COLLECTION, 'counter', 'lastNumber', block_size=BILL_NUMBER_BLOCK_SIZE)
+decree_numbers = BlockSequence('counters', 'royal_decrees', 'count', block_size=1)  # Decrees are numbered without gaps
+
+def get_next_bill_number():
+    """Get the next R.C. bill number (blocking - run in a thread)"""
+    return bill_numbers.next()
 
 def vote_counts(votes_dict):
     yes = len(votes_dict.get('yes', []))
@@ -2722,7 +3993,6 @@ def parse_reward_with_emojis(reward_text: str) -> str:
     
     # Match specific commodity keywords (check for common CivMC formats)
     # Pattern: digits followed by optional space and commodity abbreviation (tolerates punctuation)
-    import re
     
     # Use word boundaries (\b) to avoid matching within words, but allow punctuation after
     if re.search(r'\d+\s*d\b', reward_lower) or 'diamond' in reward_lower:
@@ -2821,7 +4091,37 @@ def results_embed(guild, bill):
     em.set_footer(text=f"{vis_text} - {threshold_text} | {timestamp}")
     return em
 
+# ---------- BILL EMBED CACHE ----------
+# Console refreshes redraw the same bill many times (every vote, every panel showing
+# it). The embed is rebuilt only when a field it shows changes: bill_render_key is
+# the content version, and _refresh skips the Discord edit entirely when the message
+# already shows that version.
+BILL_EMBED_FIELDS = (
+    'id', 'title', 'text', 'status', 'billType', 'category', 'visibility', 'votes', 'vetoNote',
+    'sponsorId', 'sponsorTag', 'sponsorDomain', 'proposerTag', 'coSponsors', 'coSponsorDetails',
+    'requiredCoSponsors', 'createdAt',
+)  # Every field render_bill_embed reads - keep in step with it
+bill_embeds = {}  # bill_id -> (render key, Embed)
+rendered_bill_messages = {}  # message_id -> render key last written by BillConsole._refresh
+
+def bill_render_key(bill: dict) -> str:
+    return repr([bill.get(field) for field in BILL_EMBED_FIELDS])
+
 def get_bill_embed(bill):
+    """Console embed for a bill, rebuilt only when its content changed (shared - don't modify it)"""
+    bill_id = bill.get('id')
+    key = bill_render_key(bill)
+    cached = bill_embeds.get(bill_id)
+    if cached and cached[0] == key:
+        return cached[1]
+    embed = render_bill_embed(bill)
+    bill_embeds.pop(bill_id, None)
+    if len(bill_embeds) >= BILL_EMBED_CACHE_SIZE:
+        bill_embeds.pop(next(iter(bill_embeds)))
+    bill_embeds[bill_id] = (key, embed)
+    return embed
+
+def render_bill_embed(bill):
     title = f"**{bill.get('title','Untitled')}**"
     
     # Color based on bill status
@@ -3015,6 +4315,7 @@ async def finalize_bill(ref, bill, guild, source_channel, is_auto=False):
     
     # Update database
     await asyncio.to_thread(lambda: ref.update({'status': new_status}))
+    await bill_changed(bill, {**bill, 'status': new_status})
     
     # Send results
     vis = bill.get('visibility','PUBLIC')
@@ -3034,29 +4335,228 @@ async def finalize_bill(ref, bill, guild, source_channel, is_auto=False):
     
     return True, "Finalized."
 
+# ---------- BILL DEADLINE SCHEDULER ----------
+# Vote reminders and auto-finalization fire at their exact due time from a min-heap
+# of deadlines instead of rescanning every voting bill on a poll. Deadlines derive
+# from the persisted votingStartAt, so the heap is rebuilt from one query at startup
+# and pushed to whenever a bill enters voting or is vetoed.
+BILL_REMINDER_AFTER = timedelta(hours=18)
+BILL_FINALIZE_AFTER = timedelta(hours=24)
+BILL_DEADLINE_RETRY = timedelta(minutes=5)  # Backoff before retrying a deadline that failed (the old poll interval)
+
+def resolve_bill_channel(bill: dict):
+    """(guild, channel) a bill was posted in, falling back to the first writable channel"""
+    guild_id = bill.get('guildId', 0)
+    channel_id = bill.get('channelId', 0)
+    
+    guild = bot.get_guild(guild_id) if guild_id else None
+    channel = bot.get_channel(channel_id) if channel_id else None
+    
+    # Fallback if stored IDs don't work
+    if not guild and bot.guilds:
+        guild = bot.guilds[0]
+    if not channel and guild:
+        channel = next((ch for ch in guild.text_channels if ch.permissions_for(guild.me).send_messages), None)
+    return guild, channel
+
+class BillDeadlineScheduler:
+    """Min-heap of (due, seq, action, bill_id, votingStartAt) served by a single sleeper task"""
+    
+    def __init__(self):
+        self.heap = []
+        self.seq = 0  # Tie-breaker so heap entries never compare bill IDs
+        self.wakeup = asyncio.Event()
+        self.runner = None
+        self.fired = {'remind': 0, 'finalize': 0}
+    
+    def schedule(self, bill_id: str, voting_start: datetime, reminder: bool = True):
+        """Queue the 18h reminder (optional) and 24h finalization for a bill"""
+        if not bill_id or not voting_start:
+            return
+        if voting_start.tzinfo is None:
+            voting_start = voting_start.replace(tzinfo=timezone.utc)
+        
+        actions = [('finalize', BILL_FINALIZE_AFTER)]
+        # No point reminding about a bill that is already due for finalization
+        if reminder and voting_start + BILL_FINALIZE_AFTER > datetime.now(timezone.utc):
+            actions.append(('remind', BILL_REMINDER_AFTER))
+        for action, offset in actions:
+            self.push(voting_start + offset, action, bill_id, voting_start)
+        self.wakeup.set()  # The new deadline may be earlier than the one being slept on
+    
+    def push(self, due: datetime, action: str, bill_id: str, voting_start: datetime):
+        self.seq += 1
+        heapq.heappush(self.heap, (due, self.seq, action, bill_id, voting_start))
+    
+    def retry(self, action: str, bill_id: str, voting_start: datetime):
+        """Re-queue a deadline that could not be served; reminders are dropped once finalization is due"""
+        due = datetime.now(timezone.utc) + BILL_DEADLINE_RETRY
+        if action == 'remind' and due >= voting_start + BILL_FINALIZE_AFTER:
+            return
+        self.push(due, action, bill_id, voting_start)
+    
+    def pending(self) -> list:
+        """Upcoming (due, action, bill_id) in order"""
+        return [(due, action, bill_id) for due, _, action, bill_id, _ in sorted(self.heap)]
+    
+    async def load(self):
+        """Rebuild the heap from the bills currently open for voting"""
+        if not db:
+            return
+        docs = await asyncio.to_thread(lambda: list(db.collection(BILL_COLLECTION_NAME).where(
+            filter=FieldFilter('status', 'in', ['Voting', 'Vetoed'])
+        ).stream()))
+        self.heap.clear()
+        for doc in docs:
+            bill = doc.to_dict()
+            # Skip bills without a timestamp (old bills before this feature)
+            reminder = bill.get('status') == 'Voting' and not bill.get('reminderSent')
+            self.schedule(bill.get('id'), bill.get('votingStartAt'), reminder=reminder)
+        print(f"[OK] Bill deadline scheduler loaded {len(self.heap)} deadline(s) from {len(docs)} open bill(s)")
+    
+    def start(self):
+        if self.runner is None or self.runner.done():
+            self.runner = asyncio.create_task(self.run())
+    
+    async def run(self):
+        await bot.wait_until_ready()
+        try:
+            await self.load()
+        except Exception as e:
+            print(f"[ERR] Bill deadline scheduler could not load open bills: {e}")
+        
+        while True:
+            self.wakeup.clear()
+            if not self.heap:
+                await self.wakeup.wait()
+                continue
+            
+            delay = (self.heap[0][0] - datetime.now(timezone.utc)).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            _, _, action, bill_id, voting_start = heapq.heappop(self.heap)
+            try:
+                done = await self.fire(action, bill_id, voting_start)
+            except Exception as e:
+                print(f"[{'AUTO-FINALIZE' if action == 'finalize' else 'REMINDER'}] Error on bill {bill_id}: {e} (retrying in {BILL_DEADLINE_RETRY})")
+                done = False
+            if not done:
+                self.retry(action, bill_id, voting_start)
+    
+    async def fire(self, action: str, bill_id: str, voting_start: datetime) -> bool:
+        """Re-read the bill (one read per deadline) and run the action if it still applies.
+        Returns False when the deadline should be retried."""
+        ref, bill = await asyncio.to_thread(find_bill_by_id_sync, bill_id, True)
+        if not bill:
+            return True
+        
+        # A bill that re-entered voting has a newer deadline queued - drop this one
+        current_start = bill.get('votingStartAt')
+        if current_start and current_start.tzinfo is None:
+            current_start = current_start.replace(tzinfo=timezone.utc)
+        if not current_start or abs((current_start - voting_start).total_seconds()) > 1:
+            return True
+        
+        if action == 'finalize':
+            done = await self.finalize(ref, bill)
+        else:
+            done = await self.remind(ref, bill)
+        if done:
+            self.fired[action] += 1
+        return done
+    
+    async def finalize(self, ref, bill: dict) -> bool:
+        """Finalize a bill whose voting period is over; False if it is still open afterwards"""
+        if bill.get('status') not in ('Voting', 'Vetoed'):
+            return True
+        
+        bill_id = bill.get('id', 'UNKNOWN')
+        print(f"[AUTO-FINALIZE] Processing bill {bill_id} (started {bill.get('votingStartAt')})")
+        guild, channel = resolve_bill_channel(bill)
+        if not channel:
+            print(f"[AUTO-FINALIZE] ⚠️ No channel available for bill {bill_id} (retrying in {BILL_DEADLINE_RETRY})")
+            return False
+        
+        success, message = await finalize_bill(ref, bill, guild, channel, is_auto=True)
+        if success:
+            print(f"[AUTO-FINALIZE] ✅ Finalized bill {bill_id}")
+        else:
+            print(f"[AUTO-FINALIZE] ⚠️ Could not finalize bill {bill_id}: {message} (retrying in {BILL_DEADLINE_RETRY})")
+        return success
+    
+    async def remind(self, ref, bill: dict) -> bool:
+        """Remind councilors who haven't voted that the bill closes in ~6 hours"""
+        if bill.get('status') != 'Voting' or bill.get('reminderSent'):
+            return True
+        
+        bill_id = bill.get('id', 'UNKNOWN')
+        guild_id = bill.get('guildId', 0)
+        channel_id = bill.get('channelId', 0)
+        guild = bot.get_guild(guild_id) if guild_id else None
+        channel = bot.get_channel(channel_id) if channel_id else None
+        if not (channel and guild):
+            return False
+        
+        votes = bill.get('votes', {'yes': [], 'no': [], 'abstain': []})
+        voted_ids = set(votes.get('yes', []) + votes.get('no', []) + votes.get('abstain', []))
+        
+        councilor_role = guild.get_role(ROYAL_COUNCILOR_ROLE_ID)
+        if not councilor_role:
+            return True
+        not_voted_count = len([m for m in councilor_role.members if m.id not in voted_ids])
+        if not_voted_count > 0:
+            bill_title = bill.get('title', 'Untitled')
+            await channel.send(
+                f"**Vote Reminder!** <@&{ROYAL_COUNCILOR_ROLE_ID}>\n\n"
+                f"**{bill_title}** has {not_voted_count} councilor(s) who haven't voted yet.\n"
+                f"Voting closes automatically in ~6 hours.\n"
+                f"Bill ID: \`{bill_id}\`"
+            )
+            
+            await asyncio.to_thread(lambda: ref.update({'reminderSent': True}))
+            bill_cache.forget(bill_id)
+            print(f"[REMINDER] Sent vote reminder for bill {bill_id}")
+        return True
+
+bill_deadlines = BillDeadlineScheduler()
+
 # ---------- BILL CONSOLE (Buttons) ----------
 from discord import ui
 
 class BillConsole(ui.View):
-    def __init__(self, bill_id: str):
+    """
+    Bill controls. Every control is a DynamicItem whose custom_id carries the bill
+    ID, so one handler registered at startup (see BILL_CONSOLE_ITEMS) serves every
+    bill message - no per-bill view has to be re-registered after a restart.
+    Callbacks build a bare console (controls=False) for the shared helpers below.
+    """
+    def __init__(self, bill_id: str, controls: bool = True, bill: dict = None):
         super().__init__(timeout=None)
         self.bill_id = bill_id
+        if not controls:
+            return
         
-        # Get bill status to conditionally show buttons
-        _, bill = find_bill_by_id_sync(bill_id)
+        # Get bill status to conditionally show buttons (callers that just wrote the bill pass it in)
+        if bill is None:
+            _, bill = find_bill_by_id_sync(bill_id)
         if bill:
             status = bill.get('status', 'Pending')
             
             # Show sponsor and co-sponsor buttons when Awaiting Sponsor
             if status == 'Awaiting Sponsor':
-                self.add_item(SponsorButton())
-                self.add_item(CoSponsorButton())
-                self.add_item(ToggleConfidentialityButton())
+                self.add_item(SponsorButton(bill_id))
+                self.add_item(CoSponsorButton(bill_id))
+                self.add_item(ToggleConfidentialityButton(bill_id))
             
             # Show co-sponsor button only when Pending
             elif status == 'Pending':
-                self.add_item(CoSponsorButton())
-                self.add_item(ToggleConfidentialityButton())
+                self.add_item(CoSponsorButton(bill_id))
+                self.add_item(ToggleConfidentialityButton(bill_id))
             
             # Show voting dropdown only when Voting or Vetoed (no confidentiality toggle during voting)
             elif status in ('Voting', 'Vetoed'):
@@ -3064,18 +4564,24 @@ class BillConsole(ui.View):
             
             # Show Soberante actions when bill is Passed (enact as law or veto)
             elif status == 'Passed':
-                self.add_item(SoberanteActionSelect())
+                self.add_item(SoberanteActionSelect(bill_id))
 
-    def _get(self):
-        return find_bill_by_id_sync(self.bill_id)
+    def _get(self, fresh: bool = False):
+        return find_bill_by_id_sync(self.bill_id, fresh)
 
-    async def _refresh(self, interaction):
-        _, bill = self._get()
+    async def _refresh(self, interaction, bill: dict = None):
+        """Redraw the bill message; pass the bill as just written to skip re-reading it"""
+        if bill is None:
+            _, bill = self._get()
         if not bill:
             return
+        key = bill_render_key(bill)
+        message_id = interaction.message.id if interaction.message else None
+        if message_id and rendered_bill_messages.get(message_id) == key:
+            return  # The message already shows this version (e.g. a repeated vote)
         try:
             # Recreate view with updated button state
-            new_view = BillConsole(self.bill_id)
+            new_view = BillConsole(self.bill_id, bill=bill)
             # Fetch the message fresh to avoid race conditions
             channel = interaction.channel
             if channel and interaction.message:
@@ -3085,6 +4591,10 @@ class BillConsole(ui.View):
                 except:
                     # If fetch fails, try direct edit
                     await interaction.message.edit(embed=get_bill_embed(bill), view=new_view)
+                rendered_bill_messages.pop(message_id, None)
+                if len(rendered_bill_messages) >= BILL_EMBED_CACHE_SIZE:
+                    rendered_bill_messages.pop(next(iter(rendered_bill_messages)))
+                rendered_bill_messages[message_id] = key
         except Exception as e:
             print(f"[WARN] Bill refresh failed: {e}")
             pass
@@ -3103,6 +4613,22 @@ class BillConsole(ui.View):
         return any(getattr(r, "id", 0) == MONARCH_ROLE_ID for r in interaction.user.roles)
 
 # Button Classes
+def bill_id_for_message_sync(message_id: int):
+    """Resolve the bill posted in a message (for consoles sent before controls carried the bill ID)"""
+    if not db:
+        return None
+    for doc in db.collection(BILL_COLLECTION_NAME).where(filter=FieldFilter('messageId', '==', message_id)).limit(1).stream():
+        return doc.to_dict().get('id')
+    return None
+
+async def bill_id_from_match(interaction: discord.Interaction, match) -> str:
+    """Bill ID from a console custom_id match, falling back to the message lookup for legacy static IDs"""
+    if match['bill_id']:
+        return match['bill_id']
+    if not interaction.message:
+        return None
+    return await asyncio.to_thread(bill_id_for_message_sync, interaction.message.id)
+
 class SponsorDomainSelect(ui.Select):
     def __init__(self, bill_id: str):
         self.bill_id = bill_id
@@ -3123,7 +4649,7 @@ class SponsorDomainSelect(ui.Select):
         uid = interaction.user.id
         
         # Get next bill number
-        bill_number = get_next_bill_number()
+        bill_number = await asyncio.to_thread(get_next_bill_number)
         
         # Update title to include R.C. number
         original_title = bill.get('title', 'Untitled')
@@ -3145,6 +4671,8 @@ class SponsorDomainSelect(ui.Select):
             updates['billNumber'] = bill_number
         
         await asyncio.to_thread(lambda: ref.update(updates))
+        await bill_changed(bill, {**bill, **updates})
+        bill_deadlines.schedule(bill.get('id'), updates['votingStartAt'])
         await interaction.response.send_message(f"✅ You are now the Sponsor with **{selected_domain}** role!", ephemeral=True)
         
         # Move bill to voting channel if configured
@@ -3172,6 +4700,7 @@ class SponsorDomainSelect(ui.Select):
                         view=BillConsole(bill_id=self.bill_id)
                     )
                     await asyncio.to_thread(lambda: ref.update({'messageId': new_message.id, 'channelId': voting_channel.id}))
+                    bill_cache.forget(self.bill_id)
                     # Notify councilors about new vote
                     await notify_councilors_new_vote(interaction.guild, updated_bill, voting_channel)
         except Exception as e:
@@ -3182,12 +4711,17 @@ class SponsorDomainSelectView(ui.View):
         super().__init__(timeout=180)
         self.add_item(SponsorDomainSelect(bill_id))
 
-class SponsorButton(ui.Button):
-    def __init__(self):
-        super().__init__(label="👤 Claim Sponsorship", style=discord.ButtonStyle.primary, custom_id="btn_sponsor")
+class SponsorButton(ui.DynamicItem[ui.Button], template=r'bill:sponsor:(?P<bill_id>.+)|btn_sponsor'):
+    def __init__(self, bill_id: str):
+        super().__init__(ui.Button(label="👤 Claim Sponsorship", style=discord.ButtonStyle.primary, custom_id=f"bill:sponsor:{bill_id}"))
+        self.bill_id = bill_id
+    
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Button, match):
+        return cls(await bill_id_from_match(interaction, match))
     
     async def callback(self, interaction: discord.Interaction):
-        view: BillConsole = self.view
+        view = BillConsole(self.bill_id, controls=False)
         ref, bill = view._get()
         if not ref or not bill:
             return await interaction.response.send_message("Edict not found or database unavailable.", ephemeral=True)
@@ -3252,7 +4786,7 @@ class DomainSelect(ui.Select):
         status_changed_to_voting = False
         if len(co_sponsors) >= required:
             # Get next bill number
-            bill_number = get_next_bill_number()
+            bill_number = await asyncio.to_thread(get_next_bill_number)
             if bill_number:
                 # Update title to include R.C. number
                 original_title = bill.get('title', 'Untitled')
@@ -3265,6 +4799,10 @@ class DomainSelect(ui.Select):
             status_changed_to_voting = True
         
         await asyncio.to_thread(lambda: ref.update(updates))
+        bill_cache.forget(self.bill_id)
+        if status_changed_to_voting:
+            await bill_changed(bill, {**bill, **updates})
+            bill_deadlines.schedule(bill.get('id'), updates['votingStartAt'])
         await interaction.response.send_message(f"✅ Co-sponsorship recorded for **{selected_domain}**!", ephemeral=True)
         
         # Refresh or move the bill message
@@ -3295,6 +4833,7 @@ class DomainSelect(ui.Select):
                             view=BillConsole(bill_id=self.bill_id)
                         )
                         await asyncio.to_thread(lambda: ref.update({'messageId': new_message.id, 'channelId': voting_channel.id}))
+                        bill_cache.forget(self.bill_id)
                         # Notify councilors about new vote
                         await notify_councilors_new_vote(interaction.guild, updated_bill, voting_channel)
                         return
@@ -3311,12 +4850,17 @@ class DomainSelectView(ui.View):
         super().__init__(timeout=180)
         self.add_item(DomainSelect(bill_id))
 
-class CoSponsorButton(ui.Button):
-    def __init__(self):
-        super().__init__(label="🤝 Add Co-Sponsorship", style=discord.ButtonStyle.success, custom_id="btn_cosponsor")
+class CoSponsorButton(ui.DynamicItem[ui.Button], template=r'bill:cosponsor:(?P<bill_id>.+)|btn_cosponsor'):
+    def __init__(self, bill_id: str):
+        super().__init__(ui.Button(label="🤝 Add Co-Sponsorship", style=discord.ButtonStyle.success, custom_id=f"bill:cosponsor:{bill_id}"))
+        self.bill_id = bill_id
+    
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Button, match):
+        return cls(await bill_id_from_match(interaction, match))
     
     async def callback(self, interaction: discord.Interaction):
-        view: BillConsole = self.view
+        view = BillConsole(self.bill_id, controls=False)
         
         # RESPOND IMMEDIATELY to avoid timeout
         await interaction.response.send_message("⏳ Loading co-sponsorship...", ephemeral=True)
@@ -3346,24 +4890,28 @@ class CoSponsorButton(ui.Button):
             view=DomainSelectView(bill_id)
         )
 
-class VotingActionSelect(ui.Select):
+class VotingActionSelect(ui.DynamicItem[ui.Select], template=r'(?:bill:vote:|vote_action_)(?P<bill_id>.+)'):
     def __init__(self, bill_id: str):
-        self.bill_id = bill_id
         options = [
             discord.SelectOption(label=SPAN['YES'], value="yes"),
             discord.SelectOption(label=SPAN['NO'], value="no"),
             discord.SelectOption(label=SPAN['ABSTAIN'], value="abstain"),
             discord.SelectOption(label="Finalize Bill", value="finalize")
         ]
-        super().__init__(
+        super().__init__(ui.Select(
             placeholder="Select voting action...",
             options=options,
-            custom_id=f"vote_action_{bill_id}"
-        )
+            custom_id=f"bill:vote:{bill_id}"
+        ))
+        self.bill_id = bill_id
+    
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Select, match):
+        return cls(match['bill_id'])
     
     async def callback(self, interaction: discord.Interaction):
-        view: BillConsole = self.view
-        action = self.values[0]
+        view = BillConsole(self.bill_id, controls=False)
+        action = self.item.values[0]
         
         # RESPOND IMMEDIATELY to avoid timeout
         if action == "finalize":
@@ -3371,7 +4919,7 @@ class VotingActionSelect(ui.Select):
         else:
             await interaction.response.send_message("⏳ Recording vote...", ephemeral=True)
         
-        ref, bill = view._get()
+        ref, bill = view._get(fresh=action == "finalize")  # Finalizing counts the votes: never from cache
         if not ref or not bill:
             return await interaction.edit_original_response(content="Edict not found or database unavailable.")
         
@@ -3395,6 +4943,7 @@ class VotingActionSelect(ui.Select):
         
         uid = interaction.user.id
         votes = bill.get('votes', {'yes': [], 'no': [], 'abstain': []})
+        previous_choice = current_vote(votes, uid)
         
         # Remove user from all vote categories
         votes['yes'] = [x for x in votes.get('yes', []) if x != uid]
@@ -3412,24 +4961,41 @@ class VotingActionSelect(ui.Select):
             votes['abstain'].append(uid)
             await interaction.edit_original_response(content=f"⚪ Recorded **{SPAN['ABSTAIN']}**")
         
-        await asyncio.to_thread(lambda: ref.update({'votes': votes}))
-        await view._refresh(interaction)
+        def record_vote():
+            # Array union/remove touch only this member's ID, so concurrent votes on the
+            # same bill cannot overwrite each other; the vote index changes in the same batch
+            batch = db.batch()
+            batch.update(ref, {
+                f'votes.{choice}': firestore.ArrayUnion([uid]) if choice == action else firestore.ArrayRemove([uid])
+                for choice in VOTE_CHOICES
+            })
+            stage_vote_index(batch, uid, bill, previous_choice, action, datetime.now(timezone.utc))
+            batch.commit()
+            bill_cache.forget(self.bill_id)
+        
+        await asyncio.to_thread(record_vote)
+        await view._refresh(interaction, {**bill, 'votes': votes})
 
-class SoberanteActionSelect(ui.Select):
-    def __init__(self):
+class SoberanteActionSelect(ui.DynamicItem[ui.Select], template=r'bill:soberante:(?P<bill_id>.+)|soberante_action_select'):
+    def __init__(self, bill_id: str):
         options = [
             discord.SelectOption(label="Enact as Law", value="enact"),
             discord.SelectOption(label="Veto", value="veto")
         ]
-        super().__init__(
+        super().__init__(ui.Select(
             placeholder="👑 Soberante Actions...",
             options=options,
-            custom_id="soberante_action_select"
-        )
+            custom_id=f"bill:soberante:{bill_id}"
+        ))
+        self.bill_id = bill_id
+    
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Select, match):
+        return cls(await bill_id_from_match(interaction, match))
     
     async def callback(self, interaction: discord.Interaction):
-        view: BillConsole = self.view
-        action = self.values[0]
+        view = BillConsole(self.bill_id, controls=False)
+        action = self.item.values[0]
         
         # RESPOND IMMEDIATELY to avoid timeout
         if action == "enact":
@@ -3457,6 +5023,7 @@ class SoberanteActionSelect(ui.Select):
             
             # Update status to Bill is Now Law
             await asyncio.to_thread(lambda: ref.update({'status': 'Bill is Now Law'}))
+            await bill_changed(bill, {**bill, 'status': 'Bill is Now Law'})
             
             bill_type = bill.get('billType', 'STANDARD')
             display_status = get_display_status('Bill is Now Law', bill_type)
@@ -3469,17 +5036,25 @@ class SoberanteActionSelect(ui.Select):
                 'status': 'Vetoed',
                 'vetoNote': '🛑 Bill vetoed by Soberante. Requires 2/3 override.'
             }))
+            await bill_changed(bill, {**bill, 'status': 'Vetoed'})
+            # Vetoed bills are auto-finalized on the original 24h deadline (immediately if it has passed)
+            bill_deadlines.schedule(bill.get('id'), bill.get('votingStartAt'), reminder=False)
             
             await interaction.edit_original_response(content="🛑 Bill has been **vetoed** by Soberante!")
         
         await view._refresh(interaction)
 
-class ToggleConfidentialityButton(ui.Button):
-    def __init__(self):
-        super().__init__(label="🔒 Toggle Confidentiality", style=discord.ButtonStyle.secondary, custom_id="btn_toggle_conf")
+class ToggleConfidentialityButton(ui.DynamicItem[ui.Button], template=r'bill:conf:(?P<bill_id>.+)|btn_toggle_conf'):
+    def __init__(self, bill_id: str):
+        super().__init__(ui.Button(label="🔒 Toggle Confidentiality", style=discord.ButtonStyle.secondary, custom_id=f"bill:conf:{bill_id}"))
+        self.bill_id = bill_id
+    
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Button, match):
+        return cls(await bill_id_from_match(interaction, match))
     
     async def callback(self, interaction: discord.Interaction):
-        view: BillConsole = self.view
+        view = BillConsole(self.bill_id, controls=False)
         
         # RESPOND IMMEDIATELY to avoid timeout
         await interaction.response.send_message("⏳ Toggling confidentiality...", ephemeral=True)
@@ -3504,11 +5079,15 @@ class ToggleConfidentialityButton(ui.Button):
         current_vis = bill.get('visibility', 'PUBLIC')
         new_vis = 'CONFIDENTIAL' if current_vis == 'PUBLIC' else 'PUBLIC'
         await asyncio.to_thread(lambda: ref.update({'visibility': new_vis}))
+        bill_cache.forget(self.bill_id)
         
         vis_emoji = "🔒" if new_vis == 'CONFIDENTIAL' else "🔓"
         await interaction.edit_original_response(content=f"{vis_emoji} Voting is now **{new_vis}**")
         await view._refresh(interaction)
 
+# Registered once in setup_hook - parse the bill ID from custom_id at click time
+BILL_CONSOLE_ITEMS = (SponsorButton, CoSponsorButton, VotingActionSelect, SoberanteActionSelect, ToggleConfidentialityButton)
+
 class EnactAsLawButton(ui.Button):
     def __init__(self):
         super().__init__(label="📜 Enact as Law", style=discord.ButtonStyle.success, custom_id="btn_enact_law")
@@ -3543,6 +5122,7 @@ class EnactAsLawButton(ui.Button):
             
             # Update status to Bill is Now Law
             await asyncio.to_thread(lambda: ref.update({'status': 'Bill is Now Law'}))
+            await bill_changed(bill, {**bill, 'status': 'Bill is Now Law'})
             
             bill_type = bill.get('billType', 'STANDARD')
             display_status = get_display_status('Bill is Now Law', bill_type)
@@ -3586,6 +5166,8 @@ class VetoPassedBillButton(ui.Button):
             'status': 'Vetoed',
             'vetoNote': '🛑 Bill vetoed by Soberante. Requires 2/3 override.'
         }))
+        await bill_changed(bill, {**bill, 'status': 'Vetoed'})
+        bill_deadlines.schedule(bill.get('id'), bill.get('votingStartAt'), reminder=False)
         
         await interaction.edit_original_response(content="🛑 Bill has been **vetoed** by Soberante!")
         await view._refresh(interaction)
@@ -3658,9 +5240,6 @@ class BillCreationModal(ui.Modal, title="Create a Bill"):
         edict_text = f"By the authority of the Royal Council, be it known that...\n\n{description}"
         
         try:
-            bill_ref = db.collection(BILL_COLLECTION_NAME).document()
-            bill_id = bill_ref.id[:6].upper()
-            
             # Constitutional Amendments skip sponsorship and go straight to voting with 2/3 majority
             is_constitutional = self.bill_type == 'CONSTITUTIONAL_AMENDMENT'
             initial_status = BILL_STATUSES['VOTING'] if is_constitutional else BILL_STATUSES['AWAITING_SPONSOR']
@@ -3669,12 +5248,11 @@ class BillCreationModal(ui.Modal, title="Create a Bill"):
             # Assign bill number if going straight to voting
             bill_title = title
             if is_constitutional:
-                bill_number = get_next_bill_number()
+                bill_number = await asyncio.to_thread(get_next_bill_number)
                 if bill_number:
                     bill_title = f"R.C. {bill_number:03d} - {title}"
             
             new_bill = {
-                'id': bill_id,
                 'title': bill_title,
                 'category': category,
                 'text': edict_text,
@@ -3701,7 +5279,20 @@ class BillCreationModal(ui.Modal, title="Create a Bill"):
                 if bill_number:
                     new_bill['billNumber'] = bill_number
             
-            await asyncio.to_thread(lambda: bill_ref.set(new_bill))
+            # Keyed by public ID: a short random ID, created (never overwritten) so a collision retries
+            for attempt in range(BILL_ID_ATTEMPTS):
+                bill_id = db.collection(BILL_COLLECTION_NAME).document().id[:6].upper()
+                bill_ref = db.collection(BILL_COLLECTION_NAME).document(bill_id)
+                new_bill['id'] = bill_id
+                try:
+                    await asyncio.to_thread(bill_ref.create, new_bill)
+                    break
+                except DOCUMENT_EXISTS_ERRORS:
+                    if attempt == BILL_ID_ATTEMPTS - 1:
+                        raise
+            await bill_changed(None, new_bill)
+            if is_constitutional:
+                bill_deadlines.schedule(new_bill.get('id'), new_bill['votingStartAt'])
         except Exception as e:
             print(f"[ERR] Firestore save failed: {e}")
             return await interaction.edit_original_response(content="Failed to register the Edict.")
@@ -3731,6 +5322,7 @@ class BillCreationModal(ui.Modal, title="Create a Bill"):
         # Save the message ID back to the database so we can update it later
         try:
             await asyncio.to_thread(lambda: bill_ref.update({'messageId': bill_message.id, 'channelId': posting_channel.id}))
+            bill_cache.forget(bill_id)
         except Exception as e:
             print(f"[WARN] Could not save message ID: {e}")
         
@@ -4072,54 +5664,24 @@ class SetupWizardDeployButton(discord.ui.Button):
                     }))
                     
             elif step_key == "setup_warrant":
-                job_data = {
-                    'type': 'warrant_panel',
-                    'guildId': interaction.guild.id,
-                    'channelId': interaction.channel.id,
-                    'requestedBy': interaction.user.id,
-                    'createdAt': datetime.now(timezone.utc),
-                    'status': 'pending'
-                }
-                current_db = await ensure_firestore()
-                if current_db:
-                    await asyncio.to_thread(lambda: current_db.collection('florabi_panel_jobs').add(job_data))
-                await interaction.followup.send(f"✅ **{step_name}** queued for deployment (posts within 30 seconds).", ephemeral=True)
+                await enqueue_panel_job('warrant', interaction.guild.id, interaction.channel.id, interaction.user.id)
+                await interaction.followup.send(f"✅ **{step_name}** queued for deployment (posts in a few seconds).", ephemeral=True)
                 view.current_step += 1
                 view.update_buttons()
                 await interaction.edit_original_response(embed=view.get_embed(), view=view)
                 return
                     
             elif step_key == "setup_pearl":
-                job_data = {
-                    'type': 'pearl_panel',
-                    'guildId': interaction.guild.id,
-                    'channelId': interaction.channel.id,
-                    'requestedBy': interaction.user.id,
-                    'createdAt': datetime.now(timezone.utc),
-                    'status': 'pending'
-                }
-                current_db = await ensure_firestore()
-                if current_db:
-                    await asyncio.to_thread(lambda: current_db.collection('florabi_panel_jobs').add(job_data))
-                await interaction.followup.send(f"✅ **{step_name}** queued for deployment (posts within 30 seconds).", ephemeral=True)
+                await enqueue_panel_job('pearl', interaction.guild.id, interaction.channel.id, interaction.user.id)
+                await interaction.followup.send(f"✅ **{step_name}** queued for deployment (posts in a few seconds).", ephemeral=True)
                 view.current_step += 1
                 view.update_buttons()
                 await interaction.edit_original_response(embed=view.get_embed(), view=view)
                 return
                     
             elif step_key == "setup_economy":
-                job_data = {
-                    'type': 'economy_panel',
-                    'guildId': interaction.guild.id,
-                    'channelId': interaction.channel.id,
-                    'requestedBy': interaction.user.id,
-                    'createdAt': datetime.now(timezone.utc),
-                    'status': 'pending'
-                }
-                current_db = await ensure_firestore()
-                if current_db:
-                    await asyncio.to_thread(lambda: current_db.collection('florabi_panel_jobs').add(job_data))
-                await interaction.followup.send(f"✅ **{step_name}** queued for deployment (posts within 30 seconds).", ephemeral=True)
+                await enqueue_panel_job('economy', interaction.guild.id, interaction.channel.id, interaction.user.id)
+                await interaction.followup.send(f"✅ **{step_name}** queued for deployment (posts in a few seconds).", ephemeral=True)
                 view.current_step += 1
                 view.update_buttons()
                 await interaction.edit_original_response(embed=view.get_embed(), view=view)
@@ -4296,6 +5858,59 @@ async def migrate_treasury(interaction: discord.Interaction):
         traceback.print_exc()
         await interaction.edit_original_response(content=f"❌ Migration failed: {str(e)}")
 
+@bot.tree.command(name="migrate_bill_ids", description="[ADMIN ONLY] One-time migration: Key bill documents by their public ID")
+async def migrate_bill_ids(interaction: discord.Interaction):
+    """Admin-only command to move bills from auto-generated document IDs to their public bill ID"""
+    if not has_admin_role(interaction):
+        return await interaction.response.send_message("❌ This command is for Admins only.", ephemeral=True)
+    
+    await interaction.response.send_message("⏳ Migrating bill documents...", ephemeral=True)
+    
+    if not db:
+        return await interaction.edit_original_response(content="❌ Database not available.")
+    
+    def migrate():
+        bills_ref = db.collection(BILL_COLLECTION_NAME)
+        migrated, already, conflicts = 0, 0, []
+        for doc in bills_ref.stream():
+            bill = doc.to_dict()
+            bill_id = bill.get('id')
+            if not bill_id or doc.id == bill_id:
+                already += 1
+                continue
+            target = bills_ref.document(bill_id)
+            if '/' in bill_id or target.get().exists:
+                conflicts.append(bill_id)
+                continue
+            # Copy then delete in one batch, so the bill is never missing or doubled
+            batch = db.batch()
+            batch.set(target, {**bill, 'migratedFrom': doc.id})
+            batch.delete(doc.reference)
+            batch.commit()
+            bill_cache.forget(bill_id)
+            migrated += 1
+            print(f"[MIGRATION] Bill {bill_id}: {doc.id} → {bill_id}")
+        return migrated, already, conflicts
+    
+    try:
+        migrated_count, already_migrated_count, conflicts = await asyncio.to_thread(migrate)
+        
+        result_msg = f"✅ **Bill Migration Complete!**\n\n"
+        result_msg += f"**Migrated:** {migrated_count} bills\n"
+        result_msg += f"**Already Migrated:** {already_migrated_count} bills\n"
+        if conflicts:
+            result_msg += f"**Skipped (ID already taken):** {', '.join(conflicts[:20])}\n"
+            print(f"[WARN] Bill migration skipped {len(conflicts)} bills whose ID is already a document: {conflicts}")
+        
+        await interaction.edit_original_response(content=result_msg)
+        print(f"[OK] Bill ID migration completed by {interaction.user}")
+        
+    except Exception as e:
+        print(f"[ERR] Bill migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        await interaction.edit_original_response(content=f"❌ Migration failed: {str(e)}")
+
 @bot.tree.command(name="delete_bill", description="[ADMIN ONLY] Delete a bill by ID")
 @app_commands.describe(bill_id="The 6-character bill ID (e.g., AB12CD)")
 async def delete_bill(interaction: discord.Interaction, bill_id: str):
@@ -4329,6 +5944,7 @@ async def delete_bill(interaction: discord.Interaction, bill_id: str):
     
         # Delete from database
         doc_ref.delete()
+        await bill_changed(bill_data, None)
         
         await interaction.edit_original_response(content=f"✅ Bill `{bill_id}` deleted successfully!")
         
@@ -4361,41 +5977,15 @@ async def decree(interaction: discord.Interaction, decree_text: str, decree_numb
         return await interaction.edit_original_response(content="❌ Only the Soberante can issue Royal Decrees.")
     
     try:
-        # Get decree number (manual or auto-increment)
-        if decree_number is None:
-            # Auto-increment from counter - wrap blocking .get() call
-            counter_ref = db.collection('counters').document('royal_decrees')
-            counter_doc = await asyncio.to_thread(lambda: counter_ref.get())
-            
-            if counter_doc.exists:
-                decree_number = counter_doc.to_dict().get('count', 0) + 1
-            else:
-                decree_number = 1
-            
-            # Update the counter
-            await asyncio.to_thread(lambda: counter_ref.set({'count': decree_number}))
-        else:
-            # Manual number provided - also update counter if this number is higher - wrap blocking .get() call
-            counter_ref = db.collection('counters').document('royal_decrees')
-            counter_doc = await asyncio.to_thread(lambda: counter_ref.get())
-            current_count = counter_doc.to_dict().get('count', 0) if counter_doc.exists else 0
-            
-            # Update counter to at least this number
-            if decree_number > current_count:
-                await asyncio.to_thread(lambda: counter_ref.set({'count': decree_number}))
-        
-        # Create the decree document
-        bill_ref = db.collection(BILL_COLLECTION_NAME).document()
-        
-        # Convert to Roman numerals for display
-        decree_roman = int_to_roman(decree_number)
+        manual_number = decree_number is not None
+        if manual_number:
+            # Manual number provided - also update counter if this number is higher
+            await asyncio.to_thread(decree_numbers.advance_to, decree_number)
         
         # Format decree with custom styling
         formal_text = f"❄️ 𝓡𝓸𝔂𝓪𝓵 𝓓𝓮𝓬𝓻𝓮𝓮 ❄️\n\n{decree_text}\n\n━━━━━━━\n𝓒𝓮𝓼𝓪𝓻𝓻𝓻𝟓𝟎𝟓"
         
         new_decree = {
-            'id': str(decree_number),
-            'title': f'Royal Decree {decree_roman}',
             'text': formal_text,
             'sponsorId': interaction.user.id,
             'sponsorTag': interaction.user.mention,
@@ -4409,10 +5999,24 @@ async def decree(interaction: discord.Interaction, decree_text: str, decree_numb
             'createdAt': datetime.now(),
             'channelId': interaction.channel.id if interaction.channel else 0,
             'guildId': interaction.guild.id if interaction.guild else 0,
-            'decreeNumber': decree_number,
         }
         
-        await asyncio.to_thread(lambda: bill_ref.set(new_decree))
+        # Create the decree document, keyed by its public ID (the decree number). create() never
+        # overwrites: a taken manual number is refused, a taken counter number moves on to the next.
+        for attempt in range(BILL_ID_ATTEMPTS):
+            if not manual_number:
+                decree_number = await asyncio.to_thread(decree_numbers.next)
+            decree_roman = int_to_roman(decree_number)
+            new_decree.update({'id': str(decree_number), 'title': f'Royal Decree {decree_roman}', 'decreeNumber': decree_number})
+            try:
+                await asyncio.to_thread(db.collection(BILL_COLLECTION_NAME).document(str(decree_number)).create, new_decree)
+                break
+            except DOCUMENT_EXISTS_ERRORS:
+                if manual_number:
+                    return await interaction.edit_original_response(content=f"❌ Royal Decree {decree_number} already exists. Choose another number.")
+                if attempt == BILL_ID_ATTEMPTS - 1:
+                    raise
+        await bill_changed(None, new_decree)
         
         embed = discord.Embed(
             title=f"Royal Decree {decree_roman}",
@@ -4462,21 +6066,10 @@ async def decree_edit(interaction: discord.Interaction, decree_number: int, new_
         return await interaction.edit_original_response(content="❌ Only the Soberante can edit Royal Decrees.")
     
     try:
-        # Find the decree to edit - query only on billType to avoid composite index requirement
-        # Wrap blocking .stream() call
-        bills_query = await asyncio.to_thread(lambda: list(db.collection(BILL_COLLECTION_NAME).where(
-            filter=FieldFilter('billType', '==', 'ROYAL_DECREE')
-        ).stream()))
-        
-        # Filter in code to find matching decree number
-        decree_doc = None
-        for doc in bills_query:
-            doc_data = doc.to_dict()
-            if doc_data.get('decreeNumber') == decree_number:
-                decree_doc = doc
-                break
+        # Find the decree to edit - decrees use their number as public ID
+        decree_ref, decree_data = await asyncio.to_thread(find_bill_by_id_sync, str(decree_number))
         
-        if not decree_doc:
+        if not decree_data or decree_data.get('billType') != 'ROYAL_DECREE':
             return await interaction.edit_original_response(content=f"❌ Royal Decree {decree_number} not found.")
         
         # Convert to Roman numerals for display
@@ -4486,11 +6079,12 @@ async def decree_edit(interaction: discord.Interaction, decree_number: int, new_
         formal_text = f"❄️ 𝓡𝓸𝔂𝓪𝓵 𝓓𝓮𝓬𝓻𝓮𝓮 ❄️\n\n{new_decree_text}\n\n━━━━━━━\n𝓒𝓮𝓼𝓪𝓻𝓻𝓻𝟓𝟎𝟓"
         
         # Update the decree
-        await asyncio.to_thread(lambda: decree_doc.reference.update({
+        await asyncio.to_thread(lambda: decree_ref.update({
             'text': formal_text,
             'editedAt': datetime.now(),
             'editedBy': interaction.user.id
         }))
+        await bill_changed(decree_data, {**decree_data, 'text': formal_text})
         
         embed = discord.Embed(
             title=f"Royal Decree {decree_roman} (Edited)",
@@ -4520,10 +6114,18 @@ async def decree_edit(interaction: discord.Interaction, decree_number: int, new_
         traceback.print_exc()
         await interaction.edit_original_response(content="❌ Failed to edit Royal Decree.")
 
+startup_mark("legislature")
+
 # ========================================
 # PEARL TRACKING SYSTEM
 # ========================================
 
+# Essence tier schedule: (first day, last day or None for open-ended, essence per day)
+PEARL_ESSENCE_TIERS = (
+    (1, 1, 2.0),     # First day ONLY: 2 essence/day
+    (2, None, 3.0),  # Day 2 onwards: 3 essence/day
+)
+
 def calculate_pearl_essence_cost(days_held: int) -> float:
     """
     Calculate tiered essence fuel cost for pearls.
@@ -4536,10 +6138,55 @@ def calculate_pearl_essence_cost(days_held: int) -> float:
     Returns:
         Daily essence cost
     """
-    if days_held == 1:
-        return 2.0  # First day ONLY: 2 essence/day
-    else:
-        return 3.0  # Day 2 onwards: 3 essence/day
+    for first, last, rate in PEARL_ESSENCE_TIERS:
+        if days_held >= first and (last is None or days_held <= last):
+            return rate
+    return PEARL_ESSENCE_TIERS[-1][2]
+
+def pearl_essence_between(from_day: int, to_day: int) -> float:
+    """
+    Essence burned over held days from_day+1 .. to_day, in closed form over the
+    tier schedule - equal to summing calculate_pearl_essence_cost per day, but
+    O(tiers) instead of O(days).
+    """
+    if to_day <= from_day:
+        return 0.0
+    total = 0.0
+    covered = 0
+    for first, last, rate in PEARL_ESSENCE_TIERS:
+        lo = max(from_day + 1, first)
+        hi = to_day if last is None else min(to_day, last)
+        if hi >= lo:
+            total += (hi - lo + 1) * rate
+            covered += hi - lo + 1
+    # Days before the first tier are charged like calculate_pearl_essence_cost does
+    return total + (to_day - from_day - covered) * PEARL_ESSENCE_TIERS[-1][2]
+
+def pearl_essence_checkpoint(pearl: dict, now: datetime = None) -> tuple:
+    """
+    Lazily evaluate a pearl's fuel. The stored essenceRemaining is a checkpoint
+    taken at lastEssenceUpdate; every whole day since then is burned in closed form.
+    
+    Returns:
+        (essence_remaining, checkpoint_time) - checkpoint_time is lastEssenceUpdate
+        advanced by the whole days burned, so writing both back keeps the daily
+        phase. (None, None) for unmigrated pearls.
+    """
+    essence = pearl.get('essenceRemaining')
+    last_update = pearl.get('lastEssenceUpdate')
+    if essence is None or not last_update:
+        return None, None
+    
+    now = now or datetime.now(timezone.utc)
+    elapsed_days = max(int((now - last_update).total_seconds() // 86400), 0)
+    pearl_start = pearl.get('pearlStartDate') or last_update
+    base_days_held = (last_update - pearl_start).days
+    burned = pearl_essence_between(base_days_held, base_days_held + elapsed_days)
+    return max(essence - burned, 0.0), last_update + timedelta(days=elapsed_days)
+
+def pearl_essence_remaining(pearl: dict, now: datetime = None):
+    """Current essence for display (None for unmigrated pearls, so callers can fall back)"""
+    return pearl_essence_checkpoint(pearl, now)[0]
 
 def format_pearl_display(duration: int, release_date: datetime, pearl_start: datetime, essence_remaining: float, essence_capacity: float, days_left: int) -> tuple:
     """
@@ -4810,12 +6457,12 @@ async def pearl_migrate(interaction: discord.Interaction, dry_run: bool = True,
             
             # Calculate essenceRemaining = capacity - consumed_so_far
             essence_consumed = 0.0
+            checkpoint = pearl_start
             if pearl_start:
                 days_held_so_far = (now - pearl_start).days
                 # Calculate total essence consumed from day 1 to now
-                for day in range(1, days_held_so_far + 1):
-                    daily_cost = calculate_pearl_essence_cost(day)
-                    essence_consumed += daily_cost
+                essence_consumed = pearl_essence_between(0, days_held_so_far)
+                checkpoint = pearl_start + timedelta(days=days_held_so_far)  # Value below is accurate as of this day boundary
             
             # Remaining = capacity - consumed
             essence_remaining = max(0.0, essence_capacity - essence_consumed)
@@ -4824,7 +6471,7 @@ async def pearl_migrate(interaction: discord.Interaction, dry_run: bool = True,
             update_payload = {
                 'essenceCapacity': essence_capacity,
                 'essenceRemaining': essence_remaining,
-                'lastEssenceUpdate': pearl_start,
+                'lastEssenceUpdate': checkpoint,
                 'migratedAt': datetime.now(timezone.utc)
             }
             
@@ -4931,10 +6578,7 @@ async def pearl_fix_duration(interaction: discord.Interaction, player_ign: str,
         # Calculate how much essence should remain based on days already held
         now = datetime.now(timezone.utc)
         days_held = (now - pearl_start).days
-        essence_consumed = 0.0
-        for day in range(1, days_held + 1):
-            daily_cost = calculate_pearl_essence_cost(day)
-            essence_consumed += daily_cost
+        essence_consumed = pearl_essence_between(0, days_held)
         
         new_remaining = max(0.0, min(new_capacity, new_capacity - essence_consumed))
         
@@ -4944,7 +6588,7 @@ async def pearl_fix_duration(interaction: discord.Interaction, player_ign: str,
             'expectedReleaseDate': new_release,
             'essenceCapacity': new_capacity,
             'essenceRemaining': new_remaining,
-            'lastEssenceUpdate': now
+            'lastEssenceUpdate': pearl_start + timedelta(days=days_held)  # Checkpoint at the last whole day burned
         }))
         
         release_est = new_release.astimezone(EST)
@@ -5020,7 +6664,10 @@ async def pearl_essence(interaction: discord.Interaction, player_ign: str, actio
                 content=f"❌ Pearl for **{player_ign}** is not migrated. Run `/pearl migrate` first."
             )
         
-        current_essence = pearl_data.get('essenceRemaining', 0)
+        # Stored value is a checkpoint - evaluate burn since lastEssenceUpdate
+        current_essence, checkpoint = pearl_essence_checkpoint(pearl_data)
+        if current_essence is None:
+            current_essence, checkpoint = pearl_data.get('essenceRemaining', 0), datetime.now(timezone.utc)
         capacity = pearl_data.get('essenceCapacity', 0)
         duration = pearl_data.get('pearlDuration', 0)
         
@@ -5058,7 +6705,7 @@ async def pearl_essence(interaction: discord.Interaction, player_ign: str, actio
             # Update database
             await asyncio.to_thread(lambda: pearl_doc.reference.update({
                 'essenceRemaining': new_essence,
-                'lastEssenceUpdate': datetime.now(timezone.utc)
+                'lastEssenceUpdate': checkpoint
             }))
             
             response = f"✅ **Added {amount} essence to {player_ign}**\n\n"
@@ -5081,7 +6728,7 @@ async def pearl_essence(interaction: discord.Interaction, player_ign: str, actio
             # Update database
             await asyncio.to_thread(lambda: pearl_doc.reference.update({
                 'essenceRemaining': float(amount),
-                'lastEssenceUpdate': datetime.now(timezone.utc)
+                'lastEssenceUpdate': checkpoint
             }))
             
             response = f"✅ **Set essence for {player_ign}**\n\n"
@@ -5424,13 +7071,8 @@ async def pearl_panel(interaction: discord.Interaction):
                 # Calculate remaining essence from NOW to release, accounting for tier based on total days held
                 remaining_days = max((release_date - datetime.now(timezone.utc)).days, 0)
                 
-                # Calculate remaining essence for each remaining day
-                essence_needed = 0
-                for day in range(remaining_days):
-                    # day is 0-indexed, so add 1 to get actual day number, then add days_held_so_far
-                    total_days_at_that_point = days_held_so_far + day + 1
-                    daily_cost_at_that_point = calculate_pearl_essence_cost(total_days_at_that_point)
-                    essence_needed += daily_cost_at_that_point
+                # Essence for every remaining day (closed form over the tier schedule)
+                essence_needed = pearl_essence_between(days_held_so_far, days_held_so_far + remaining_days)
                 
                 total_essence_remaining += essence_needed
                 
@@ -5460,13 +7102,13 @@ async def pearl_panel(interaction: discord.Interaction):
                 
                 # NEW ESSENCE SYSTEM: Read from database if available, otherwise calculate fallback
                 essence_capacity = pearl.get('essenceCapacity')
-                essence_remaining = pearl.get('essenceRemaining')
+                essence_remaining = pearl_essence_remaining(pearl)
                 
                 # Fallback for old pearls without new fields
                 if essence_capacity is None or essence_remaining is None:
                     if pearl_start:
                         days_held_so_far = (datetime.now(timezone.utc) - pearl_start).days
-                        essence_remaining = sum(calculate_pearl_essence_cost(days_held_so_far + day + 1) for day in range(days_left))
+                        essence_remaining = pearl_essence_between(days_held_so_far, days_held_so_far + days_left)
                         essence_capacity = 336.0  # FIXED capacity for all pearls  # Calculate what it should have been
                     else:
                         essence_remaining = days_left * 3.0
@@ -5633,13 +7275,8 @@ class RefreshPearlsButton(ui.Button):
                     # Calculate remaining essence from NOW to release, accounting for tier based on total days held
                     remaining_days = max((release_date - datetime.now(timezone.utc)).days, 0)
                     
-                    # Calculate remaining essence for each remaining day
-                    essence_needed = 0
-                    for day in range(remaining_days):
-                        # day is 0-indexed, so add 1 to get actual day number, then add days_held_so_far
-                        total_days_at_that_point = days_held_so_far + day + 1
-                        daily_cost_at_that_point = calculate_pearl_essence_cost(total_days_at_that_point)
-                        essence_needed += daily_cost_at_that_point
+                    # Essence for every remaining day (closed form over the tier schedule)
+                    essence_needed = pearl_essence_between(days_held_so_far, days_held_so_far + remaining_days)
                     
                     total_essence_remaining += essence_needed
                     
@@ -5669,7 +7306,7 @@ class RefreshPearlsButton(ui.Button):
                     
                     # NEW ESSENCE SYSTEM: Read from database if available, otherwise calculate fallback
                     essence_capacity = pearl.get('essenceCapacity')
-                    essence_remaining = pearl.get('essenceRemaining')
+                    essence_remaining = pearl_essence_remaining(pearl)
                     
                     # Fallback for old pearls without new fields
                     # STANDARD CAPACITY: All pearls show /336 essence (112-day equivalent fuel tank)
@@ -5678,9 +7315,7 @@ class RefreshPearlsButton(ui.Button):
                         if pearl_start:
                             days_held_so_far = (datetime.now(timezone.utc) - pearl_start).days
                             # Calculate essence consumed so far
-                            essence_consumed = 0.0
-                            for day in range(1, days_held_so_far + 1):
-                                essence_consumed += calculate_pearl_essence_cost(day)
+                            essence_consumed = pearl_essence_between(0, days_held_so_far)
                             # Remaining = capacity - consumed
                             essence_remaining = max(0.0, essence_capacity - essence_consumed)
                         else:
@@ -5854,6 +7489,8 @@ async def add_snitch_log(interaction: discord.Interaction, ign: str, location: s
         traceback.print_exc()
         await interaction.edit_original_response(content=f"❌ Failed to add snitch log: {str(e)}")
 
+startup_mark("pearls")
+
 # ========================================
 # ADMIN & CITIZEN TRACKING SYSTEM
 # ========================================
@@ -6013,6 +7650,8 @@ def set_senator_count(count: int) -> bool:
         return False
         return 0
 
+startup_mark("citizens")
+
 # ==================================================
 # BANK SYSTEM - HELPER FUNCTIONS
 # ==================================================
@@ -6492,12 +8131,15 @@ def update_market_price(commodity: str, new_price: float):
     except Exception as e:
         print(f"[ERR] Failed to update market price: {e}")
 
+startup_mark("bank")
+
 # ========================================
 # GRAPH GENERATION SYSTEM
 # ========================================
 
 def generate_stock_price_graph(business_name: str, days: int = None) -> BytesIO:
     """Generate stock price history graph for a business"""
+    load_matplotlib()
     if not db:
         return None
     
@@ -6601,6 +8243,7 @@ def generate_stock_price_graph(business_name: str, days: int = None) -> BytesIO:
 
 def generate_market_cap_graph() -> BytesIO:
     """Generate total market capitalization trend graph"""
+    load_matplotlib()
     if not db:
         return None
     
@@ -6708,6 +8351,7 @@ def generate_market_cap_graph() -> BytesIO:
 
 def generate_economy_gdp_graph() -> BytesIO:
     """Generate GDP (state reserves + citizen liquidity) trend graph"""
+    load_matplotlib()
     if not db:
         return None
     
@@ -6825,39 +8469,44 @@ def generate_economy_gdp_graph() -> BytesIO:
         plt.close()  # Ensure cleanup
         return None
 
-def generate_betting_volume_graph() -> BytesIO:
-    """Generate betting volume and winnings graph"""
+def generate_betting_volume_graph(days: int = 90) -> BytesIO:
+    """Generate betting volume graph from the per-day rollups (reads at most `days` documents)"""
+    load_matplotlib()
     if not db:
         return None
     
     try:
         
-        # Get all bets
-        bets = list(db.collection(BETS_COLLECTION).order_by('timestamp').stream())
+        # Read only the rollups inside the window - never the raw bets collection
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        rollups = list(
+            db.collection(BETTING_DAILY_VOLUME_COLLECTION)
+            .where(filter=FieldFilter('date', '>=', cutoff))
+            .order_by('date')
+            .limit(days + 1)
+            .stream()
+        )
         
-        if not bets:
+        if not rollups:
             return None
         
-        # Calculate daily betting volume
+        # Rollup dates are EST midnights stored in UTC
         est = EST
-        daily_volume = {}
-        
-        for bet in bets:
-            data = bet.to_dict()
-            timestamp = data.get('timestamp')
-            if timestamp:
-                utc_time = timestamp.replace(tzinfo=timezone.utc)
-                est_time = utc_time.astimezone(est)
-                date = est_time.replace(hour=0, minute=0, second=0, microsecond=0)
-                amount = data.get('amount', 0)
-                
-                if date not in daily_volume:
-                    daily_volume[date] = 0
-                daily_volume[date] += amount
+        sorted_dates = []
+        volumes = []
         
-        # Sort by date
-        sorted_dates = sorted(daily_volume.keys())
-        volumes = [daily_volume[date] for date in sorted_dates]
+        for rollup in rollups:
+            data = rollup.to_dict()
+            date = data.get('date')
+            if not date:
+                continue
+            if date.tzinfo is None:
+                date = date.replace(tzinfo=timezone.utc)
+            sorted_dates.append(date.astimezone(est))
+            volumes.append(data.get('totalVolume', 0))
+        
+        if not sorted_dates:
+            return None
         
         # Create professional graph
         fig, ax = plt.subplots(figsize=(12, 6), facecolor='white')
@@ -6923,8 +8572,114 @@ def generate_betting_volume_graph() -> BytesIO:
         plt.close()  # Ensure cleanup
         return None
 
+def generate_betting_odds_graph(event_id: str) -> BytesIO:
+    """Generate odds-over-time graph (payout multiplier per contestant) for one betting event"""
+    load_matplotlib()
+    if not db:
+        return None
+    
+    try:
+        
+        # Requires composite index: florabi_betting_odds_history (eventId ASC, capturedAt DESC)
+        # Newest points first so the limit keeps the latest window, then back to chronological order
+        snapshots = list(
+            db.collection(BETTING_ODDS_HISTORY_COLLECTION)
+            .where(filter=FieldFilter('eventId', '==', event_id))
+            .order_by('capturedAt', direction=firestore.Query.DESCENDING)
+            .limit(ODDS_HISTORY_MAX_POINTS)
+            .stream()
+        )
+        snapshots.reverse()
+        
+        if not snapshots:
+            return None
+        
+        # Build one series per contestant (None = no bets on them yet, drawn as a gap)
+        est = EST
+        dates = []
+        series = {}
+        
+        for snap in snapshots:
+            data = snap.to_dict()
+            captured_at = data.get('capturedAt')
+            if not captured_at:
+                continue
+            if captured_at.tzinfo is None:
+                captured_at = captured_at.replace(tzinfo=timezone.utc)
+            point_index = len(dates)
+            dates.append(captured_at.astimezone(est))
+            for contestant, multiplier in data.get('multipliers', {}).items():
+                values = series.setdefault(contestant, [None] * point_index)
+                values.append(multiplier)
+            for values in series.values():
+                if len(values) < len(dates):
+                    values.append(None)
+        
+        if not dates:
+            return None
+        
+        # Create professional graph
+        fig, ax = plt.subplots(figsize=(12, 6), facecolor='white')
+        
+        for contestant, values in series.items():
+            plotted = [v if v is not None else float('nan') for v in values]
+            ax.plot(dates, plotted, marker='o', linestyle='-', linewidth=2.0, markersize=4, label=contestant[:30], drawstyle='steps-post')
+        
+        # Styling
+        ax.set_title('Tom Brady\'s Betting Exchange - Odds Over Time', fontsize=16, fontweight='bold', pad=20)
+        ax.set_xlabel('Time (EST)', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Payout Multiplier (x)', fontsize=12, fontweight='bold')
+        ax.legend(loc='upper left', fontsize=9)
+        
+        # Professional grid
+        ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.7)
+        ax.set_axisbelow(True)
+        
+        time_span = (dates[-1] - dates[0]).days if len(dates) > 1 else 0
+        if time_span > 2:
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %d', tz=EST))
+        else:
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%I:%M %p', tz=EST))
+        
+        plt.gcf().autofmt_xdate(rotation=45)
+        plt.tight_layout()
+        
+        # Save to temporary file then load into BytesIO (fixes Replit I/O error)
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
+                tmp_path = tmp.name
+            
+            plt.savefig(tmp_path, format='png', dpi=150, bbox_inches='tight', facecolor='white')
+            plt.close()
+            
+            with open(tmp_path, 'rb') as f:
+                buffer = BytesIO(f.read())
+            
+            buffer.seek(0)
+            return buffer
+        except Exception as save_err:
+            print(f"[ERR] Error saving betting odds graph: {save_err}")
+            import traceback
+            traceback.print_exc()
+            plt.close()
+            return None
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except:
+                    pass
+    except Exception as e:
+        print(f"[ERR] Failed to generate betting odds graph: {e}")
+        import traceback
+        traceback.print_exc()
+        plt.close()  # Ensure cleanup
+        return None
+
 def generate_banking_deposits_graph() -> BytesIO:
     """Generate total banking deposits over time graph"""
+    load_matplotlib()
     if not db:
         return None
     
@@ -7702,39 +9457,20 @@ async def council_stats_cmd(interaction: discord.Interaction):
     
     try:
         now = datetime.now(timezone.utc)
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        
-        all_bills = await asyncio.to_thread(
-            lambda: list(current_db.collection(BILL_COLLECTION_NAME).stream())
-        )
         
-        total_this_month = 0
-        passed = 0
-        failed = 0
-        enacted = 0
-        voting = 0
-        awaiting = 0
+        totals, month_counts = await asyncio.to_thread(read_legislative_stats, now.strftime('%Y-%m'))
+        if totals is None:
+            # First use: build the counters once from the bills collection
+            await asyncio.to_thread(rebuild_legislative_stats)
+            totals, month_counts = await asyncio.to_thread(read_legislative_stats, now.strftime('%Y-%m'))
+        by_status = (totals or {}).get('status', {})
         
-        for doc in all_bills:
-            bill = doc.to_dict()
-            created = bill.get('createdAt')
-            if created and hasattr(created, 'replace'):
-                if created.tzinfo is None:
-                    created = created.replace(tzinfo=timezone.utc)
-                if created >= month_start:
-                    total_this_month += 1
-            
-            status = bill.get('status', '')
-            if status == 'Passed':
-                passed += 1
-            elif status == 'Failed':
-                failed += 1
-            elif status == 'Bill is Now Law':
-                enacted += 1
-            elif status == 'Voting':
-                voting += 1
-            elif status == 'Awaiting Sponsor':
-                awaiting += 1
+        total_this_month = month_counts.get('filed', 0)
+        passed = by_status.get('Passed', 0)
+        failed = by_status.get('Failed', 0)
+        enacted = by_status.get('Bill is Now Law', 0)
+        voting = by_status.get('Voting', 0)
+        awaiting = by_status.get('Awaiting Sponsor', 0)
         
         embed = discord.Embed(
             title="Royal Council Statistics",
@@ -7764,6 +9500,187 @@ async def council_stats_cmd(interaction: discord.Interaction):
 
 
 # ========== PERSONAL VOTING HISTORY COMMAND ==========
+# Every vote also writes a '{member}_{bill}' entry (choice + timestamp) and adjusts
+# the member's counters, so /my_votes reads only the caller's entries instead of
+# every bill. Votes cast before the index existed are backfilled per member the
+# first time they run /my_votes (see load_vote_history).
+VOTE_CHOICES = ('yes', 'no', 'abstain')
+VOTE_CHOICE_LABELS = {'yes': f"✅ {SPAN['YES']}", 'no': f"❌ {SPAN['NO']}", 'abstain': f"⚪ {SPAN['ABSTAIN']}"}
+VOTE_HISTORY_PAGE_SIZE = 10
+VOTE_BACKFILL_BATCH = 400  # Firestore batches hold at most 500 writes
+VOTED_STATUSES = ('Voting', 'Vetoed', 'Passed', 'Failed', 'Bill is Now Law')  # Bills that have been put to a vote
+
+def vote_entry_ref(member_id: int, bill_id: str):
+    return db.collection(COUNCIL_VOTES_COLLECTION).document(f"{member_id}_{bill_id}")
+
+def current_vote(votes: dict, member_id: int):
+    """The choice a member currently holds on a bill, or None"""
+    return next((choice for choice in VOTE_CHOICES if member_id in (votes or {}).get(choice, [])), None)
+
+def vote_entry(member_id: int, bill: dict, choice: str, voted_at) -> dict:
+    return {
+        'memberId': member_id,
+        'billId': bill.get('id'),
+        'billTitle': bill.get('title', 'Untitled'),
+        'choice': choice,
+        'votedAt': voted_at,
+        'testBill': is_test_bill(bill),
+    }
+
+def vote_counter_deltas(bill: dict, old_choice, new_choice) -> dict:
+    """Counter changes for one member moving from old_choice to new_choice (either may be None)"""
+    deltas = {}
+    if old_choice == new_choice:
+        return deltas
+    if old_choice:
+        deltas[old_choice] = -1
+    if new_choice:
+        deltas[new_choice] = 1
+    if not old_choice or not new_choice:
+        # 'total' counts bills voted on; 'counted' excludes test bills, matching the legislative statistics
+        deltas['total'] = 1 if new_choice else -1
+        if not is_test_bill(bill):
+            deltas['counted'] = deltas['total']
+    return deltas
+
+def stage_vote_index(batch, member_id: int, bill: dict, old_choice, new_choice: str, voted_at):
+    """Add a member's vote entry and counter changes to a batch"""
+    batch.set(vote_entry_ref(member_id, bill.get('id')), vote_entry(member_id, bill, new_choice, voted_at))
+    batch.set(db.collection(COUNCIL_MEMBER_STATS_COLLECTION).document(str(member_id)), {
+        **as_increments(vote_counter_deltas(bill, old_choice, new_choice)),
+        'memberId': member_id,
+        'lastVotedAt': voted_at,
+    }, merge=True)
+
+def forget_bill_votes(bill: dict):
+    """Drop a deleted bill's vote entries and take its votes off the members' counters"""
+    votes = bill.get('votes') or {}
+    batch = db.batch()
+    staged = 0
+    for choice in VOTE_CHOICES:
+        for member_id in votes.get(choice, []):
+            batch.delete(vote_entry_ref(member_id, bill.get('id')))
+            batch.set(db.collection(COUNCIL_MEMBER_STATS_COLLECTION).document(str(member_id)),
+                      as_increments(vote_counter_deltas(bill, choice, None)), merge=True)
+            staged += 1
+    if staged:
+        batch.commit()
+
+def vote_time(value):
+    """Aware datetime for sorting and display (bills store naive createdAt)"""
+    if not isinstance(value, datetime):
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+def backfill_member_votes(member_id: int, entries: dict) -> dict:
+    """Rebuild one member's entries and counters from the bills they appear in (three indexed queries)"""
+    counts = {'yes': 0, 'no': 0, 'abstain': 0, 'total': 0, 'counted': 0}
+    batch = db.batch()
+    staged = 0
+    seen = set()
+    for choice in VOTE_CHOICES:
+        docs = db.collection(BILL_COLLECTION_NAME).where(filter=FieldFilter(f'votes.{choice}', 'array_contains', member_id)).stream()
+        for doc in docs:
+            bill = doc.to_dict()
+            entry_id = f"{member_id}_{bill.get('id')}"
+            seen.add(entry_id)
+            counts[choice] += 1
+            counts['total'] += 1
+            counts['counted'] += 0 if is_test_bill(bill) else 1
+            existing = entries.get(entry_id)
+            if existing and existing.get('choice') == choice:
+                continue
+            voted_at = vote_time((existing or {}).get('votedAt') or bill.get('votingStartAt') or bill.get('createdAt'))
+            entries[entry_id] = vote_entry(member_id, bill, choice, voted_at)
+            batch.set(vote_entry_ref(member_id, bill.get('id')), entries[entry_id])
+            staged += 1
+            if staged >= VOTE_BACKFILL_BATCH:
+                batch.commit()
+                batch = db.batch()
+                staged = 0
+    for entry_id in [entry_id for entry_id in entries if entry_id not in seen]:
+        del entries[entry_id]  # Bill deleted or vote withdrawn
+        batch.delete(db.collection(COUNCIL_VOTES_COLLECTION).document(entry_id))
+        staged += 1
+        if staged >= VOTE_BACKFILL_BATCH:
+            batch.commit()
+            batch = db.batch()
+            staged = 0
+    if staged:
+        batch.commit()
+    
+    # Summary last: backfilledAt only appears once every entry is written
+    now = datetime.now(timezone.utc)
+    last_voted = max((vote_time(e.get('votedAt')) for e in entries.values() if vote_time(e.get('votedAt'))), default=None)
+    summary = {**counts, 'memberId': member_id, 'lastVotedAt': last_voted, 'backfilledAt': now}
+    db.collection(COUNCIL_MEMBER_STATS_COLLECTION).document(str(member_id)).set(summary)
+    return summary
+
+def load_vote_history(member_id: int) -> tuple:
+    """(counters, entries newest first) for one member - reads only that member's documents"""
+    summary_doc = db.collection(COUNCIL_MEMBER_STATS_COLLECTION).document(str(member_id)).get()
+    summary = summary_doc.to_dict() if summary_doc.exists else {}
+    entries = {doc.id: doc.to_dict() for doc in
+               db.collection(COUNCIL_VOTES_COLLECTION).where(filter=FieldFilter('memberId', '==', member_id)).stream()}
+    if not summary.get('backfilledAt'):
+        summary = backfill_member_votes(member_id, entries)
+    epoch = datetime.min.replace(tzinfo=timezone.utc)
+    history = sorted(entries.values(), key=lambda e: vote_time(e.get('votedAt')) or epoch, reverse=True)
+    return summary, history
+
+class VoteHistoryView(discord.ui.View):
+    def __init__(self, member_name: str, summary: dict, entries: list, put_to_vote: int = None, page: int = 0):
+        super().__init__(timeout=300)
+        self.member_name = member_name
+        self.summary = summary
+        self.entries = entries
+        self.put_to_vote = put_to_vote
+        self.page = page
+        self.total_pages = max(1, (len(entries) + VOTE_HISTORY_PAGE_SIZE - 1) // VOTE_HISTORY_PAGE_SIZE)
+        self.previous_button.disabled = self.page == 0
+        self.next_button.disabled = self.page >= self.total_pages - 1
+    
+    def build_embed(self):
+        total = self.summary.get('total', 0)
+        description = f"Total votes cast: **{total}**"
+        if self.put_to_vote:
+            participation = min(100, round(self.summary.get('counted', 0) / self.put_to_vote * 100))
+            description += f"\nParticipation: **{participation}%** of {self.put_to_vote} bills put to a vote"
+        
+        embed = discord.Embed(
+            title=f"{self.member_name}'s Voting History",
+            description=description,
+            color=0x4ade80
+        )
+        for choice in VOTE_CHOICES:
+            embed.add_field(name=VOTE_CHOICE_LABELS[choice], value=str(self.summary.get(choice, 0)), inline=True)
+        
+        start = self.page * VOTE_HISTORY_PAGE_SIZE
+        lines = []
+        for entry in self.entries[start:start + VOTE_HISTORY_PAGE_SIZE]:
+            voted_at = vote_time(entry.get('votedAt'))
+            voted_str = voted_at.astimezone(EST).strftime('%b %d, %Y') if voted_at else "Unknown"
+            lines.append(f"{VOTE_CHOICE_LABELS.get(entry.get('choice'), '?')} - **{entry.get('billTitle', 'Untitled')[:50]}** (`{entry.get('billId')}`) • {voted_str}")
+        if lines:
+            embed.add_field(name="History", value="\n".join(lines), inline=False)
+        
+        embed.set_footer(text=f"Page {self.page + 1}/{self.total_pages}")
+        return embed
+    
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = max(0, self.page - 1)
+        self.previous_button.disabled = self.page == 0
+        self.next_button.disabled = False
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+    
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = min(self.total_pages - 1, self.page + 1)
+        self.next_button.disabled = self.page >= self.total_pages - 1
+        self.previous_button.disabled = False
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
 @bot.tree.command(name="my_votes", description="View your personal voting history")
 async def my_votes_cmd(interaction: discord.Interaction):
     await interaction.response.defer(ephemeral=True)
@@ -7773,62 +9690,20 @@ async def my_votes_cmd(interaction: discord.Interaction):
         return await interaction.followup.send("❌ Database not available.")
     
     try:
-        uid = interaction.user.id
-        
-        all_bills = await asyncio.to_thread(
-            lambda: list(current_db.collection(BILL_COLLECTION_NAME).stream())
-        )
-        
-        yes_votes = []
-        no_votes = []
-        abstain_votes = []
-        
-        for doc in all_bills:
-            bill = doc.to_dict()
-            votes = bill.get('votes', {'yes': [], 'no': [], 'abstain': []})
-            bill_title = bill.get('title', 'Untitled')[:50]
-            bill_id = bill.get('id', 'UNKNOWN')
-            status = bill.get('status', 'Unknown')
-            
-            entry = f"**{bill_title}** (\`{bill_id}\`) - {status}"
-            
-            if uid in votes.get('yes', []):
-                yes_votes.append(entry)
-            elif uid in votes.get('no', []):
-                no_votes.append(entry)
-            elif uid in votes.get('abstain', []):
-                abstain_votes.append(entry)
+        summary, entries = await asyncio.to_thread(load_vote_history, interaction.user.id)
         
-        total_votes = len(yes_votes) + len(no_votes) + len(abstain_votes)
-        
-        if total_votes == 0:
+        if not entries:
             return await interaction.followup.send("You haven't voted on any bills yet.")
         
-        embed = discord.Embed(
-            title=f"{interaction.user.display_name}'s Voting History",
-            description=f"Total votes cast: **{total_votes}**",
-            color=0x4ade80
-        )
-        
-        if yes_votes:
-            yes_text = "\n".join(yes_votes[:5])
-            if len(yes_votes) > 5:
-                yes_text += f"\n*...and {len(yes_votes) - 5} more*"
-            embed.add_field(name=f"Si ({len(yes_votes)})", value=yes_text, inline=False)
-        
-        if no_votes:
-            no_text = "\n".join(no_votes[:5])
-            if len(no_votes) > 5:
-                no_text += f"\n*...and {len(no_votes) - 5} more*"
-            embed.add_field(name=f"No ({len(no_votes)})", value=no_text, inline=False)
+        totals, _ = await asyncio.to_thread(read_legislative_stats)
+        if totals is None:
+            await asyncio.to_thread(rebuild_legislative_stats)
+            totals, _ = await asyncio.to_thread(read_legislative_stats)
+        by_status = (totals or {}).get('status', {})
+        put_to_vote = sum(by_status.get(status, 0) for status in VOTED_STATUSES)
         
-        if abstain_votes:
-            abstain_text = "\n".join(abstain_votes[:5])
-            if len(abstain_votes) > 5:
-                abstain_text += f"\n*...and {len(abstain_votes) - 5} more*"
-            embed.add_field(name=f"Abstencion ({len(abstain_votes)})", value=abstain_text, inline=False)
-        
-        await interaction.followup.send(embed=embed)
+        view = VoteHistoryView(interaction.user.display_name, summary, entries, put_to_vote)
+        await interaction.followup.send(embed=view.build_embed(), view=view if view.total_pages > 1 else discord.utils.MISSING)
     
     except Exception as e:
         print(f"[ERR] my_votes error: {e}")
@@ -7977,6 +9852,8 @@ async def switch_citizenship(interaction: discord.Interaction):
         print(f"[ERR] Switch citizenship failed: {e}")
         await interaction.edit_original_response(content=f"❌ Error: {str(e)}")
 
+startup_mark("core")
+
 # ========================================
 # LAWYER REGISTRATION SYSTEM
 # ========================================
@@ -8265,6 +10142,8 @@ async def my_lawyer_profile(interaction: discord.Interaction):
     
     await interaction.followup.send(embed=embed, ephemeral=True)
 
+startup_mark("court")
+
 # ========================================
 # WARRANT/BOUNTY SYSTEM
 # ========================================
@@ -8543,9 +10422,22 @@ async def warrant_post_panel_cmd(interaction: discord.Interaction):
         traceback.print_exc()
         await interaction.followup.send(f"❌ Failed to create panel:\n```{str(e)}```", ephemeral=True)
         
+@bot.event
+async def on_member_update(before: discord.Member, after: discord.Member):
+    """Rebuild the government officials snapshot when an official's roles or name change"""
+    official_roles = bot.official_role_ids()
+    changed_roles = {r.id for r in before.roles} ^ {r.id for r in after.roles}
+    if changed_roles & official_roles:
+        bot.schedule_officials_sync()
+    elif before.display_name != after.display_name and any(r.id in official_roles for r in after.roles):
+        bot.schedule_officials_sync()
+
 @bot.event
 async def on_member_remove(member):
     """Automatically remove citizen when they leave the server"""
+    if any(r.id in bot.official_role_ids() for r in member.roles):
+        bot.schedule_officials_sync()
+    
     if not db:
         return
     
@@ -8618,7 +10510,6 @@ async def on_message(message):
             # Parse snitch log entries
             # Format: "PlayerName entered snitch at SnitchName [world X,Y,Z]"
             # Minecraft IGNs: 3-16 chars, alphanumeric + underscore (no hyphens in modern MC)
-            import re
             
             lines_parsed = 0
             entries_added = 0
@@ -8701,6 +10592,8 @@ async def on_message(message):
                 mention_author=False
             )
 
+startup_mark("warrants")
+
 # ========================================
 # COURT SYSTEM
 # ========================================
@@ -9679,6 +11572,7 @@ class ClaimProsecutorButton(ui.Button):
             # Assign prosecutor
             await asyncio.to_thread(lambda: case_ref.update({
                 'prosecutorId': interaction.user.id,
+                'lawyerIds': firestore.ArrayUnion([interaction.user.id]),
                 'prosecutorName': str(interaction.user)
             }))
             
@@ -9752,6 +11646,7 @@ class RequestDefenseLawyerButton(ui.Button):
                     case_data = case_doc.to_dict()
                     await asyncio.to_thread(lambda: case_ref.update({
                         'defenseLawyerId': lawyer_id,
+                        'lawyerIds': firestore.ArrayUnion([lawyer_id]),
                         'defenseLawyerName': selected_lawyer.get('discordName')
                     }))
                     
@@ -9838,6 +11733,7 @@ class RequestPlaintiffLawyerButton(ui.Button):
                     case_data = case_doc.to_dict()
                     await asyncio.to_thread(lambda: case_ref.update({
                         'plaintiffLawyerId': lawyer_id,
+                        'lawyerIds': firestore.ArrayUnion([lawyer_id]),
                         'plaintiffLawyerName': selected_lawyer.get('discordName')
                     }))
                     
@@ -9922,6 +11818,7 @@ class RequestDefendantLawyerButton(ui.Button):
                     case_data = case_doc.to_dict()
                     await asyncio.to_thread(lambda: case_ref.update({
                         'defendantLawyerId': lawyer_id,
+                        'lawyerIds': firestore.ArrayUnion([lawyer_id]),
                         'defendantLawyerName': selected_lawyer.get('discordName')
                     }))
                     
@@ -10797,6 +12694,7 @@ class ClaimProsecutorThreadButton(ui.Button):
             # Assign prosecutor
             await asyncio.to_thread(lambda: case_ref.update({
                 'prosecutorId': interaction.user.id,
+                'lawyerIds': firestore.ArrayUnion([interaction.user.id]),
                 'prosecutorName': str(interaction.user)
             }))
             
@@ -10849,6 +12747,7 @@ class ClaimDefenseLawyerThreadButton(ui.Button):
             # Assign defense lawyer
             await asyncio.to_thread(lambda: case_ref.update({
                 'defenseLawyerId': interaction.user.id,
+                'lawyerIds': firestore.ArrayUnion([interaction.user.id]),
                 'defenseLawyerName': str(interaction.user)
             }))
             
@@ -10896,6 +12795,7 @@ class ClaimPlaintiffLawyerThreadButton(ui.Button):
             # Assign plaintiff lawyer
             await asyncio.to_thread(lambda: case_ref.update({
                 'plaintiffLawyerId': interaction.user.id,
+                'lawyerIds': firestore.ArrayUnion([interaction.user.id]),
                 'plaintiffLawyerName': str(interaction.user)
             }))
             
@@ -10943,6 +12843,7 @@ class ClaimDefendantLawyerThreadButton(ui.Button):
             # Assign defendant lawyer
             await asyncio.to_thread(lambda: case_ref.update({
                 'defendantLawyerId': interaction.user.id,
+                'lawyerIds': firestore.ArrayUnion([interaction.user.id]),
                 'defendantLawyerName': str(interaction.user)
             }))
             
@@ -11117,7 +13018,9 @@ class CourtFileCaseModal(ui.Modal):
                 'plaintiffLawyerId': None,
                 'plaintiffLawyerName': None,
                 'defendantLawyerId': None,
-                'defendantLawyerName': None
+                'defendantLawyerName': None,
+                # Search index (see COURT CASE SEARCH)
+                **case_search_fields({'defendantIgn': ign})
             }))
             
             # Post to appropriate channel based on case type
@@ -11653,145 +13556,221 @@ class ViewMyCasesButton(ui.Button):
             except:
                 pass
 
-class RefreshAllCasesButton(ui.Button):
-    def __init__(self):
-        super().__init__(label="🔄 Refresh", style=discord.ButtonStyle.secondary)
-    
-    async def callback(self, interaction: discord.Interaction):
-        await interaction.response.send_message("⏳ Refreshing all cases...", ephemeral=True)
-        
-        if not db:
-            return await interaction.edit_original_response(content="❌ Database not available.")
-        
-        try:
-            pending_cases = []
-            other_cases = []
-            
-            for doc in db.collection(COURT_CASES_COLLECTION).stream():
-                data = doc.to_dict()
-                status_emoji = {
-                    'pending': '⏳',
-                    'sentenced': '⚖️',
-                    'closed': '✅',
-                    'dismissed': '🚫',
-                    'appeal': '📢'
-                }.get(data.get('status'), '❓')
-                
-                case_type = data.get('caseType', 'Unknown')
-                type_emoji = "⚔️" if case_type == "Criminal" else "📜"
-                
-                case_line = (
-                    f"{status_emoji} {type_emoji} **Case #{data.get('caseId')}** - {data.get('defendantIgn')}\n"
-                    f"   Type: {case_type} | Plaintiff: {data.get('plaintiff')} | Status: {data.get('status').title()}"
-                )
-                
-                if data.get('status') == 'pending':
-                    pending_cases.append(case_line)
-                else:
-                    other_cases.append(case_line)
-            
-            cases = pending_cases + other_cases
-            
-            if not cases:
-                return await interaction.edit_original_response(content="📋 No cases found in the system.")
-            
-            embed = discord.Embed(
-                title=f"⚖️ All Court Cases ({len(cases)}) - REFRESHED",
-                description="\n\n".join(cases[:15]),
-                color=0x008b8b
-            )
-            if len(cases) > 15:
-                embed.set_footer(text=f"Showing 15 of {len(cases)} cases | Click refresh to update")
-            else:
-                embed.set_footer(text="🔄 Live data | Click refresh to update")
-            
-            await interaction.edit_original_response(embed=embed)
-        except Exception as e:
-            print(f"[ERR] Refresh all cases failed: {e}")
-            await interaction.edit_original_response(content=f"❌ Failed to refresh: {str(e)}")
+# ---------- COURT CASE SEARCH ----------
+# Case documents carry denormalized search fields so /court search and the
+# Archive/Resolved panels query Firestore directly and read one page at a time:
+# ignKey (case-folded defendant IGN), ignPrefixes (every prefix of it, for
+# prefix matching with array_contains), ignTrigrams (for fuzzy candidates) and
+# lawyerIds (every lawyer who has been assigned to the case). Set at filing and
+# on every lawyer assignment; older cases are backfilled once at startup
+# (recorded in MIGRATIONS_COLLECTION) and /court reindex reruns it on demand.
+#
+# A search uses at most one key filter (IGN, lawyer, plaintiff or category) plus
+# optional status and filedAt >= window, always ordered by filedAt DESC. Those
+# combinations need these composite indexes on florabi_court_cases:
+#   ignPrefixes CONTAINS, filedAt DESC      ignPrefixes CONTAINS, status ASC, filedAt DESC
+#   ignKey ASC, filedAt DESC                ignKey ASC, status ASC, filedAt DESC
+#   lawyerIds CONTAINS, filedAt DESC        lawyerIds CONTAINS, status ASC, filedAt DESC
+#   plaintiffId ASC, filedAt DESC           plaintiffId ASC, status ASC, filedAt DESC
+#   caseCategory ASC, filedAt DESC          caseCategory ASC, status ASC, filedAt DESC
+#   status ASC, filedAt DESC  (also serves status 'in' for the Resolved panel)
+# The Archive (filedAt only) and the fuzzy ignTrigrams lookup use single-field indexes.
+CASE_SEARCH_PAGE_SIZE = 10
+CASE_SEARCH_INDEX_VERSION = 1  # Bump when case_search_fields changes to re-run the startup backfill
+CASE_LAWYER_FIELDS = ('prosecutorId', 'defenseLawyerId', 'plaintiffLawyerId', 'defendantLawyerId', 'petitionerCounselId', 'defenseAttorneyId')
+CASE_STATUS_EMOJIS = {'pending': '⏳', 'sentenced': '⚖️', 'closed': '✅', 'dismissed': '🚫', 'appeal': '📢'}
+CASE_RESOLVED_STATUSES = ['closed', 'dismissed', 'sentenced']
+CASE_FUZZY_TRIGRAMS = 10  # array_contains_any accepts at most 10 values
+CASE_FUZZY_CANDIDATES = 50  # Documents read to find close IGN spellings
+CASE_FUZZY_MIN_RATIO = 0.6  # difflib similarity needed to count as a close match
+CASE_FUZZY_MAX_IGNS = 5
+CASE_REINDEX_BATCH = 400  # Firestore batches hold at most 500 writes
+
+def case_ign_key(ign: str) -> str:
+    return fold_text(ign).strip()
+
+def case_ign_trigrams(key: str) -> list:
+    return sorted({key[i:i + 3] for i in range(len(key) - 2)}) or ([key] if key else [])
+
+def case_search_fields(case: dict) -> dict:
+    """Search index fields for a case document"""
+    key = case_ign_key(case.get('defendantIgn') or '')
+    return {
+        'ignKey': key,
+        'ignPrefixes': [key[:n] for n in range(1, len(key) + 1)],
+        'ignTrigrams': case_ign_trigrams(key),
+        'lawyerIds': sorted({case[field] for field in CASE_LAWYER_FIELDS if case.get(field)}),
+    }
 
-class AllCasesView(ui.View):
-    def __init__(self):
-        super().__init__(timeout=300)  # 5 minute timeout
-        self.add_item(RefreshAllCasesButton())
+def close_ign_matches(key: str) -> list:
+    """Indexed IGN keys that look like a misspelling of key, closest first"""
+    trigrams = case_ign_trigrams(key)[:CASE_FUZZY_TRIGRAMS]
+    if not trigrams:
+        return []
+    docs = db.collection(COURT_CASES_COLLECTION).where(
+        filter=FieldFilter('ignTrigrams', 'array_contains_any', trigrams)
+    ).limit(CASE_FUZZY_CANDIDATES).stream()
+    ratios = {}
+    for doc in docs:
+        candidate = doc.to_dict().get('ignKey')
+        if candidate and candidate not in ratios:
+            ratios[candidate] = difflib.SequenceMatcher(None, key, candidate).ratio()
+    ranked = sorted((ratio, candidate) for candidate, ratio in ratios.items() if ratio >= CASE_FUZZY_MIN_RATIO)
+    return [candidate for _, candidate in reversed(ranked)][:CASE_FUZZY_MAX_IGNS]
+
+def reindex_court_cases() -> int:
+    """Write the search fields onto every case. Returns cases indexed."""
+    count = 0
+    batch = db.batch()
+    staged = 0
+    for doc in db.collection(COURT_CASES_COLLECTION).stream():
+        batch.set(doc.reference, case_search_fields(doc.to_dict()), merge=True)
+        count += 1
+        staged += 1
+        if staged >= CASE_REINDEX_BATCH:
+            batch.commit()
+            batch = db.batch()
+            staged = 0
+    if staged:
+        batch.commit()
+    db.collection(MIGRATIONS_COLLECTION).document('court_case_search').set({
+        'version': CASE_SEARCH_INDEX_VERSION,
+        'cases': count,
+        'completedAt': datetime.now(timezone.utc)
+    })
+    return count
 
-class ViewAllCasesButton(ui.Button):
-    def __init__(self):
-        super().__init__(label="📚 Archive", style=discord.ButtonStyle.secondary, custom_id="court_view_all_cases")
-    
-    async def callback(self, interaction: discord.Interaction):
-        await interaction.response.send_message("⏳ Processing...", ephemeral=True)
-        
-        if not db:
-            return await interaction.edit_original_response(content="❌ Database not available.")
-        
-        # Fetch all cases
-        cases = []
-        try:
-            # Get pending cases first, then others
-            pending_cases = []
-            other_cases = []
-            
-            for doc in db.collection(COURT_CASES_COLLECTION).stream():
-                data = doc.to_dict()
-                status_emoji = {
-                    'pending': '⏳',
-                    'sentenced': '⚖️',
-                    'closed': '✅',
-                    'dismissed': '🚫',
-                    'appeal': '📢'
-                }.get(data.get('status'), '❓')
-                
-                case_type = data.get('caseType', 'Unknown')
-                type_emoji = "⚔️" if case_type == "Criminal" else "📜"
-                
-                case_line = (
-                    f"{status_emoji} {type_emoji} **Case #{data.get('caseId')}** - {data.get('defendantIgn')}\n"
-                    f"   Type: {case_type} | Plaintiff: {data.get('plaintiff')} | Status: {data.get('status').title()}"
-                )
-                
-                if data.get('status') == 'pending':
-                    pending_cases.append(case_line)
-                else:
-                    other_cases.append(case_line)
-            
-            # Combine pending first, then others
-            cases = pending_cases + other_cases
-            
-            if not cases:
-                return await interaction.edit_original_response(content="📋 No cases found in the system.")
-            
-            # Discord embed description limit is 4096 characters
-            # Each case is ~150 chars, so we can fit ~25 cases safely
-            max_cases_to_show = 50  # Increased from 15
-            description_text = "\n\n".join(cases[:max_cases_to_show])
-            
-            # If description is too long, truncate
-            if len(description_text) > 3900:
-                # Find how many cases fit in 3900 chars
-                truncated_cases = []
-                char_count = 0
-                for case in cases:
-                    if char_count + len(case) + 2 > 3900:  # +2 for \n\n
-                        break
-                    truncated_cases.append(case)
-                    char_count += len(case) + 2
-                description_text = "\n\n".join(truncated_cases)
-                max_cases_to_show = len(truncated_cases)
-            
-            embed = discord.Embed(
-                title=f"⚖️ All Court Cases ({len(cases)})",
-                description=description_text,
-                color=0x008b8b
+async def backfill_case_search_index():
+    """Index cases filed before the search fields existed (once per CASE_SEARCH_INDEX_VERSION)"""
+    await bot.wait_until_ready()
+    if not db:
+        return
+    try:
+        marker = await asyncio.to_thread(db.collection(MIGRATIONS_COLLECTION).document('court_case_search').get)
+        if marker.exists and (marker.to_dict() or {}).get('version', 0) >= CASE_SEARCH_INDEX_VERSION:
+            return
+        count = await asyncio.to_thread(reindex_court_cases)
+        print(f"[OK] Court case search index backfilled: {count} cases")
+    except Exception as e:
+        print(f"[WARN] Court case search backfill failed (run /court reindex): {e}")
+
+def case_search_line(data: dict) -> str:
+    case_type = data.get('caseType', 'Unknown')
+    case_status = (data.get('status') or 'unknown').title()
+    charges = data.get('charges') or 'No charges listed'
+    verdict = data.get('verdict') or 'Pending'
+    type_emoji = "⚔️" if case_type == "Criminal" else "📜"
+    status_emoji = CASE_STATUS_EMOJIS.get(case_status.lower(), "📋")
+    line = (
+        f"{type_emoji} **{data.get('caseId', 'Unknown')}** ({case_type})\n"
+        f"**Defendant:** {data.get('defendantIgn', 'Unknown')}\n"
+        f"**Charges:** {charges[:50]}{'...' if len(charges) > 50 else ''}\n"
+        f"**Status:** {status_emoji} {case_status}"
+    )
+    if verdict != 'Pending':
+        line += f" | **Verdict:** {verdict}"
+    return line
+
+def case_archive_line(data: dict) -> str:
+    case_type = data.get('caseType', 'Unknown')
+    type_emoji = "⚔️" if case_type == "Criminal" else "📜"
+    status = data.get('status') or ''
+    return (
+        f"{CASE_STATUS_EMOJIS.get(status, '❓')} {type_emoji} **Case #{data.get('caseId')}** - {data.get('defendantIgn')}\n"
+        f"   Type: {case_type} | Plaintiff: {data.get('plaintiff')} | Status: {status.title()}"
+    )
+
+def case_resolved_line(data: dict) -> str:
+    case_type = data.get('caseType', 'Unknown')
+    type_emoji = "⚔️" if case_type == "Criminal" else "📜"
+    status = data.get('status') or ''
+    verdict = data.get('verdict')
+    verdict_str = f" | Verdict: {verdict}" if verdict else ""
+    return (
+        f"{CASE_STATUS_EMOJIS.get(status, '❓')} {type_emoji} **Case #{data.get('caseId')}** - {data.get('defendantIgn')}\n"
+        f"   Type: {case_type} | Status: {status.title()}{verdict_str}"
+    )
+
+class CaseSearchView(ui.View):
+    """Cursor-paginated case query, newest first - each page reads page size + 1 documents"""
+
+    def __init__(self, title: str, build_query, render_line, header: str = None, color: int = 0x008b8b):
+        super().__init__(timeout=300)
+        self.title = title
+        self.build_query = build_query  # () -> ordered query, re-run for every page
+        self.render_line = render_line
+        self.header = header
+        self.color = color
+        self.cursors = [None]  # Last document of each previous page (None = first page)
+        self.docs = []
+        self.has_more = False
+
+    def load(self):
+        """Read the current page (blocking - run in a thread)"""
+        query = self.build_query()
+        if self.cursors[-1] is not None:
+            query = query.start_after(self.cursors[-1])
+        docs = list(query.limit(CASE_SEARCH_PAGE_SIZE + 1).stream())
+        self.has_more = len(docs) > CASE_SEARCH_PAGE_SIZE
+        self.docs = docs[:CASE_SEARCH_PAGE_SIZE]
+        self.previous_button.disabled = len(self.cursors) == 1
+        self.next_button.disabled = not self.has_more
+
+    def build_embed(self):
+        lines = "\n\n".join(self.render_line(doc.to_dict()) for doc in self.docs)
+        embed = discord.Embed(
+            title=self.title,
+            description=(f"{self.header}\n\n{lines}" if self.header else lines)[:4096],
+            color=self.color
+        )
+        first = (len(self.cursors) - 1) * CASE_SEARCH_PAGE_SIZE + 1
+        more = "Next ▶ for more" if self.has_more else "End of results"
+        embed.set_footer(text=f"Page {len(self.cursors)} • Cases {first}-{first + len(self.docs) - 1} • {more}")
+        return embed
+
+    async def show(self, interaction: discord.Interaction):
+        await asyncio.to_thread(self.load)
+        await interaction.edit_original_response(embed=self.build_embed(), view=self)
+
+    @ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_button(self, interaction: discord.Interaction, button: ui.Button):
+        await interaction.response.defer()
+        if len(self.cursors) > 1:
+            self.cursors.pop()
+        await self.show(interaction)
+
+    @ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: ui.Button):
+        await interaction.response.defer()
+        if self.has_more and self.docs:
+            self.cursors.append(self.docs[-1])
+        await self.show(interaction)
+
+    @ui.button(label="🔄 Refresh", style=discord.ButtonStyle.secondary)
+    async def refresh_button(self, interaction: discord.Interaction, button: ui.Button):
+        await interaction.response.defer()
+        await self.show(interaction)
+
+class ViewAllCasesButton(ui.Button):
+    def __init__(self):
+        super().__init__(label="📚 Archive", style=discord.ButtonStyle.secondary, custom_id="court_view_all_cases")
+    
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.send_message("⏳ Processing...", ephemeral=True)
+        
+        if not db:
+            return await interaction.edit_original_response(content="❌ Database not available.")
+        
+        try:
+            view = CaseSearchView(
+                "⚖️ All Court Cases",
+                lambda: db.collection(COURT_CASES_COLLECTION).order_by('filedAt', direction=firestore.Query.DESCENDING),
+                case_archive_line
             )
-            if len(cases) > max_cases_to_show:
-                embed.set_footer(text=f"Showing {max_cases_to_show} of {len(cases)} cases | Use /court search to find specific cases")
-            else:
-                embed.set_footer(text="🔄 Click refresh button below to update")
-            
-            # Add refresh button view
-            view = AllCasesView()
-            await interaction.edit_original_response(embed=embed, view=view)
+            await asyncio.to_thread(view.load)
+            if not view.docs:
+                return await interaction.edit_original_response(content="📋 No cases found in the system.")
+            await interaction.edit_original_response(embed=view.build_embed(), view=view)
         except Exception as e:
             print(f"[ERR] Failed to fetch all cases: {e}")
             await interaction.edit_original_response(content="❌ Failed to retrieve cases.")
@@ -11807,58 +13786,18 @@ class ViewClosedCasesButton(ui.Button):
             return await interaction.edit_original_response(content="❌ Database not available.")
         
         try:
-            # Fetch only closed/dismissed/sentenced cases
-            closed_statuses = ['closed', 'dismissed', 'sentenced']
-            cases = []
-            
-            for doc in db.collection(COURT_CASES_COLLECTION).stream():
-                data = doc.to_dict()
-                status = data.get('status', '')
-                if status not in closed_statuses:
-                    continue
-                
-                status_emoji = {
-                    'sentenced': '⚖️',
-                    'closed': '✅',
-                    'dismissed': '🚫'
-                }.get(status, '❓')
-                
-                case_type = data.get('caseType', 'Unknown')
-                type_emoji = "⚔️" if case_type == "Criminal" else "📜"
-                
-                verdict = data.get('verdict', '')
-                verdict_str = f" | Verdict: {verdict}" if verdict else ""
-                
-                case_line = (
-                    f"{status_emoji} {type_emoji} **Case #{data.get('caseId')}** - {data.get('defendantIgn')}\n"
-                    f"   Type: {case_type} | Status: {status.title()}{verdict_str}"
-                )
-                cases.append(case_line)
-            
-            if not cases:
-                return await interaction.edit_original_response(content="📁 No closed cases found.")
-            
-            # Limit description length
-            description_text = "\n\n".join(cases[:30])
-            if len(description_text) > 3900:
-                truncated_cases = []
-                char_count = 0
-                for case in cases:
-                    if char_count + len(case) + 2 > 3900:
-                        break
-                    truncated_cases.append(case)
-                    char_count += len(case) + 2
-                description_text = "\n\n".join(truncated_cases)
-            
-            embed = discord.Embed(
-                title=f"🔒 Resolved Cases ({len(cases)})",
-                description=description_text,
+            view = CaseSearchView(
+                "🔒 Resolved Cases",
+                lambda: db.collection(COURT_CASES_COLLECTION).where(
+                    filter=FieldFilter('status', 'in', CASE_RESOLVED_STATUSES)
+                ).order_by('filedAt', direction=firestore.Query.DESCENDING),
+                case_resolved_line,
                 color=0x607d8b
             )
-            if len(cases) > 30:
-                embed.set_footer(text=f"Showing 30 of {len(cases)} closed cases")
-            
-            await interaction.edit_original_response(embed=embed)
+            await asyncio.to_thread(view.load)
+            if not view.docs:
+                return await interaction.edit_original_response(content="📁 No closed cases found.")
+            await interaction.edit_original_response(embed=view.build_embed(), view=view)
         except Exception as e:
             print(f"[ERR] Failed to fetch closed cases: {e}")
             await interaction.edit_original_response(content="❌ Failed to retrieve closed cases.")
@@ -12173,33 +14112,50 @@ class RefreshActiveCasesButton(ui.Button):
 # LAWYER CASE NOTIFICATION SYSTEM
 # ========================================
 
+class LawyerCaseClaimButton(ui.DynamicItem[ui.Button], template=r'lawyer_(?P<action>claim_defense|claim_prosecutor|claim_petitioner|view_case)_(?P<case_id>.+)'):
+    """Case claim button; the case ID is parsed from the custom_id at click time so one handler serves every case"""
+    
+    # action -> (criminal label, civil label, style)
+    BUTTONS = {
+        'claim_defense': ("🛡️ Claim Defense", "🛡️ Represent Respondent", discord.ButtonStyle.primary),
+        'claim_prosecutor': ("⚔️ Claim Prosecutor", "⚔️ Claim Prosecutor", discord.ButtonStyle.danger),
+        'claim_petitioner': ("📜 Represent Petitioner", "📜 Represent Petitioner", discord.ButtonStyle.secondary),
+        'view_case': ("📋 View Case Details", "📋 View Case Details", discord.ButtonStyle.secondary),
+    }
+    
+    def __init__(self, action: str, case_id: str, case_type: str = "Criminal"):
+        criminal_label, civil_label, style = self.BUTTONS[action]
+        super().__init__(ui.Button(
+            label=criminal_label if case_type == "Criminal" else civil_label,
+            style=style,
+            custom_id=f"lawyer_{action}_{case_id}"
+        ))
+        self.action = action
+        self.case_id = case_id
+        self.case_type = case_type
+    
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Button, match):
+        return cls(match['action'], match['case_id'])
+    
+    async def callback(self, interaction: discord.Interaction):
+        view = LawyerCaseClaimView(self.case_id, self.case_type, controls=False)
+        await getattr(view, self.action)(interaction)
+
+
 class LawyerCaseClaimView(ui.View):
     """View for lawyers to claim defense/prosecution roles on a case"""
-    def __init__(self, case_id: str, case_type: str):
+    def __init__(self, case_id: str, case_type: str, controls: bool = True):
         super().__init__(timeout=None)
         self.case_id = case_id
         self.case_type = case_type
+        if not controls:
+            return
         
-        # Defense button (for both criminal and civil)
-        defense_label = "🛡️ Claim Defense" if case_type == "Criminal" else "🛡️ Represent Respondent"
-        defense_btn = ui.Button(label=defense_label, style=discord.ButtonStyle.primary, custom_id=f"lawyer_claim_defense_{case_id}")
-        defense_btn.callback = self.claim_defense
-        self.add_item(defense_btn)
-        
-        # Prosecution/Plaintiff button
-        if case_type == "Criminal":
-            pros_btn = ui.Button(label="⚔️ Claim Prosecutor", style=discord.ButtonStyle.danger, custom_id=f"lawyer_claim_prosecutor_{case_id}")
-            pros_btn.callback = self.claim_prosecutor
-            self.add_item(pros_btn)
-        else:
-            plaintiff_btn = ui.Button(label="📜 Represent Petitioner", style=discord.ButtonStyle.secondary, custom_id=f"lawyer_claim_petitioner_{case_id}")
-            plaintiff_btn.callback = self.claim_petitioner
-            self.add_item(plaintiff_btn)
-        
-        # View case button
-        view_btn = ui.Button(label="📋 View Case Details", style=discord.ButtonStyle.secondary, custom_id=f"lawyer_view_case_{case_id}")
-        view_btn.callback = self.view_case
-        self.add_item(view_btn)
+        # Defense button (for both criminal and civil), then prosecution or petitioner, then case details
+        second_action = 'claim_prosecutor' if case_type == "Criminal" else 'claim_petitioner'
+        for action in ('claim_defense', second_action, 'view_case'):
+            self.add_item(LawyerCaseClaimButton(action, case_id, case_type))
     
     async def _check_lawyer(self, interaction: discord.Interaction) -> dict:
         """Check if user is a registered lawyer and return their data"""
@@ -12256,6 +14212,7 @@ class LawyerCaseClaimView(ui.View):
             # Claim the role
             case_doc.reference.update({
                 'defenseAttorneyId': interaction.user.id,
+                'lawyerIds': firestore.ArrayUnion([interaction.user.id]),
                 'defenseAttorney': str(interaction.user),
                 'defenseBarNumber': lawyer_data.get('barNumber', 'N/A'),
                 'defenseClaimedAt': datetime.now(timezone.utc)
@@ -12311,6 +14268,7 @@ class LawyerCaseClaimView(ui.View):
             
             case_doc.reference.update({
                 'prosecutorId': interaction.user.id,
+                'lawyerIds': firestore.ArrayUnion([interaction.user.id]),
                 'prosecutor': str(interaction.user),
                 'prosecutorBarNumber': lawyer_data.get('barNumber', 'N/A'),
                 'prosecutorClaimedAt': datetime.now(timezone.utc)
@@ -12361,6 +14319,7 @@ class LawyerCaseClaimView(ui.View):
             
             case_doc.reference.update({
                 'petitionerCounselId': interaction.user.id,
+                'lawyerIds': firestore.ArrayUnion([interaction.user.id]),
                 'petitionerCounsel': str(interaction.user),
                 'petitionerCounselBarNumber': lawyer_data.get('barNumber', 'N/A'),
                 'petitionerCounselClaimedAt': datetime.now(timezone.utc)
@@ -12786,6 +14745,8 @@ async def court_panel_cmd(interaction: discord.Interaction):
             except:
                 pass
 
+startup_mark("court")
+
 # ========================================
 # BETTING PANEL - Tom Brady's Royal Betting Exchange
 # ========================================
@@ -13659,6 +15620,8 @@ async def betting_panel_cmd(interaction: discord.Interaction):
     
     await interaction.followup.send("✅ Betting panel posted!", ephemeral=True)
 
+startup_mark("betting")
+
 # ========================================
 # MARKET/BUSINESS PANEL
 # ========================================
@@ -14358,6 +16321,8 @@ async def market_panel_cmd(interaction: discord.Interaction):
     
     await interaction.followup.send("✅ Market panel posted!", ephemeral=True)
 
+startup_mark("market")
+
 # ========================================
 # FLORABÍS STATE BANK PANEL
 # ========================================
@@ -14825,6 +16790,8 @@ async def bank_panel_cmd_archived(interaction: discord.Interaction):
     
     await interaction.followup.send("✅ Bank panel posted!", ephemeral=True)
 
+startup_mark("bank")
+
 # ========================================
 # ECONOMY PANEL - STATE ECONOMY DASHBOARD
 # ========================================
@@ -15221,17 +17188,25 @@ async def force_close_case_cmd(interaction: discord.Interaction, case_id: str, v
         traceback.print_exc()
         await interaction.edit_original_response(content=f"❌ Failed to force close: {str(e)}")
 
-@court_group.command(name="search", description="🔍 Search for court cases by IGN, case ID, or status")
+@court_group.command(name="search", description="🔍 Search court cases by IGN, case ID, status, plaintiff, lawyer or category")
 @app_commands.describe(
-    ign="Search by defendant's IGN",
+    ign="Defendant's IGN - the start of the name is enough, close spellings are suggested",
     case_id="Search by exact case ID (e.g., CR-ABC123)",
-    status="Search by case status"
+    status="Search by case status",
+    plaintiff="Cases filed by this member",
+    lawyer="Cases this lawyer has been assigned to",
+    category="Case category (first word of the charges, e.g. theft)",
+    filed_within_days="Only cases filed in the last N days"
 )
 async def case_search_cmd(
     interaction: discord.Interaction, 
     ign: str = None, 
     case_id: str = None,
-    status: str = None
+    status: str = None,
+    plaintiff: discord.Member = None,
+    lawyer: discord.Member = None,
+    category: str = None,
+    filed_within_days: int = None
 ):
     await interaction.response.send_message("⏳ Processing...", ephemeral=True)
     
@@ -15239,98 +17214,110 @@ async def case_search_cmd(
         return await interaction.edit_original_response(content="❌ Database not available.")
     
     # Must provide at least one search criterion
-    if not ign and not case_id and not status:
+    if not any((ign, case_id, status, plaintiff, lawyer, category, filed_within_days)):
         return await interaction.edit_original_response(content=
             "❌ Please provide at least one search criterion:\n"
-            "• IGN (defendant's Minecraft name)\n"
+            "• IGN (defendant's Minecraft name, or its start)\n"
             "• Case ID (e.g., CR-ABC123)\n"
-            "• Status (pending, sentenced, closed)")
+            "• Status (pending, sentenced, closed)\n"
+            "• Plaintiff, lawyer, category or filing window")
+    if sum(1 for key_filter in (ign, lawyer, plaintiff, category) if key_filter) > 1:
+        # Only one key filter per query has a composite index (see COURT CASE SEARCH)
+        return await interaction.edit_original_response(content=
+            "❌ Search by one of IGN, lawyer, plaintiff or category at a time (status and filed_within_days can be added).")
+    if filed_within_days is not None and filed_within_days < 1:
+        return await interaction.edit_original_response(content="❌ filed_within_days must be at least 1.")
     
     try:
-        # Build query based on provided criteria
         cases_ref = db.collection(COURT_CASES_COLLECTION)
         
         # If case_id provided, search by exact match (fastest)
         if case_id:
-            case_doc = cases_ref.document(case_id.upper()).get()
-            if case_doc.exists:
-                cases = [case_doc]
-            else:
+            case_doc = await asyncio.to_thread(cases_ref.document(case_id.upper()).get)
+            if not case_doc.exists:
                 return await interaction.edit_original_response(content=f"❌ No case found with ID: {case_id}")
-        else:
-            # Build filters
-            filters = []
-            if ign:
-                filters.append(('defendantIgn', '==', ign))
-            if status:
-                filters.append(('status', '==', status.lower()))
-            
-            # Query with filters
-            query = cases_ref
-            for field, op, value in filters:
-                query = query.where(filter=FieldFilter(field, op, value))
-            
-            cases = list(query.stream())
+            embed = discord.Embed(
+                title="🔍 Case Search Results (1)",
+                description=f"**Search:** Case ID: `{case_id}`\n\n" + case_search_line(case_doc.to_dict()),
+                color=0x008b8b
+            )
+            embed.set_footer(text="⚖️ Justice System Search")
+            return await interaction.edit_original_response(embed=embed)
         
-        if not cases:
-            search_terms = []
-            if ign:
-                search_terms.append(f"IGN: {ign}")
-            if status:
-                search_terms.append(f"Status: {status}")
-            return await interaction.edit_original_response(content=
-                f"❌ No cases found matching: {', '.join(search_terms)}")
+        ign_key = case_ign_key(ign) if ign else None
+        filed_since = datetime.now(timezone.utc) - timedelta(days=filed_within_days) if filed_within_days else None
         
-        # Build results embed
-        case_list = []
-        for case_doc in cases[:20]:  # Limit to 20 results
-            case_data = case_doc.to_dict()
-            case_id_str = case_data.get('caseId', 'Unknown')
-            case_type = case_data.get('caseType', 'Unknown')
-            defendant = case_data.get('defendantIgn', 'Unknown')
-            charges = case_data.get('charges', 'No charges listed')
-            case_status = case_data.get('status', 'unknown').title()
-            verdict = case_data.get('verdict', 'Pending')
-            
-            case_type_emoji = "⚔️" if case_type == "Criminal" else "📜"
-            status_emoji = {"pending": "⏳", "sentenced": "⚖️", "closed": "✅"}.get(case_status.lower(), "📋")
-            
-            case_summary = (
-                f"{case_type_emoji} **{case_id_str}** ({case_type})\n"
-                f"**Defendant:** {defendant}\n"
-                f"**Charges:** {charges[:50]}{'...' if len(charges) > 50 else ''}\n"
-                f"**Status:** {status_emoji} {case_status}"
-            )
-            if verdict and verdict != 'Pending':
-                case_summary += f" | **Verdict:** {verdict}"
-            
-            case_list.append(case_summary)
+        def build_query(ign_keys=None):
+            query = cases_ref
+            if ign_keys:
+                query = query.where(filter=FieldFilter('ignKey', 'in', ign_keys))
+            elif ign_key:
+                query = query.where(filter=FieldFilter('ignPrefixes', 'array_contains', ign_key))
+            if lawyer:
+                query = query.where(filter=FieldFilter('lawyerIds', 'array_contains', lawyer.id))
+            if plaintiff:
+                query = query.where(filter=FieldFilter('plaintiffId', '==', plaintiff.id))
+            if status:
+                query = query.where(filter=FieldFilter('status', '==', status.lower()))
+            if category:
+                query = query.where(filter=FieldFilter('caseCategory', '==', category.strip().lower()))
+            if filed_since:
+                query = query.where(filter=FieldFilter('filedAt', '>=', filed_since))
+            return query.order_by('filedAt', direction=firestore.Query.DESCENDING)
         
         # Build search query description
         search_desc = []
         if ign:
             search_desc.append(f"IGN: `{ign}`")
-        if case_id:
-            search_desc.append(f"Case ID: `{case_id}`")
         if status:
             search_desc.append(f"Status: `{status}`")
+        if plaintiff:
+            search_desc.append(f"Plaintiff: {plaintiff.mention}")
+        if lawyer:
+            search_desc.append(f"Lawyer: {lawyer.mention}")
+        if category:
+            search_desc.append(f"Category: `{category}`")
+        if filed_within_days:
+            search_desc.append(f"Filed: last {filed_within_days} days")
+        
+        view = CaseSearchView("🔍 Case Search Results", build_query, case_search_line, header=f"**Search:** {' | '.join(search_desc)}")
+        await asyncio.to_thread(view.load)
+        
+        if not view.docs and ign_key:
+            # No IGN starts with the query - look for close spellings instead
+            close = await asyncio.to_thread(close_ign_matches, ign_key)
+            if close:
+                view.build_query = lambda: build_query(close)
+                view.header += f"\nNo exact match - showing close spellings: {', '.join(f'`{key}`' for key in close)}"
+                await asyncio.to_thread(view.load)
+        
+        if not view.docs:
+            return await interaction.edit_original_response(content=
+                f"❌ No cases found matching: {', '.join(search_desc)}")
         
-        embed = discord.Embed(
-            title=f"🔍 Case Search Results ({len(cases)})",
-            description=f"**Search:** {' | '.join(search_desc)}\n\n" + "\n\n".join(case_list),
-            color=0x008b8b
-        )
-        
-        if len(cases) > 20:
-            embed.set_footer(text=f"Showing 20 of {len(cases)} results | Refine search for fewer results")
-        else:
-            embed.set_footer(text="⚖️ Justice System Search")
-        
-        await interaction.edit_original_response(embed=embed)
+        await interaction.edit_original_response(embed=view.build_embed(), view=view)
     except Exception as e:
         print(f"[ERR] Case search failed: {e}")
         await interaction.edit_original_response(content="❌ Search failed. Please try again.")
 
+@court_group.command(name="reindex", description="🔧 Rebuild the case search index (runs once at startup; Admin only)")
+async def court_reindex_cmd(interaction: discord.Interaction):
+    if not has_admin_role(interaction):
+        return await interaction.response.send_message("❌ This command is for Admins only.", ephemeral=True)
+    
+    await interaction.response.send_message("⏳ Indexing court cases...", ephemeral=True)
+    
+    if not db:
+        return await interaction.edit_original_response(content="❌ Database not available.")
+    
+    try:
+        count = await asyncio.to_thread(reindex_court_cases)
+        print(f"[OK] Court case search index rebuilt: {count} cases")
+        await interaction.edit_original_response(content=f"✅ Indexed **{count}** court cases for search.")
+    except Exception as e:
+        print(f"[ERR] Court case reindex failed: {e}")
+        await interaction.edit_original_response(content=f"❌ Reindex failed: {str(e)}")
+
 @court_group.command(name="issue_verdict", description="⚖️ Issue verdict for a case (Magistrates only)")
 @app_commands.describe(
     case_id="Case ID (e.g., CR-ABC123 or CV-XYZ789)"
@@ -15522,7 +17509,7 @@ async def citizen_lookup_cmd(interaction: discord.Interaction, search: str):
             citizen_doc = None
             if user_id:
                 # CRITICAL: Wrap blocking .stream() in thread pool
-                citizens = await asyncio.to_thread(
+                citizens = await firestore_call(
                     lambda: list(current_db.collection(CITIZENS_COLLECTION).where(
                         filter=FieldFilter('userId', '==', user_id)
                     ).limit(1).stream())
@@ -15533,7 +17520,7 @@ async def citizen_lookup_cmd(interaction: discord.Interaction, search: str):
             # If not found, search by IGN
             if not citizen_doc:
                 # CRITICAL: Wrap blocking .stream() in thread pool
-                citizens = await asyncio.to_thread(
+                citizens = await firestore_call(
                     lambda: list(current_db.collection(CITIZENS_COLLECTION).stream())
                 )
                 for doc in citizens:
@@ -15612,17 +17599,17 @@ async def citizen_lookup_cmd(interaction: discord.Interaction, search: str):
         now = datetime.now(timezone.utc)
         
         # Get manual criminal records (SERVING or ACTIVE, not EXPIRED)
-        all_records = await asyncio.to_thread(lambda: list(current_db.collection(CRIMINAL_RECORDS_COLLECTION).where(
+        all_records = await firestore_call(lambda: list(current_db.collection(CRIMINAL_RECORDS_COLLECTION).where(
             filter=FieldFilter('citizenId', '==', str(user_id))
         ).stream()))
         
         # Get state court case convictions (automatic from Florabís court)
-        court_cases = await asyncio.to_thread(lambda: list(current_db.collection(COURT_CASES_COLLECTION).where(
+        court_cases = await firestore_call(lambda: list(current_db.collection(COURT_CASES_COLLECTION).where(
             filter=FieldFilter('defendantIGN', '==', ign)
         ).stream()))
         
         # Check for active warrants
-        warrants = await asyncio.to_thread(lambda: list(current_db.collection(WARRANTS_COLLECTION).where(
+        warrants = await firestore_call(lambda: list(current_db.collection(WARRANTS_COLLECTION).where(
             filter=FieldFilter('ign', '==', ign)
         ).where(
             filter=FieldFilter('status', '==', 'active')
@@ -15720,7 +17707,7 @@ async def citizen_lookup_cmd(interaction: discord.Interaction, search: str):
         
         # Check for pearl status - wrap blocking .stream() call
         current_db = await ensure_firestore()
-        pearls = await asyncio.to_thread(
+        pearls = await firestore_call(
             lambda: list(current_db.collection(PEARLS_COLLECTION).where(
                 filter=FieldFilter('ign', '==', ign)
             ).where(
@@ -15738,13 +17725,13 @@ async def citizen_lookup_cmd(interaction: discord.Interaction, search: str):
                 
                 # NEW ESSENCE SYSTEM: Read from database if available, otherwise calculate fallback
                 essence_capacity = pearl.get('essenceCapacity')
-                essence_remaining = pearl.get('essenceRemaining')
+                essence_remaining = pearl_essence_remaining(pearl)
                 
                 # Fallback for old pearls without new fields
                 if essence_capacity is None or essence_remaining is None:
                     if pearl_start:
                         days_held_so_far = (datetime.now(timezone.utc) - pearl_start).days
-                        essence_remaining = sum(calculate_pearl_essence_cost(days_held_so_far + day + 1) for day in range(days_left))
+                        essence_remaining = pearl_essence_between(days_held_so_far, days_held_so_far + days_left)
                         essence_capacity = 336.0  # FIXED capacity for all pearls
                     else:
                         essence_remaining = days_left * 3.0
@@ -15770,7 +17757,7 @@ async def citizen_lookup_cmd(interaction: discord.Interaction, search: str):
         
         # Check for court cases - wrap blocking .stream() call
         current_db = await ensure_firestore()
-        court_cases = await asyncio.to_thread(lambda: list(current_db.collection(COURT_CASES_COLLECTION).where(
+        court_cases = await firestore_call(lambda: list(current_db.collection(COURT_CASES_COLLECTION).where(
             filter=FieldFilter('defendantIgn', '==', ign)
         ).stream()))
         
@@ -15789,7 +17776,7 @@ async def citizen_lookup_cmd(interaction: discord.Interaction, search: str):
             )
         
         # Check if they're a lawyer - wrap blocking .stream() call
-        lawyer_docs = await asyncio.to_thread(lambda: list(db.collection(LAWYERS_COLLECTION).where(
+        lawyer_docs = await firestore_call(lambda: list(db.collection(LAWYERS_COLLECTION).where(
             filter=FieldFilter('userId', '==', user_id)
         ).limit(1).stream()))
         
@@ -16318,7 +18305,7 @@ async def cities_cmd(interaction: discord.Interaction):
         current_db = await ensure_firestore()
         
         # Get all citizens with their current city
-        citizens = await asyncio.to_thread(
+        citizens = await firestore_call(
             lambda: list(current_db.collection(CITIZENS_COLLECTION).stream())
         )
         
@@ -16489,6 +18476,7 @@ async def citizen_record_release_cmd(interaction: discord.Interaction, record_id
             'releasedBy': str(interaction.user),
             'releasedAt': datetime.now(timezone.utc)
         }))
+        bot.schedule_record_expiry(expires_at)
         
         ign = record.get('ign', 'Unknown')
         await interaction.followup.send(
@@ -17266,6 +19254,7 @@ async def court_reassign(interaction: discord.Interaction, case_id: str, role: s
             bar_num = lawyer_data.get('barNumber', 'N/A')
             update_data = {
                 'prosecutorId': new_person.id,
+                'lawyerIds': firestore.ArrayUnion([new_person.id]),
                 'prosecutorName': str(new_person),
                 'prosecutor': str(new_person),
                 'prosecutorBarNumber': bar_num,
@@ -17281,6 +19270,7 @@ async def court_reassign(interaction: discord.Interaction, case_id: str, role: s
             bar_num = lawyer_data.get('barNumber', 'N/A')
             update_data = {
                 'defenseAttorneyId': new_person.id,
+                'lawyerIds': firestore.ArrayUnion([new_person.id]),
                 'defenseAttorneyName': str(new_person),
                 'defenseAttorney': str(new_person),
                 'defenseBarNumber': bar_num,
@@ -17909,6 +19899,8 @@ async def switch_lawyer_role_cmd(interaction: discord.Interaction):
         print(f"[ERR] Failed to switch lawyer role: {e}")
         await interaction.edit_original_response(content=f"❌ Failed to switch role: {str(e)}")
 
+startup_mark("core")
+
 # ========================================
 # TREASURY TRACKER SYSTEM
 # ========================================
@@ -18555,6 +20547,8 @@ async def treasury_divest_cmd(interaction: discord.Interaction, business_name: s
         print(f"[ERR] State divestment failed: {e}")
         await interaction.edit_original_response(content=f"❌ Failed to sell shares: {str(e)}")
 
+startup_mark("economy")
+
 # ========================================
 # BUSINESS & STOCK MARKET SYSTEM
 # ========================================
@@ -19688,6 +21682,8 @@ async def market_cmd(interaction: discord.Interaction):
         traceback.print_exc()
         await interaction.followup.send(f"❌ Failed to view market: {str(e)}", ephemeral=True)
 
+startup_mark("market")
+
 # ==================================================
 # BETTING SYSTEM - Tom Brady's Royal Betting Exchange
 # ==================================================
@@ -20016,15 +22012,16 @@ async def on_interaction(interaction: discord.Interaction):
                             'threadId': thread.id
                         })
                         
-                        # Update event pool
-                        current_pool = event_data.get('totalPool', 0.0)
-                        contestant_total = event_data.get('betsPerContestant', {}).get(contestant_name, 0.0)
-                        
+                        # Update event pool (server-side increments so concurrent bets don't overwrite each other)
                         db.collection(BETTING_EVENTS_COLLECTION).document(event_id).update({
-                            'totalPool': current_pool + bet_amount,
-                            f'betsPerContestant.{contestant_name}': contestant_total + bet_amount
+                            'totalPool': firestore.Increment(bet_amount),
+                            f'betsPerContestant.{contestant_name}': firestore.Increment(bet_amount),
+                            'totalBets': firestore.Increment(1)
                         })
                         
+                        # Roll the bet into the daily volume series used by the analytics charts
+                        await asyncio.to_thread(record_bet_volume, bet_amount, now_utc)
+                        
                         # Send confirmation in thread
                         est_tz = EST
                         now_est = now_utc.astimezone(est_tz)
@@ -20081,8 +22078,8 @@ async def on_interaction(interaction: discord.Interaction):
                             content=f"✅ Bet placed on **{contestant_name}**! Check your private thread: {thread.mention}"
                         )
                         
-                        # Update live odds on main event message
-                        await update_event_odds(event_id)
+                        # Update live odds on main event message (coalesced with other bets in the same burst)
+                        schedule_event_odds_flush(event_id)
                         
                         print(f"[BETTING] {modal_interaction.user} bet {bet_amount}d on {contestant_name} in event {event_id}")
                         
@@ -20099,9 +22096,93 @@ async def on_interaction(interaction: discord.Interaction):
             print(f"[ERR] Contestant selection failed: {e}")
             await interaction.response.send_message(f"❌ Error: {str(e)}")
 
+# ---------- ODDS HISTORY & VOLUME ROLLUPS ----------
+# Bets arriving within this window share one odds refresh (one message edit + one history snapshot)
+ODDS_FLUSH_DELAY_SECONDS = float(os.getenv("ODDS_FLUSH_DELAY_SECONDS", "3"))
+ODDS_HISTORY_MAX_POINTS = 500  # Upper bound on snapshots read for one odds chart
+_pending_odds_flushes = {}  # event_id -> asyncio.Task
+
+def schedule_event_odds_flush(event_id):
+    """Schedule a coalesced odds refresh for an event (no-op if one is already pending)"""
+    pending = _pending_odds_flushes.get(event_id)
+    if pending and not pending.done():
+        return
+    
+    async def flush():
+        try:
+            await asyncio.sleep(ODDS_FLUSH_DELAY_SECONDS)
+        finally:
+            # Clear before flushing so bets placed during the refresh schedule a new one
+            _pending_odds_flushes.pop(event_id, None)
+        await update_event_odds(event_id)
+    
+    _pending_odds_flushes[event_id] = asyncio.create_task(flush())
+
+def record_odds_snapshot(event_id, event_data, total_bets_count):
+    """Append a point-in-time odds snapshot for an event (never updated or rewritten)"""
+    total_pool = event_data.get('totalPool', 0.0)
+    bets_per_contestant = event_data.get('betsPerContestant', {})
+    
+    multipliers = {}
+    for contestant in event_data.get('contestants', []):
+        contestant_total = bets_per_contestant.get(contestant, 0.0)
+        multipliers[contestant] = (total_pool / contestant_total) if total_pool > 0 and contestant_total > 0 else None
+    
+    db.collection(BETTING_ODDS_HISTORY_COLLECTION).add({
+        'eventId': event_id,
+        'capturedAt': datetime.now(timezone.utc),
+        'totalPool': total_pool,
+        'totalBets': total_bets_count,
+        'betsPerContestant': dict(bets_per_contestant),
+        'multipliers': multipliers
+    })
+
+def betting_volume_day_key(moment: datetime) -> str:
+    """Rollup document ID for the EST calendar day containing `moment`"""
+    return moment.astimezone(EST).strftime('%Y-%m-%d')
+
+def record_bet_volume(amount: float, placed_at: datetime):
+    """Add a bet to its day's volume rollup"""
+    day_start = placed_at.astimezone(EST).replace(hour=0, minute=0, second=0, microsecond=0)
+    db.collection(BETTING_DAILY_VOLUME_COLLECTION).document(betting_volume_day_key(placed_at)).set({
+        'date': day_start.astimezone(timezone.utc),
+        'totalVolume': firestore.Increment(amount),
+        'betCount': firestore.Increment(1),
+        'updatedAt': datetime.now(timezone.utc)
+    }, merge=True)
+
+def rebuild_betting_volume_rollups() -> int:
+    """Recompute every daily volume rollup from the raw bets collection. Returns days written."""
+    daily = {}
+    for bet_doc in db.collection(BETTING_BETS_COLLECTION).stream():
+        data = bet_doc.to_dict()
+        placed_at = data.get('placedAt')
+        if not placed_at:
+            continue
+        if placed_at.tzinfo is None:
+            placed_at = placed_at.replace(tzinfo=timezone.utc)
+        day_key = betting_volume_day_key(placed_at)
+        day_start = placed_at.astimezone(EST).replace(hour=0, minute=0, second=0, microsecond=0)
+        entry = daily.setdefault(day_key, {'date': day_start.astimezone(timezone.utc), 'totalVolume': 0.0, 'betCount': 0})
+        entry['totalVolume'] += data.get('amount', 0)
+        entry['betCount'] += 1
+    
+    now = datetime.now(timezone.utc)
+    day_keys = list(daily.keys())
+    BATCH_SIZE = 400
+    for i in range(0, len(day_keys), BATCH_SIZE):
+        batch = db.batch()
+        for day_key in day_keys[i:i + BATCH_SIZE]:
+            batch.set(
+                db.collection(BETTING_DAILY_VOLUME_COLLECTION).document(day_key),
+                {**daily[day_key], 'updatedAt': now}
+            )
+        batch.commit()
+    return len(day_keys)
+
 # Helper function to update live odds
 async def update_event_odds(event_id):
-    """Update live odds display on event message"""
+    """Update live odds display on event message and record an odds history snapshot"""
     try:
         if not db:
             return
@@ -20111,6 +22192,18 @@ async def update_event_odds(event_id):
             return
         
         event_data = event_doc.to_dict()
+        
+        # Count total bets (events created before the counter existed fall back to a scan)
+        total_bets_count = event_data.get('totalBets')
+        if total_bets_count is None:
+            all_bets = list(db.collection(BETTING_BETS_COLLECTION).where(filter=FieldFilter('eventId', '==', event_id)).stream())
+            total_bets_count = len(all_bets)
+        
+        try:
+            await asyncio.to_thread(record_odds_snapshot, event_id, event_data, total_bets_count)
+        except Exception as snap_err:
+            print(f"[WARN] Failed to record odds snapshot for {event_id}: {snap_err}")
+        
         channel_id = event_data.get('channelId')
         message_id = event_data.get('messageId')
         
@@ -20128,10 +22221,6 @@ async def update_event_odds(event_id):
         bets_per_contestant = event_data.get('betsPerContestant', {})
         contestants = event_data.get('contestants', [])
         
-        # Count total bets
-        all_bets = list(db.collection(BETTING_BETS_COLLECTION).where(filter=FieldFilter('eventId', '==', event_id)).stream())
-        total_bets_count = len(all_bets)
-        
         # Build odds text
         odds_lines = []
         for contestant in contestants:
@@ -20913,6 +23002,93 @@ async def bet_clear_all_cmd(interaction: discord.Interaction):
         print(f"[ERR] Clear all failed: {e}")
         await interaction.edit_original_response(content=f"❌ Failed to clear events: {str(e)}")
 
+@betting_group.command(name="odds_chart", description="📈 Chart how an event's odds moved over time")
+@app_commands.describe(event_id="Event ID (from event footer)")
+async def bet_odds_chart_cmd(interaction: discord.Interaction, event_id: str):
+    await interaction.response.send_message("📈 Generating odds chart...", ephemeral=True)
+    
+    if not db:
+        return await interaction.edit_original_response(content="❌ Database not available.")
+    
+    try:
+        event_doc = await asyncio.to_thread(lambda: db.collection(BETTING_EVENTS_COLLECTION).document(event_id).get())
+        if not event_doc.exists:
+            return await interaction.edit_original_response(content="❌ Event not found.")
+        
+        event_data = event_doc.to_dict()
+        graph_buffer = await asyncio.to_thread(generate_betting_odds_graph, event_id)
+        
+        if not graph_buffer:
+            return await interaction.edit_original_response(content="📋 **No Odds History Yet**\n\nThe chart will appear once bets have been placed on this event.")
+        
+        now_est = datetime.now(timezone.utc).astimezone(EST)
+        embed = discord.Embed(
+            title=f"📈 {event_data.get('title', 'Event')} - Odds History",
+            description=f"*Payout multiplier per contestant after each odds update*\n💰 Pool: {event_data.get('totalPool', 0.0):,.0f}d",
+            color=BETTING_COLOR
+        )
+        embed.set_author(name="Tom Brady", icon_url=BETTING_MASCOT_AVATAR)
+        embed.set_footer(text=f"Event ID: {event_id} | Updated: {now_est.strftime('%b %d, %Y at %I:%M %p EST')}")
+        
+        file = discord.File(graph_buffer, filename="odds_history.png")
+        embed.set_image(url="attachment://odds_history.png")
+        await interaction.edit_original_response(content=None, embed=embed, attachments=[file])
+        
+    except Exception as e:
+        print(f"[ERR] Odds chart failed: {e}")
+        await interaction.edit_original_response(content=f"❌ Failed to generate chart: {str(e)}")
+
+@betting_group.command(name="volume_chart", description="📊 Chart daily betting volume")
+@app_commands.describe(days="How many days of history to show (default 90)")
+async def bet_volume_chart_cmd(interaction: discord.Interaction, days: app_commands.Range[int, 1, 730] = 90):
+    await interaction.response.send_message("📊 Generating volume chart...", ephemeral=True)
+    
+    if not db:
+        return await interaction.edit_original_response(content="❌ Database not available.")
+    
+    try:
+        graph_buffer = await asyncio.to_thread(generate_betting_volume_graph, days)
+        
+        if not graph_buffer:
+            return await interaction.edit_original_response(content=f"📋 **No Betting Volume** in the last {days} days.")
+        
+        now_est = datetime.now(timezone.utc).astimezone(EST)
+        embed = discord.Embed(
+            title="📊 BETTING EXCHANGE - DAILY VOLUME",
+            description=f"*Diamonds wagered per day over the last {days} days*",
+            color=BETTING_COLOR
+        )
+        embed.set_author(name="Tom Brady", icon_url=BETTING_MASCOT_AVATAR)
+        embed.set_footer(text=f"Updated: {now_est.strftime('%b %d, %Y at %I:%M %p EST')}")
+        
+        file = discord.File(graph_buffer, filename="betting_volume.png")
+        embed.set_image(url="attachment://betting_volume.png")
+        await interaction.edit_original_response(content=None, embed=embed, attachments=[file])
+        
+    except Exception as e:
+        print(f"[ERR] Volume chart failed: {e}")
+        await interaction.edit_original_response(content=f"❌ Failed to generate chart: {str(e)}")
+
+@betting_group.command(name="rebuild_volume", description="🔧 Rebuild daily volume rollups from all bets (Admin only)")
+async def bet_rebuild_volume_cmd(interaction: discord.Interaction):
+    await interaction.response.send_message("⏳ Processing...", ephemeral=True)
+    
+    if not has_admin_role(interaction):
+        return await interaction.edit_original_response(content="❌ Only administrators can rebuild betting rollups.")
+    
+    if not db:
+        return await interaction.edit_original_response(content="❌ Database not available.")
+    
+    try:
+        days_written = await asyncio.to_thread(rebuild_betting_volume_rollups)
+        await interaction.edit_original_response(content=f"✅ Rebuilt betting volume rollups for **{days_written}** day(s).")
+        print(f"[BETTING] {interaction.user} rebuilt volume rollups ({days_written} days)")
+    except Exception as e:
+        print(f"[ERR] Rebuild volume rollups failed: {e}")
+        await interaction.edit_original_response(content=f"❌ Failed to rebuild rollups: {str(e)}")
+
+startup_mark("betting")
+
 # ==================================================
 # BANK SYSTEM - COMMANDS
 # ==================================================
@@ -21805,6 +23981,8 @@ class ViewFullDashboardButton(ui.View):
             import traceback
             traceback.print_exc()
 
+startup_mark("bank")
+
 # ========================================
 # TREASURY BONDS SYSTEM
 # ========================================
@@ -22652,6 +24830,8 @@ async def constitution_cmd(interaction: discord.Interaction, action: str, doc_ty
         print(f"[ERR] Constitution command failed: {e}")
         await interaction.followup.send(f"❌ Error: {str(e)}")
 
+startup_mark("economy")
+
 # ========================================
 # ADMIN MARKET PRICE MANAGEMENT
 # ========================================
@@ -22831,6 +25011,8 @@ async def view_market_prices_cmd(interaction: discord.Interaction):
         traceback.print_exc()
         await interaction.edit_original_response(content=f"❌ Failed to load prices: {str(e)}")
 
+startup_mark("core")
+
 # ========================================
 # UNIFIED ACCOUNT DASHBOARD
 # ========================================
@@ -23563,6 +25745,8 @@ async def market_cap_leaderboard(interaction: discord.Interaction):
         print(f"[ERR] Market cap leaderboard failed: {e}")
         await interaction.edit_original_response(content=f"❌ Error: {str(e)}")
 
+startup_mark("economy")
+
 # ========================================
 # PROPERTY/LAND REGISTRY SYSTEM (#4)
 # ========================================
@@ -25489,6 +27673,8 @@ async def view_portfolio_value(interaction: discord.Interaction):
         traceback.print_exc()
         await interaction.edit_original_response(content=f"❌ Error: {str(e)}")
 
+startup_mark("property")
+
 # ========================================
 # GOVERNMENT CONTRACTS SYSTEM (#5)
 # ========================================
@@ -25885,25 +28071,181 @@ async def complete_contract(interaction: discord.Interaction, contract_id: str):
         await interaction.edit_original_response(content=f"❌ Error: {str(e)}")
 
 
-# ---------- GLOBAL EXCEPTION HANDLERS ----------
-def handle_exception(exc_type, exc_value, exc_traceback):
-    """Global exception handler for unhandled exceptions"""
-    if issubclass(exc_type, KeyboardInterrupt):
-        sys.__excepthook__(exc_type, exc_value, exc_traceback)
-        return
+
+startup_mark("contracts")
+
+# =============== BOT ADMINISTRATION COMMANDS ===============
+@admin_group.command(name="sync_commands", description="[ADMIN] Sync slash commands to Discord")
+@app_commands.describe(force="Sync every scope even if the command tree hash is unchanged (default: True)")
+async def admin_sync_commands_cmd(interaction: discord.Interaction, force: bool = True):
+    await interaction.response.send_message("⏳ Syncing commands...", ephemeral=True)
+    
+    if not has_admin_role(interaction):
+        return await interaction.edit_original_response(content="❌ Only administrators can sync commands.")
+    
+    try:
+        results = await bot.sync_commands(force=force)
+        lines = [f"{'✅' if r == 'synced' else '⏭️' if r == 'unchanged' else '❌'} **{scope}**: {r}" for scope, r in results.items()]
+        await interaction.edit_original_response(content="🔄 **Command Sync**\n\n" + "\n".join(lines)[:1900])
+        print(f"[OK] {interaction.user} ran command sync (force={force})")
+    except Exception as e:
+        print(f"[ERR] Manual command sync failed: {e}")
+        await interaction.edit_original_response(content=f"❌ Command sync failed: {str(e)}")
+
+
+@admin_group.command(name="firestore_health", description="[ADMIN] Show the cached Firestore health / circuit breaker state")
+async def admin_firestore_health_cmd(interaction: discord.Interaction):
+    if not has_admin_role(interaction):
+        return await interaction.response.send_message("❌ Only administrators can view database health.", ephemeral=True)
     
-    logger.critical("Unhandled exception", exc_info=(exc_type, exc_value, exc_traceback))
+    if isinstance(db, InMemoryDB):
+        return await interaction.response.send_message("ℹ️ Using in-memory storage - no Firestore connection to monitor.", ephemeral=True)
+    
+    health = firestore_health.summary()
+    state_emoji = {'healthy': '🟢', 'degraded': '🟡', 'down': '🔴'}.get(health['state'], '⚪')
+    lines = [f"{state_emoji} **Firestore: {health['state'].upper()}**"]
+    lines.append(f"Consecutive failures: **{health['consecutiveFailures']}** / {FIRESTORE_BREAKER_THRESHOLD}")
+    if health['lastSuccessAgo'] is not None:
+        lines.append(f"Last successful call: {health['lastSuccessAgo']}s ago")
+    if health['lastError']:
+        lines.append(f"Last error ({health['lastFailureAgo']}s ago): `{health['lastError']}`")
+    if health['state'] == 'down':
+        lines.append(f"Rebuild attempt in: {health['retryIn']}s")
+    lines.append(f"Client rebuilds: {health['rebuilds']} • Short-circuited calls: {health['shortCircuited']}")
+    await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+@admin_group.command(name="jobs", description="[ADMIN] Show background job runs, durations and Firestore reads/writes")
+@app_commands.describe(run="Optionally run this job now (skipped if it is already running)")
+@app_commands.choices(run=[app_commands.Choice(name=name, value=name) for name in task_scheduler.jobs])
+async def admin_jobs_cmd(interaction: discord.Interaction, run: app_commands.Choice[str] = None):
+    await interaction.response.send_message("⏳ Processing...", ephemeral=True)
+    
+    if not has_admin_role(interaction):
+        return await interaction.edit_original_response(content="❌ Only administrators can view background jobs.")
+    
+    header = ""
+    if run:
+        ran = await task_scheduler.run_now(bot, run.value)
+        header = f"▶️ Ran **{run.value}**\n\n" if ran else f"⏭️ **{run.value}** is already running - skipped\n\n"
+        print(f"[OK] {interaction.user} ran job {run.value} manually")
+    
+    lines = []
+    for job in task_scheduler.status(bot):
+        state = '🔄' if job['running'] else '❌' if job['lastError'] else '🟢' if job['active'] else '⏸️'
+        line = f"{state} **{job['name']}** • runs: {job['runs']}"
+        if job['failures'] or job['skipped']:
+            line += f" (failed {job['failures']}, skipped {job['skipped']})"
+        if job['lastStart']:
+            line += f"\n   last: <t:{int(job['lastStart'].timestamp())}:R> in {job['lastDuration']}s"
+            line += f" • reads/writes: {job['lastReads']}/{job['lastWrites']} (total {job['reads']}/{job['writes']})"
+        if job['nextRun']:
+            line += f"\n   next: <t:{int(job['nextRun'].timestamp())}:R>"
+        if job['lastError']:
+            line += f"\n   error: `{job['lastError'][:150]}`"
+        lines.append(line)
+    
+    await interaction.edit_original_response(content=(header + "⚙️ **Background Jobs**\n\n" + "\n".join(lines))[:1990])
+
+@admin_group.command(name="metrics", description="[ADMIN] Show the most expensive commands, buttons and modals")
+@app_commands.describe(sort="Rank by Firestore cost, total time, call count or errors")
+@app_commands.choices(sort=[
+    app_commands.Choice(name="Firestore cost", value="cost"),
+    app_commands.Choice(name="Total time", value="time"),
+    app_commands.Choice(name="Calls", value="calls"),
+    app_commands.Choice(name="Errors", value="errors"),
+])
+async def admin_metrics_cmd(interaction: discord.Interaction, sort: app_commands.Choice[str] = None):
+    if not has_admin_role(interaction):
+        return await interaction.response.send_message("❌ Only administrators can view metrics.", ephemeral=True)
+    
+    sort_by = sort.value if sort else 'cost'
+    rows = interaction_metrics.top(sort_by)
+    if not rows:
+        return await interaction.response.send_message("ℹ️ No interactions recorded since startup.", ephemeral=True)
+    
+    def fmt(seconds):
+        return '—' if seconds is None else '>30s' if seconds == float('inf') else f"{seconds:g}s"
+    
+    lines = []
+    for kind, name, stats in rows:
+        label = f"/{name}" if kind in ('command', 'autocomplete') else name
+        line = f"**{label}** ({kind}) ×{stats.count}"
+        line += f"\n   p95 ack ≤{fmt(stats.ack.quantile(0.95))} • p95 total ≤{fmt(stats.total.quantile(0.95))}"
+        line += f" • Firestore r/w/rt: {stats.reads}/{stats.writes}/{stats.round_trips} • HTTP: {stats.http_calls}"
+        if stats.errors or stats.unacked:
+            line += f"\n   ⚠️ errors: {stats.errors} • unacked: {stats.unacked}"
+        lines.append(line)
+    
+    endpoint = f"http://{METRICS_HOST}:{METRICS_PORT}/metrics" if interaction_metrics.server else "disabled"
+    content = f"📈 **Interaction Metrics** (by {sort_by}, since startup)\nPrometheus: `{endpoint}`\n\n" + "\n".join(lines)
+    await interaction.response.send_message(content[:1990], ephemeral=True)
+
+@admin_group.command(name="firestore_profile", description="[ADMIN] Firestore call-site profile (documents, calls, latency per call site)")
+@app_commands.describe(sort="Rank call sites by documents read/written, calls, total time or unbounded streams")
+@app_commands.choices(sort=[
+    app_commands.Choice(name="Documents", value="docs"),
+    app_commands.Choice(name="Calls", value="calls"),
+    app_commands.Choice(name="Total time", value="time"),
+    app_commands.Choice(name="Unbounded streams", value="unbounded"),
+])
+async def admin_firestore_profile_cmd(interaction: discord.Interaction, sort: app_commands.Choice[str] = None):
+    if not has_admin_role(interaction):
+        return await interaction.response.send_message("❌ Only administrators can view the Firestore profile.", ephemeral=True)
+    
+    if not firestore_profiler.sites:
+        return await interaction.response.send_message("ℹ️ No Firestore calls recorded since startup.", ephemeral=True)
+    
+    sort_by = sort.value if sort else 'docs'
+    report = firestore_profiler.report(sort_by, limit=200)
+    flagged = sum(1 for stats in firestore_profiler.sites.values() if stats.unbounded)
+    await interaction.response.send_message(
+        f"🔎 **Firestore profile** ({len(firestore_profiler.sites)} call sites, {flagged} with unbounded streams > {FIRESTORE_UNBOUNDED_STREAM_DOCS} docs)\n"
+        f"```\n{firestore_profiler.report(sort_by, limit=8)[:1700]}\n```",
+        file=discord.File(BytesIO(report.encode()), filename="firestore_profile.txt"),
+        ephemeral=True
+    )
 
-def handle_asyncio_exception(loop, context):
-    """Handler for asyncio exceptions"""
-    exception = context.get('exception')
-    if exception:
-        logger.error(f"Asyncio exception: {exception}", exc_info=exception)
-    else:
-        logger.error(f"Asyncio error: {context['message']}")
+@admin_group.command(name="startup_report", description="[ADMIN] Show import and load time per subsystem")
+async def admin_startup_report_cmd(interaction: discord.Interaction):
+    if not has_admin_role(interaction):
+        return await interaction.response.send_message("❌ Only administrators can view the startup report.", ephemeral=True)
+    
+    await interaction.response.send_message(f"⏱️ **Startup Timing Report**\n```\n{startup_report()[:1900]}\n```", ephemeral=True)
 
-# Install global exception handlers
-sys.excepthook = handle_exception
+@admin_group.command(name="subsystem", description="[ADMIN] Enable or disable an optional subsystem")
+@app_commands.describe(name="Subsystem to switch", enabled="Load (True) or unload (False) its commands")
+@app_commands.choices(name=[app_commands.Choice(name=name, value=name) for name in SUBSYSTEMS])
+async def admin_subsystem_cmd(interaction: discord.Interaction, name: app_commands.Choice[str], enabled: bool):
+    await interaction.response.send_message("⏳ Processing...", ephemeral=True)
+    
+    if not has_admin_role(interaction):
+        return await interaction.edit_original_response(content="❌ Only administrators can switch subsystems.")
+    
+    try:
+        changed = set_subsystem_enabled(name.value, enabled)
+        
+        # Keep background tasks in step with the subsystem
+        for task_name in SUBSYSTEMS[name.value]['tasks']:
+            task = getattr(bot, task_name)
+            if enabled and not task.is_running():
+                task.start()
+            elif not enabled and task.is_running():
+                task.cancel()
+        
+        # Hash-gated: only scopes whose command tree actually changed are re-uploaded
+        if changed:
+            await bot.sync_commands()
+        
+        state = "enabled" if enabled else "disabled"
+        await interaction.edit_original_response(
+            content=f"✅ Subsystem **{name.value}** {state} ({len(changed)} command(s) changed).\n"
+                    f"Disabled now: {', '.join(sorted(DISABLED_SUBSYSTEMS)) or 'none'}\n"
+                    f"*Runtime only - set DISABLED_SUBSYSTEMS to make it permanent.*"
+        )
+        print(f"[OK] {interaction.user} {state} subsystem {name.value}")
+    except Exception as e:
+        print(f"[ERR] Subsystem switch failed: {e}")
+        await interaction.edit_original_response(content=f"❌ Failed to switch subsystem: {str(e)}")
 
 
 # =============== QUICK THREAD ACCESS COMMAND ===============
@@ -25980,6 +28322,8 @@ async def quick_thread_add(interaction: discord.Interaction, case_id: str, user:
         except:
             pass
 
+startup_mark("core")
+
 # ---------- RUN ----------
 def main():
     load_dotenv()
@@ -25997,14 +28341,14 @@ def main():
 
     # Set up asyncio exception handler
     loop = asyncio.get_event_loop()
-    loop.set_exception_handler(handle_asyncio_exception)
+    loop.set_exception_handler(asyncio_exception_handler)
 
     print("\n🤖 Starting Royal Council Discord Bot...")
-    print("📝 Bot will sync commands on first connection\n")
+    print("📝 Bot will sync commands on first connection (only if they changed)\n")
     print(f"📁 Crash logs will be saved to: /tmp/bot_logs/bot_crash.log\n")
 
     try:
-        bot.run(DISCORD_BOT_TOKEN)
+        bot.run(DISCORD_BOT_TOKEN, log_handler=None)  # Logging is already routed through the queue listener
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
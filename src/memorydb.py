@@ -5,6 +5,68 @@
     def collection(self, name):
         return InMemoryCollection(self._collections.setdefault(name, {}))
 
+    def batch(self):
+        return InMemoryBatch()
+
+
+class AlreadyExists(Exception):
+    """create() on a document that exists (google.api_core.exceptions.AlreadyExists in Firestore)"""
+
+
+def _apply_transform(current, value):
+    # Firestore sentinels (Increment, ArrayUnion, ...) are matched by name so
+    # this shim does not need google-cloud-firestore installed.
+    kind = type(value).__name__
+    if kind == 'Increment':
+        return (current or 0) + value.value
+    if kind == 'ArrayUnion':
+        current = list(current or [])
+        return current + [v for v in value.values if v not in current]
+    if kind == 'ArrayRemove':
+        return [v for v in (current or []) if v not in value.values]
+    return value
+
+
+def _apply_update(data, updates):
+    for key, value in updates.items():
+        target = data
+        parts = key.split('.')
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = _apply_transform(target.get(parts[-1]), value)
+
+
+def _apply_merge(data, updates):
+    # set(merge=True) merges nested maps key by key; unlike update() the keys are
+    # literal names, not dotted field paths.
+    for key, value in updates.items():
+        if isinstance(value, dict):
+            target = data.get(key)
+            if not isinstance(target, dict):
+                target = data[key] = {}
+            _apply_merge(target, value)
+        else:
+            data[key] = _apply_transform(data.get(key), value)
+
+
+def _copy_value(value):
+    # Only maps and arrays are mutable; scalars, datetimes and sentinels are shared
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    return value
+
+
+def _get_path(data, field):
+    # where() takes dotted field paths into nested maps ('votes.yes')
+    for part in field.split('.'):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(part)
+    return data
+
+
 class InMemoryCollection:
     def __init__(self, store):
         self.store = store
@@ -15,18 +77,22 @@ class InMemoryCollection:
             doc_id = str(uuid.uuid4())
         return InMemoryDoc(self.store, doc_id)
 
+    def add(self, data):
+        doc = self.document()
+        doc.set(data)
+        return None, doc
+
     def where(self, field=None, op=None, value=None, *, filter=None):
-        if filter is not None:
-            field = filter.field_path
-            op = filter.op_string
-            value = filter.value
-        return InMemoryQuery(self.store, field, op, value)
+        return InMemoryQuery(self.store).where(field, op, value, filter=filter)
+
+    def order_by(self, field, direction='ASCENDING'):
+        return InMemoryQuery(self.store).order_by(field, direction)
 
     def limit(self, n):
-        return InMemoryQuery(self.store, None, None, None, limit=n)
+        return InMemoryQuery(self.store, limit=n)
 
     def stream(self):
-        return [InMemoryDoc(self.store, doc_id) for doc_id in self.store]
+        return [InMemoryDoc(self.store, doc_id) for doc_id in list(self.store)]
 
 class InMemoryDoc:
     def __init__(self, store, doc_id):
@@ -45,52 +111,125 @@ class InMemoryDoc:
         return self.store.get(self.id, {}).get(key, default)
 
     def to_dict(self):
-        return dict(self.store.get(self.id, {}))
+        # A fresh copy, like a Firestore snapshot: editing it must not edit the store
+        return _copy_value(self.store.get(self.id, {}))
 
-    def set(self, data):
-        self.store[self.id] = dict(data)
+    def set(self, data, merge=False):
+        if merge:
+            _apply_merge(self.store.setdefault(self.id, {}), data)
+        else:
+            self.store[self.id] = {}
+            _apply_update(self.store[self.id], data)
+
+    def create(self, data):
+        if self.id in self.store:
+            raise AlreadyExists(f"Document already exists: {self.id}")
+        self.set(data)
 
     def update(self, data):
-        self.store.setdefault(self.id, {}).update(data)
+        _apply_update(self.store.setdefault(self.id, {}), data)
 
     def delete(self):
         self.store.pop(self.id, None)
 
 
+class InMemoryBatch:
+    def __init__(self):
+        self._ops = []
+
+    def set(self, ref, data, merge=False):
+        self._ops.append(lambda: ref.set(data, merge=merge))
+
+    def update(self, ref, data):
+        self._ops.append(lambda: ref.update(data))
+
+    def delete(self, ref):
+        self._ops.append(ref.delete)
+
+    def commit(self):
+        for op in self._ops:
+            op()
+        self._ops = []
+
+
 class InMemoryQuery:
-    def __init__(self, store, field, op, value, limit=None):
+    def __init__(self, store, field=None, op=None, value=None, limit=None):
         self.store = store
-        self.field = field
-        self.op = op
-        self.value = value
+        self.filters = []
+        if field is not None:
+            self.filters.append((field, op, value))
+        self._order = []
         self._limit = limit
+        self._start_after = None
 
-    def limit(self, n):
-        self._limit = n
+    def where(self, field=None, op=None, value=None, *, filter=None):
+        if filter is not None:
+            field = filter.field_path
+            op = filter.op_string
+            value = filter.value
+        self.filters.append((field, op, value))
         return self
 
-    def _match(self, data):
-        if self.field is None:
-            return True
+    def order_by(self, field, direction='ASCENDING'):
+        self._order.append((field, direction == 'DESCENDING'))
+        return self
 
-        v = data.get(self.field)
+    def limit(self, n):
+        self._limit = n
+        return self
 
-        if self.op == '==':
-            return v == self.value
-        if self.op == '!=':
-            return v != self.value
-        if self.op == 'in':
-            return v in self.value
-        if self.op == 'not-in':
-            return v not in self.value
+    def start_after(self, snapshot):
+        # Cursor from the last document of the previous page
+        self._start_after = snapshot
+        return self
 
-        return False
+    def _match(self, data):
+        for field, op, value in self.filters:
+            v = _get_path(data, field)
+            try:
+                if op == '==':
+                    ok = v == value
+                elif op == '!=':
+                    ok = v != value
+                elif op == 'in':
+                    ok = v in value
+                elif op == 'not-in':
+                    ok = v not in value
+                elif op in ('array_contains', 'array-contains'):
+                    ok = value in (v or [])
+                elif op in ('array_contains_any', 'array-contains-any'):
+                    ok = any(item in (v or []) for item in value)
+                elif op == '<':
+                    ok = v is not None and v < value
+                elif op == '<=':
+                    ok = v is not None and v <= value
+                elif op == '>':
+                    ok = v is not None and v > value
+                elif op == '>=':
+                    ok = v is not None and v >= value
+                else:
+                    ok = False
+            except TypeError:
+                ok = False
+            if not ok:
+                return False
+        return True
 
     def stream(self):
-        results = []
-        for doc_id, data in self.store.items():
-            if self._match(data):
-                results.append(InMemoryDoc(self.store, doc_id))
-                if self._limit and len(results) >= self._limit:
-                    break
-        return results
\ No newline at end of file
+        matched = [doc_id for doc_id, data in list(self.store.items()) if self._match(data)]
+        for field, descending in reversed(self._order):
+            present = [d for d in matched if self.store[d].get(field) is not None]
+            present.sort(key=lambda d: self.store[d][field], reverse=descending)
+            matched = present
+        if self._start_after is not None:
+            cursor_id = self._start_after.id
+            if cursor_id in matched:
+                matched = matched[matched.index(cursor_id) + 1:]
+            elif self._order:
+                # Cursor document no longer matches: resume after its value of the first sort field
+                field, descending = self._order[0]
+                value = self._start_after.to_dict().get(field)
+                matched = [d for d in matched if (self.store[d][field] < value if descending else self.store[d][field] > value)]
+        if self._limit:
+            matched = matched[:self._limit]
+        return [InMemoryDoc(self.store, doc_id) for doc_id in matched]
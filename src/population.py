@@ -0,0 +1,587 @@
+"""
+Deterministic synthetic population for capacity testing.
+
+populate(store, citizens=..., seed=...) fills a Firestore-compatible store
+(InMemoryDB, or a client pointed at the Firestore emulator) with
+schema-correct documents for the collections main.py reads: citizens and
+their snitch trail, warrants, pearls, records, court cases, lawyers, bills
+with votes, betting, banking, treasury, stocks, property and contracts.
+Operational state (panel registrations, job queue, command sync) is left
+out - the bot rebuilds it itself.
+
+Volumes scale with the citizen count (see VOLUME_PER_CITIZEN) and history is
+spread over `years`. The same seed and size produce the same documents and
+ids; timestamps are anchored to the current day so "active"/"open" windows
+stay valid.
+
+Import main (with its environment configured) before this module.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+
+import main
+
+# Documents generated per citizen (fractions are rounded over the whole population)
+VOLUME_PER_CITIZEN = {
+    main.SNITCH_LOGS_COLLECTION: 60,
+    main.BANK_TRANSACTIONS_COLLECTION: 12,
+    main.STOCK_TRANSACTIONS_COLLECTION: 2,
+    main.BETTING_BETS_COLLECTION: 1.5,
+    main.WARRANTS_COLLECTION: 0.1,
+    main.CRIMINAL_RECORDS_COLLECTION: 0.15,
+    main.COURT_CASES_COLLECTION: 0.1,
+    main.PEARLS_COLLECTION: 0.05,
+    main.BILL_COLLECTION_NAME: 0.12,
+    main.BETTING_EVENTS_COLLECTION: 0.03,
+    main.BUSINESSES_COLLECTION: 0.02,
+    main.PROPERTIES_COLLECTION: 0.3,
+    main.CONTRACTS_COLLECTION: 0.01,
+}
+BANK_ACCOUNT_SHARE = 0.6  # Fraction of citizens holding a bank account
+LAWYER_SHARE = 0.01
+USER_ID_BASE = 1400000000000000001  # Synthetic Discord snowflakes, well clear of the configured role/channel ids
+BATCH_SIZE = 450  # Firestore caps batches at 500 writes
+
+COMMODITIES = ['diamond', 'essence', 'iron', 'gold', 'emerald', 'iron_block', 'gold_block', 'emerald_block']
+BALANCE_FIELDS = ['diamondBalance', 'essenceBalance', 'ironBalance', 'goldBalance', 'emeraldBalance',
+                  'ironBlockBalance', 'goldBlockBalance', 'emeraldBlockBalance']
+CHARGES = ['Griefing', 'Theft', 'Trespassing', 'Murder', 'Vandalism', 'Fraud', 'Smuggling', 'Contempt of Court']
+SNITCH_GROUPS = ['FlorabisGov', 'VictoriaWatch', 'SanAlejandro', 'WizardGuard']
+BILL_WORDS = ['tax', 'road', 'harbor', 'treasury', 'court', 'bank', 'iron', 'guard', 'pearl', 'essence',
+              'bridge', 'farm', 'vault', 'market', 'district', 'militia', 'rail', 'library']
+SECTORS = ['Mining', 'Farming', 'Trade', 'Construction', 'Banking', 'Transport']
+
+
+class BatchWriter:
+    """Buffers set() calls into Firestore batches"""
+
+    def __init__(self, store):
+        self.store = store
+        self.batch = store.batch()
+        self.pending = 0
+        self.written = 0
+
+    def set(self, collection: str, doc_id: str, data: dict):
+        self.batch.set(self.store.collection(collection).document(doc_id), data)
+        self.pending += 1
+        if self.pending >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.batch.commit()
+            self.written += self.pending
+            self.batch = self.store.batch()
+            self.pending = 0
+
+
+class Population:
+    """Generator state plus the handles benchmarks and workloads pick inputs from"""
+
+    def __init__(self, store, citizens: int, seed: int = 1, years: float = 2.0):
+        self.rng = random.Random(seed)
+        self.writer = BatchWriter(store)
+        self.citizens = citizens
+        self.now = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0)
+        self.history = timedelta(days=365 * years)
+        self.counts = {}
+
+        self.user_ids = [USER_ID_BASE + i for i in range(citizens)]
+        self.igns = [f"Player{i:05d}" for i in range(citizens)]
+        self.bill_ids = []
+        self.case_ids = []
+        self.open_event_ids = []
+        self.business_ids = []
+        self.account_numbers = {}
+
+    # ---------- helpers ----------
+    def volume(self, collection: str) -> int:
+        return max(1, round(self.citizens * VOLUME_PER_CITIZEN[collection]))
+
+    def past(self, within: timedelta = None) -> datetime:
+        window = (within or self.history).total_seconds()
+        return self.now - timedelta(seconds=self.rng.random() * window)
+
+    def future(self, days: float) -> datetime:
+        return self.now + timedelta(seconds=self.rng.random() * days * 86400)
+
+    def citizen(self):
+        i = self.rng.randrange(self.citizens)
+        return self.user_ids[i], self.igns[i]
+
+    def doc_id(self, prefix: str, n: int) -> str:
+        return f"{prefix}-{n:06d}"
+
+    def put(self, collection: str, doc_id: str, data: dict):
+        self.writer.set(collection, doc_id, data)
+        self.counts[collection] = self.counts.get(collection, 0) + 1
+
+    # ---------- people and justice ----------
+    def gen_citizens(self):
+        for uid, ign in zip(self.user_ids, self.igns):
+            region, city, _ = self.rng.choice(main.ALL_CITIES)
+            self.put(main.CITIZENS_COLLECTION, str(uid), {
+                'userId': uid,
+                'ign': ign,
+                'username': ign.lower(),
+                'citizenshipType': self.rng.choices(['primary', 'secondary', 'resident'], [70, 20, 10])[0],
+                'registeredAt': self.past(),
+                'addedBy': 'snitch_verification',
+                'snitchVerified': True,
+                'currentCity': city,
+                'currentRegion': region,
+            })
+
+    def gen_snitch_logs(self):
+        for n in range(self.volume(main.SNITCH_LOGS_COLLECTION)):
+            _, ign = self.citizen()
+            x, y, z = self.rng.randint(-10000, 10000), self.rng.randint(0, 255), self.rng.randint(-10000, 10000)
+            group = self.rng.choice(SNITCH_GROUPS)
+            snitch_name = f"snitch{self.rng.randint(1, 400)}"
+            self.put(main.SNITCH_LOGS_COLLECTION, self.doc_id('SL', n), {
+                'player': ign,
+                'group': group,
+                'action': 'is at',
+                'snitchName': snitch_name,
+                'coordinates': f"{x}, {y}, {z}",
+                'x': x, 'y': y, 'z': z,
+                'timestamp': self.past(),
+                'uploadedBy': 'snitchbot',
+                'uploadedById': 0,
+                'type': 'kira',
+                'sourceName': group,
+                'originalLine': f"[{group}] {ign} is at {snitch_name} ({x},{y},{z})",
+            })
+
+    def gen_justice(self):
+        for n in range(self.volume(main.WARRANTS_COLLECTION)):
+            uid, ign = self.citizen()
+            self.put(main.WARRANTS_COLLECTION, self.doc_id('W', n), {
+                'ign': ign,
+                'userId': uid,
+                'status': self.rng.choices(['active', 'served'], [1, 2])[0],
+                'charge': self.rng.choice(CHARGES),
+                'jurisdiction': 'STATE',
+                'issuedAt': self.past(),
+            })
+
+        for n in range(self.volume(main.CRIMINAL_RECORDS_COLLECTION)):
+            uid, ign = self.citizen()
+            created = self.past()
+            expiry_days = self.rng.choice([30, 60, 90])
+            expires = created + timedelta(days=expiry_days)
+            self.put(main.CRIMINAL_RECORDS_COLLECTION, self.doc_id('REC', n), {
+                'recordId': self.doc_id('REC', n),
+                'citizenId': str(uid),
+                'ign': ign,
+                'charge': self.rng.choice(CHARGES),
+                'jurisdiction': 'STATE',
+                'status': 'ACTIVE' if expires > self.now else 'EXPIRED',
+                'createdAt': created,
+                'createdBy': 0,
+                'expiryDays': expiry_days,
+                'expiresAt': expires,
+            })
+
+        for n in range(self.volume(main.COURT_CASES_COLLECTION)):
+            uid, ign = self.citizen()
+            plaintiff_id, plaintiff_ign = self.citizen()
+            case_type = self.rng.choice(['Criminal', 'Civil'])
+            case_id = f"{'CR' if case_type == 'Criminal' else 'CV'}-{n:06X}"
+            status = self.rng.choices(['pending', 'sentenced', 'closed', 'dismissed'], [2, 3, 4, 1])[0]
+            charges = self.rng.choice(CHARGES)
+            self.case_ids.append(case_id)
+            self.put(main.COURT_CASES_COLLECTION, case_id, {
+                'caseId': case_id,
+                'caseType': case_type,
+                'caseCategory': charges.lower(),
+                'caseSeverity': self.rng.choices(['normal', 'serious'], [9, 1])[0],
+                'requiresJudgePanel': False,
+                'defendantIgn': ign,
+                'defendantDiscordId': uid,
+                'defendantDiscordUsername': ign.lower(),
+                'plaintiff': plaintiff_ign,
+                'plaintiffId': plaintiff_id,
+                'charges': charges,
+                'evidence': f"Snitch logs placing {ign} at the scene",
+                'evidenceLinks': '',
+                'status': status,
+                'filedAt': self.past(),
+                'verdict': None if status == 'pending' else self.rng.choice(['guilty', 'not guilty']),
+                'sentence': None if status != 'sentenced' else f"{self.rng.randint(1, 14)} days pearl",
+                'prosecutorId': None, 'prosecutorName': None,
+                'defenseLawyerId': None, 'defenseLawyerName': None,
+                'plaintiffLawyerId': None, 'plaintiffLawyerName': None,
+                'defendantLawyerId': None, 'defendantLawyerName': None,
+                **main.case_search_fields({'defendantIgn': ign}),
+            })
+
+        for n in range(self.volume(main.PEARLS_COLLECTION)):
+            uid, ign = self.citizen()
+            started = self.past(timedelta(days=60))
+            active = self.rng.random() < 0.5
+            self.put(main.PEARLS_COLLECTION, self.doc_id('PRL', n), {
+                'ign': ign,
+                'userId': uid,
+                'status': 'active' if active else 'released',
+                'charges': self.rng.choice(CHARGES),
+                'sentence': f"{self.rng.randint(1, 30)} days",
+                'jurisdiction': 'STATE',
+                'essenceCapacity': 64.0,
+                'essenceRemaining': float(self.rng.randint(0, 64)),
+                'lastEssenceUpdate': self.past(timedelta(hours=12)),
+                'pearlStartDate': started,
+                'expectedReleaseDate': started + timedelta(days=30),
+                'pearlDuration': 30,
+                'pearlHolder': 'Warden',
+                'vaultLocation': 'Ciudad de Victoria Vault',
+                'issuedBy': 'Warden',
+                'issuedById': 0,
+                'courtCaseId': self.rng.choice(self.case_ids) if self.case_ids else None,
+            })
+
+        for n in range(max(1, round(self.citizens * LAWYER_SHARE))):
+            uid, ign = self.citizen()
+            self.put(main.LAWYERS_COLLECTION, self.doc_id('LAW', n), {
+                'discordId': uid,
+                'discordName': ign.lower(),
+                'ign': ign,
+                'lawyerType': self.rng.choice(['attorney', 'prosecutor']),
+                'barNumber': f"FL-{uid % 100000}",
+                'registeredAt': self.past(),
+                'wins': self.rng.randint(0, 20),
+                'losses': self.rng.randint(0, 20),
+                'activeCases': [],
+                'totalCases': self.rng.randint(0, 40),
+                'jurisdiction': 'STATE',
+                'status': 'active',
+            })
+
+    # ---------- legislature ----------
+    def gen_bills(self):
+        statuses = list(main.BILL_STATUSES.values())
+        categories = list(main.BILL_CATEGORIES.values())
+        voters = self.user_ids[:max(5, min(len(self.user_ids), 25))]  # A council-sized electorate
+        bill_total = self.volume(main.BILL_COLLECTION_NAME)
+        for n in range(bill_total):
+            bill_id = f"{n:06X}"
+            status = self.rng.choices(statuses, [1, 1, 1, 3, 1, 6, 2])[0]
+            votes = {'yes': [], 'no': [], 'abstain': []}
+            if status not in (main.BILL_STATUSES['AWAITING_SPONSOR'], main.BILL_STATUSES['PENDING']):
+                for voter in voters:
+                    votes[self.rng.choices(['yes', 'no', 'abstain'], [6, 3, 1])[0]].append(voter)
+            sponsor_id, _ = self.citizen()
+            title_words = ' '.join(self.rng.choice(BILL_WORDS).title() for _ in range(2))
+            bill = {
+                'id': bill_id,
+                'title': f"R.C. {n + 1:03d} - The {title_words} Act",
+                'category': self.rng.choice(categories),
+                'text': "By the authority of the Royal Council, be it known that...\n\n"
+                        + ' '.join(self.rng.choice(BILL_WORDS) for _ in range(self.rng.randint(40, 400))),
+                'proposerId': sponsor_id,
+                'proposerTag': f"<@{sponsor_id}>",
+                'sponsorId': sponsor_id,
+                'sponsorTag': f"<@{sponsor_id}>",
+                'status': status,
+                'billType': 'STANDARD',
+                'visibility': 'PUBLIC',
+                'votingThreshold': 'SIMPLE_MAJORITY',
+                'requiredCoSponsors': main.REQUIRED_CO_SPONSORS_DEFAULT,
+                'coSponsors': [],
+                'votes': votes,
+                'billNumber': n + 1,
+                'createdAt': self.past().replace(tzinfo=None),  # Bills store naive datetime.now()
+                'channelId': 0,
+                'guildId': 0,
+            }
+            self.bill_ids.append(bill_id)
+            self.put(main.BILL_COLLECTION_NAME, bill_id, bill)  # Bills are keyed by public ID
+        self.put(main.BILL_COUNTER_COLLECTION, 'counter', {'lastNumber': bill_total})
+
+    # ---------- betting ----------
+    def gen_betting(self):
+        events = []
+        for n in range(self.volume(main.BETTING_EVENTS_COLLECTION)):
+            event_id = self.doc_id('EVT', n)
+            contestants = self.rng.sample(['Red', 'Blue', 'Green', 'Gold', 'Iron', 'Wizards'], self.rng.randint(2, 4))
+            is_open = n % 4 == 0
+            events.append({'id': event_id, 'contestants': contestants, 'open': is_open,
+                           'pool': 0.0, 'per': {c: 0.0 for c in contestants}, 'bets': 0})
+            if is_open:
+                self.open_event_ids.append(event_id)
+
+        leaderboard = {}
+        for n in range(self.volume(main.BETTING_BETS_COLLECTION)):
+            event = self.rng.choice(events)
+            uid, ign = self.citizen()
+            contestant = self.rng.choice(event['contestants'])
+            amount = float(self.rng.randint(1, 200))
+            event['pool'] += amount
+            event['per'][contestant] += amount
+            event['bets'] += 1
+            status = 'pending' if event['open'] else self.rng.choice(['won', 'lost'])
+            payout = amount * 1.8 if status == 'won' else 0.0
+            self.put(main.BETTING_BETS_COLLECTION, self.doc_id('BET', n), {
+                'eventId': event['id'], 'userId': uid, 'userTag': f"<@{uid}>", 'userName': ign.lower(),
+                'contestant': contestant, 'amount': amount, 'placedAt': self.past(),
+                'status': status, 'paymentStatus': 'paid' if status == 'won' else 'unpaid',
+                'payout': payout, 'threadId': 0,
+            })
+            if status != 'pending':
+                stats = leaderboard.setdefault(uid, {'userId': uid, 'totalBets': 0, 'wins': 0, 'losses': 0,
+                                                     'totalWagered': 0.0, 'totalWon': 0.0, 'totalLost': 0.0,
+                                                     'biggestWin': 0.0, 'biggestLoss': 0.0})
+                stats['totalBets'] += 1
+                stats['totalWagered'] += amount
+                if status == 'won':
+                    stats['wins'] += 1
+                    stats['totalWon'] += payout
+                    stats['biggestWin'] = max(stats['biggestWin'], payout)
+                else:
+                    stats['losses'] += 1
+                    stats['totalLost'] += amount
+                    stats['biggestLoss'] = max(stats['biggestLoss'], amount)
+
+        for event in events:
+            self.put(main.BETTING_EVENTS_COLLECTION, event['id'], {
+                'title': f"{' vs '.join(event['contestants'])} Showdown",
+                'eventType': 'match',
+                'status': 'open' if event['open'] else 'settled',
+                'contestants': event['contestants'],
+                'closesAt': self.future(14) if event['open'] else self.past(),
+                'createdAt': self.past(),
+                'createdBy': 0,
+                'totalPool': event['pool'],
+                'betsPerContestant': event['per'],
+                'totalBets': event['bets'],
+                'winner': None if event['open'] else self.rng.choice(event['contestants']),
+                'messageId': 0,
+            })
+            for snap in range(3):
+                self.put(main.BETTING_ODDS_HISTORY_COLLECTION, f"{event['id']}-{snap}", {
+                    'eventId': event['id'], 'capturedAt': self.past(), 'totalPool': event['pool'],
+                    'totalBets': event['bets'], 'betsPerContestant': event['per'],
+                    'multipliers': {c: round(event['pool'] / v, 2) if v else 0.0 for c, v in event['per'].items()},
+                })
+
+        for uid, stats in leaderboard.items():
+            stats['netProfit'] = stats['totalWon'] - stats['totalLost']
+            stats['winRate'] = stats['wins'] / stats['totalBets'] * 100
+            self.put(main.BETTING_LEADERBOARD_COLLECTION, str(uid), stats)
+
+        for day in range(min(self.history.days, 365)):
+            date = (self.now - timedelta(days=day)).strftime('%Y-%m-%d')
+            self.put(main.BETTING_DAILY_VOLUME_COLLECTION, date, {
+                'date': date, 'betCount': self.rng.randint(0, 40),
+                'totalVolume': float(self.rng.randint(0, 3000)), 'updatedAt': self.now,
+            })
+
+    # ---------- economy ----------
+    def gen_banking(self):
+        accounts = self.rng.sample(range(self.citizens), max(1, round(self.citizens * BANK_ACCOUNT_SHARE)))
+        for n, i in enumerate(sorted(accounts)):
+            uid = self.user_ids[i]
+            balances = {field: float(self.rng.randint(0, 2000)) for field in BALANCE_FIELDS}
+            self.account_numbers[uid] = f"FL-{10000 + n}"
+            self.put(main.BANK_ACCOUNTS_COLLECTION, self.doc_id('ACC', n), {
+                'userId': uid,
+                'accountNumber': self.account_numbers[uid],
+                **balances,
+                'balance': balances['diamondBalance'],
+                'createdAt': self.past(),
+            })
+
+        account_holders = list(self.account_numbers)
+        for n in range(self.volume(main.BANK_TRANSACTIONS_COLLECTION)):
+            uid = self.rng.choice(account_holders)
+            amount = float(self.rng.randint(1, 500))
+            before = float(self.rng.randint(0, 2000))
+            kind = self.rng.choice(['deposit', 'withdrawal', 'transfer_in', 'transfer_out', 'commodity_exchange'])
+            after = before + amount if kind in ('deposit', 'transfer_in') else max(0.0, before - amount)
+            self.put(main.BANK_TRANSACTIONS_COLLECTION, self.doc_id('TX', n), {
+                'userId': uid, 'userTag': f"<@{uid}>", 'accountNumber': self.account_numbers[uid],
+                'type': kind, 'amount': amount, 'commodity': self.rng.choice(COMMODITIES),
+                'balanceBefore': before, 'balanceAfter': after, 'memo': '',
+                'processedBy': 0, 'timestamp': self.past(),
+            })
+
+        for commodity in COMMODITIES:
+            price = 1.0 if commodity == 'diamond' else round(self.rng.uniform(0.05, 9.0), 3)
+            self.put(main.MARKET_PRICES_COLLECTION, commodity, {
+                'price': price, 'rate': price, 'unit': 'd', 'supply': self.rng.randint(100, 10000),
+                'demand': self.rng.randint(100, 10000), 'buyRate': price * 1.02, 'sellRate': price * 0.98,
+                'spreadPercent': 2.0, 'lastUpdated': self.past(timedelta(days=1)),
+            })
+
+        for resource in main.TREASURY_RESOURCES.values():
+            self.put(main.TREASURY_COLLECTION, resource, {'amount': self.rng.randint(0, 50000), 'lastUpdated': self.now})
+        for n in range(self.citizens // 10):
+            resource = self.rng.choice(list(main.TREASURY_RESOURCES.values()))
+            amount = self.rng.randint(1, 500)
+            previous = self.rng.randint(0, 50000)
+            action = self.rng.choice(['deposit', 'withdraw'])
+            self.put(main.TREASURY_LOG_COLLECTION, self.doc_id('TL', n), {
+                'resource': resource, 'action': action, 'amount': amount, 'previousBalance': previous,
+                'newBalance': previous + amount if action == 'deposit' else previous - amount,
+                'userId': 0, 'userTag': 'treasurer', 'notes': '', 'timestamp': self.past(),
+            })
+
+        for n in range(self.citizens // 20):
+            uid, ign = self.citizen()
+            principal = float(self.rng.randint(50, 2000))
+            rate = self.rng.choice([0.03, 0.05, 0.08])
+            purchased = self.past()
+            days = self.rng.choice([30, 90, 180])
+            self.put(main.TREASURY_BONDS_COLLECTION, self.doc_id('BOND', n), {
+                'bondId': self.doc_id('BOND', n), 'userId': uid, 'userName': ign.lower(), 'userTag': f"<@{uid}>",
+                'principal': principal, 'interestRate': rate, 'interestAmount': principal * rate,
+                'maturityAmount': principal * (1 + rate), 'durationDays': days, 'purchaseDate': purchased,
+                'maturityDate': purchased + timedelta(days=days), 'jurisdiction': 'STATE',
+                'status': 'active' if purchased + timedelta(days=days) > self.now else 'redeemed',
+            })
+        for n in range(self.citizens // 25):
+            uid, ign = self.citizen()
+            self.put(main.ESSENCE_CERTIFICATES_COLLECTION, self.doc_id('CERT', n), {
+                'certificateId': self.doc_id('CERT', n), 'essenceAmount': self.rng.choice([64, 128, 256]),
+                'issuerId': 0, 'issuerName': 'Treasury', 'issuerTag': 'treasury', 'currentOwnerId': uid,
+                'currentOwnerTag': f"<@{uid}>", 'jurisdiction': 'STATE', 'issuedAt': self.past(),
+                'status': self.rng.choices(['active', 'redeemed'], [3, 1])[0],
+            })
+        for n in range(24):
+            self.put(main.ECONOMIC_CYCLES_COLLECTION, self.doc_id('CYC', n), {
+                'state': self.rng.choice(['boom', 'stable', 'bust']), 'multiplier': round(self.rng.uniform(0.8, 1.3), 2),
+                'description': '', 'setBy': 0, 'setByName': 'economy', 'timestamp': self.past(),
+            })
+
+    def gen_stocks(self):
+        for n in range(self.volume(main.BUSINESSES_COLLECTION)):
+            owner_id, ign = self.citizen()
+            business_id = self.doc_id('BIZ', n)
+            name = f"{ign} {self.rng.choice(SECTORS)} Co."
+            price = round(self.rng.uniform(1, 50), 2)
+            total_shares = self.rng.choice([100, 500, 1000])
+            self.business_ids.append((business_id, name))
+            self.put(main.BUSINESSES_COLLECTION, business_id, {
+                'businessId': business_id, 'name': name, 'businessName': name, 'ownerId': owner_id,
+                'ownerName': ign, 'ownerTag': f"<@{owner_id}>", 'sector': self.rng.choice(SECTORS),
+                'description': '', 'sharePrice': price, 'pricePerShare': price, 'totalShares': total_shares,
+                'outstandingShares': total_shares // 2, 'marketCap': price * total_shares,
+                'founded': self.past(), 'createdAt': self.past(), 'status': 'active',
+            })
+            self.put(main.IPOS_COLLECTION, f"IPO-{business_id}", {
+                'businessId': business_id, 'businessName': name, 'pricePerShare': price,
+                'sharesOffered': total_shares // 2, 'sharesRemaining': self.rng.randint(0, total_shares // 2),
+                'totalRaised': 0.0, 'status': self.rng.choice(['active', 'closed']), 'jurisdiction': 'STATE',
+                'createdAt': self.past(), 'createdBy': owner_id, 'launchedAt': self.past(), 'launchedBy': 0,
+            })
+            self.put(main.SHARES_COLLECTION, f"{business_id}-treasury", {
+                'businessId': business_id, 'businessName': name, 'ownerId': 0, 'ownerName': 'Treasury',
+                'shares': total_shares // 10, 'acquiredAt': self.past(),
+            })
+
+        for n in range(self.volume(main.STOCK_TRANSACTIONS_COLLECTION)):
+            business_id, name = self.rng.choice(self.business_ids)
+            buyer_id, buyer_ign = self.citizen()
+            shares = self.rng.randint(1, 50)
+            price = round(self.rng.uniform(1, 50), 2)
+            self.put(main.STOCK_TRANSACTIONS_COLLECTION, self.doc_id('STX', n), {
+                'businessId': business_id, 'businessName': name, 'buyerId': buyer_id, 'buyerTag': f"<@{buyer_id}>",
+                'sellerId': 0, 'shares': shares, 'pricePerShare': price, 'totalAmount': shares * price,
+                'type': self.rng.choice(['ipo_purchase', 'secondary_sale']), 'paymentMethod': 'bank',
+                'timestamp': self.past(),
+            })
+            if n % 3 == 0:
+                self.put(main.SHARES_COLLECTION, self.doc_id('SH', n), {
+                    'businessId': business_id, 'businessName': name, 'ownerId': buyer_id, 'ownerName': buyer_ign,
+                    'ownerTag': f"<@{buyer_id}>", 'shares': shares, 'acquiredAt': self.past(),
+                })
+            if n % 10 == 0:
+                self.put(main.STOCK_ORDERS_COLLECTION, self.doc_id('ORD', n), {
+                    'businessId': business_id, 'businessName': name, 'buyerId': buyer_id, 'buyerName': buyer_ign,
+                    'buyerTag': f"<@{buyer_id}>", 'shares': shares, 'pricePerShare': price, 'totalCost': shares * price,
+                    'orderType': 'ipo', 'orderStatus': self.rng.choice(['pending', 'completed']),
+                    'paymentMethod': 'bank', 'paymentStatus': 'unpaid', 'createdAt': self.past(),
+                })
+            if n % 25 == 0:
+                self.put(main.DIVIDENDS_COLLECTION, self.doc_id('DIV', n), {
+                    'businessId': business_id, 'businessName': name, 'recipientId': buyer_id,
+                    'recipientTag': f"<@{buyer_id}>", 'shares': shares, 'amountPerShare': 0.5,
+                    'totalPayout': shares * 0.5, 'paidAt': self.past(), 'paidBy': 0,
+                })
+
+    def gen_property(self):
+        for n in range(self.volume(main.PROPERTIES_COLLECTION)):
+            owner_id, ign = self.citizen()
+            property_id = self.doc_id('PROP', n)
+            x, y, z = self.rng.randint(-10000, 10000), self.rng.randint(40, 120), self.rng.randint(-10000, 10000)
+            value = float(self.rng.randint(50, 5000))
+            self.put(main.PROPERTIES_COLLECTION, property_id, {
+                'propertyId': property_id, 'name': f"{ign}'s plot", 'ownerId': owner_id, 'ownerName': ign,
+                'coordinates': f"{x}, {y}, {z}", 'x': x, 'y': y, 'z': z,
+                'propertyType': self.rng.choice(['residential', 'commercial', 'farm']), 'value': value,
+            })
+            self.put(main.PROPERTY_VALUES_COLLECTION, f"{property_id}-v0", {
+                'propertyId': property_id, 'value': value, 'changeReason': 'appraisal',
+                'marketCondition': 'stable', 'timestamp': self.past(),
+            })
+            if n % 8 == 0:
+                self.put(main.PROPERTY_LISTINGS_COLLECTION, f"L-{property_id}", {
+                    'propertyId': property_id, 'propertyName': f"{ign}'s plot", 'propertyType': 'residential',
+                    'price': value * 1.1, 'sellerId': owner_id, 'sellerName': ign, 'coordinates': f"{x}, {y}, {z}",
+                    'description': '', 'jurisdiction': 'STATE', 'status': 'active', 'listedAt': self.past(),
+                })
+            if n % 12 == 0:
+                loan = value * 0.8
+                self.put(main.MORTGAGES_COLLECTION, f"M-{property_id}", {
+                    'mortgageId': f"M-{property_id}", 'propertyId': property_id, 'borrowerId': owner_id,
+                    'borrowerName': ign, 'lenderId': 0, 'lenderName': 'State Bank', 'propertyPrice': value,
+                    'downPayment': value - loan, 'loanAmount': loan, 'interestRate': 0.05, 'termMonths': 12,
+                    'monthlyPayment': loan / 12 * 1.05, 'remainingBalance': loan / 2, 'totalPaid': loan / 2,
+                    'jurisdiction': 'STATE', 'status': 'active', 'createdAt': self.past(),
+                    'nextPaymentDue': self.future(30),
+                })
+            if n % 6 == 0:
+                self.put(main.PROPERTY_IMPROVEMENTS_COLLECTION, f"I-{property_id}", {
+                    'propertyId': property_id, 'ownerId': owner_id, 'improvementType': 'farm',
+                    'cost': 100.0, 'valueAdded': 150.0, 'timestamp': self.past(),
+                })
+
+        for n in range(self.volume(main.CONTRACTS_COLLECTION)):
+            contract_id = self.doc_id('CON', n)
+            status = self.rng.choice(['open', 'awarded', 'completed'])
+            self.put(main.CONTRACTS_COLLECTION, contract_id, {
+                'contractId': contract_id, 'projectName': f"{self.rng.choice(BILL_WORDS).title()} works",
+                'description': '', 'budget': float(self.rng.randint(500, 20000)), 'deadline': self.future(60),
+                'status': status, 'createdBy': 0, 'createdAt': self.past(), 'bids': [], 'awardedTo': None,
+            })
+            for b in range(self.rng.randint(0, 4)):
+                bidder_id, bidder_ign = self.citizen()
+                self.put(main.CONTRACT_BIDS_COLLECTION, f"{contract_id}-B{b}", {
+                    'bidId': f"{contract_id}-B{b}", 'contractId': contract_id, 'bidderId': bidder_id,
+                    'bidderName': bidder_ign, 'bidAmount': float(self.rng.randint(400, 20000)),
+                    'completionDays': self.rng.randint(7, 60), 'proposal': '', 'status': 'pending',
+                    'submittedAt': self.past(),
+                })
+        for month in range(max(1, self.history.days // 30)):
+            self.put(main.ECONOMIC_REPORTS_COLLECTION, f"report-{month:03d}", {
+                'period': (self.now - timedelta(days=30 * month)).strftime('%Y-%m'),
+                'totalDeposits': float(self.rng.randint(1000, 90000)), 'activeAccounts': len(self.account_numbers),
+                'generatedAt': self.now - timedelta(days=30 * month),
+            })
+
+    def generate(self) -> 'Population':
+        self.gen_citizens()
+        self.gen_snitch_logs()
+        self.gen_justice()
+        self.gen_bills()
+        self.gen_betting()
+        self.gen_banking()
+        self.gen_stocks()
+        self.gen_property()
+        self.writer.flush()
+        return self
+
+
+def populate(store, citizens: int = 2000, seed: int = 1, years: float = 2.0) -> Population:
+    """Generate a population into store; returns the Population with its handles and per-collection counts"""
+    return Population(store, citizens, seed, years).generate()